@@ -0,0 +1,196 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Set, Tuple
+
+from py2puml.domain.domainmodel import DomainModel, get_item_module_name
+from py2puml.domain.umlfunction import UmlModule
+from py2puml.domain.umlrelation import RelType, UmlRelation
+
+# suffix of the fully-qualified name of the box documenting the functions of a module
+MODULE_FUNCTIONS_SUFFIX = '.Methods'
+
+
+@dataclass
+class DependencyCycle:
+    """A strongly-connected component of a dependency graph: each node depends transitively on the other ones"""
+
+    nodes: List[str]
+    edges: List[Tuple[str, str]]
+
+
+def dependency_edge(uml_relation: UmlRelation) -> Tuple[str, str]:
+    """
+    Returns the (dependent, dependency) edge of the relation.
+    Inheritance relations are stored from the parent class to the child class, the child depends on its parent.
+    """
+    if uml_relation.type == RelType.INHERITANCE:
+        return uml_relation.target_fqn, uml_relation.source_fqn
+    return uml_relation.source_fqn, uml_relation.target_fqn
+
+
+def build_adjacency(edges: Iterable[Tuple[str, str]]) -> Tuple[List[str], List[List[int]]]:
+    """
+    Indexes the nodes of the deduplicated edges and returns:
+    - the names of the nodes
+    - the successors of each node, by node index
+    """
+    node_indices: Dict[str, int] = {}
+    successors: List[List[int]] = []
+    unique_edges: Set[Tuple[int, int]] = set()
+    for source, target in edges:
+        for node in (source, target):
+            if node not in node_indices:
+                node_indices[node] = len(successors)
+                successors.append([])
+        edge = node_indices[source], node_indices[target]
+        if edge not in unique_edges:
+            unique_edges.add(edge)
+            successors[edge[0]].append(edge[1])
+
+    return list(node_indices.keys()), successors
+
+
+def strongly_connected_components(successors: List[List[int]]) -> List[List[int]]:
+    """
+    Iterative version of Tarjan's algorithm (linear in the number of nodes and edges, without recursion limit).
+    Returns the strongly-connected components as lists of node indices.
+    """
+    nodes_number = len(successors)
+    visit_indices: List[int] = [-1] * nodes_number
+    low_links: List[int] = [0] * nodes_number
+    on_stack: List[bool] = [False] * nodes_number
+    component_stack: List[int] = []
+    components: List[List[int]] = []
+    visit_counter = 0
+
+    for start_node in range(nodes_number):
+        if visit_indices[start_node] != -1:
+            continue
+
+        # each frame of the call stack is a node and the position of the next successor to visit
+        call_stack: List[Tuple[int, int]] = [(start_node, 0)]
+        visit_indices[start_node] = low_links[start_node] = visit_counter
+        visit_counter += 1
+        component_stack.append(start_node)
+        on_stack[start_node] = True
+
+        while call_stack:
+            node, successor_position = call_stack[-1]
+            node_successors = successors[node]
+            if successor_position < len(node_successors):
+                call_stack[-1] = (node, successor_position + 1)
+                successor = node_successors[successor_position]
+                if visit_indices[successor] == -1:
+                    visit_indices[successor] = low_links[successor] = visit_counter
+                    visit_counter += 1
+                    component_stack.append(successor)
+                    on_stack[successor] = True
+                    call_stack.append((successor, 0))
+                elif on_stack[successor] and visit_indices[successor] < low_links[node]:
+                    low_links[node] = visit_indices[successor]
+                continue
+
+            # all the successors of the node were visited
+            call_stack.pop()
+            if call_stack:
+                parent_node = call_stack[-1][0]
+                if low_links[node] < low_links[parent_node]:
+                    low_links[parent_node] = low_links[node]
+
+            if low_links[node] == visit_indices[node]:
+                component: List[int] = []
+                while True:
+                    component_node = component_stack.pop()
+                    on_stack[component_node] = False
+                    component.append(component_node)
+                    if component_node == node:
+                        break
+                components.append(component)
+
+    return components
+
+
+def find_cycles(edges: Iterable[Tuple[str, str]]) -> List[DependencyCycle]:
+    """
+    Returns the dependency cycles of the graph: its strongly-connected components involving several nodes
+    or a node depending on itself
+    """
+    node_names, successors = build_adjacency(edges)
+    cycles: List[DependencyCycle] = []
+    for component in strongly_connected_components(successors):
+        component_nodes = set(component)
+        if len(component) == 1 and component[0] not in successors[component[0]]:
+            continue
+        # components are popped from the stack: the nodes are reversed to follow the discovery order
+        component.reverse()
+        cycles.append(
+            DependencyCycle(
+                [node_names[node] for node in component],
+                [
+                    (node_names[node], node_names[successor])
+                    for node in component
+                    for successor in successors[node]
+                    if successor in component_nodes
+                ],
+            )
+        )
+
+    return cycles
+
+
+def get_node_module_name(node_fqn: str, domain_model: DomainModel) -> str:
+    uml_item = domain_model.items_by_fqn.get(node_fqn)
+    if uml_item is not None:
+        return get_item_module_name(uml_item)
+    if node_fqn.endswith(MODULE_FUNCTIONS_SUFFIX):
+        return node_fqn[: -len(MODULE_FUNCTIONS_SUFFIX)]
+    return node_fqn.rpartition('.')[0]
+
+
+def find_class_cycles(domain_model: DomainModel) -> List[DependencyCycle]:
+    return find_cycles(dependency_edge(uml_relation) for uml_relation in domain_model.relations)
+
+
+def find_module_cycles(domain_model: DomainModel) -> List[DependencyCycle]:
+    """Returns the cycles between modules, the dependencies between definitions of the same module being ignored"""
+    module_names_by_fqn: Dict[str, str] = {}
+
+    def module_name_of(node_fqn: str) -> str:
+        if node_fqn not in module_names_by_fqn:
+            module_names_by_fqn[node_fqn] = get_node_module_name(node_fqn, domain_model)
+        return module_names_by_fqn[node_fqn]
+
+    module_edges = (
+        (module_name_of(source), module_name_of(target))
+        for source, target in map(dependency_edge, domain_model.relations)
+    )
+    return find_cycles((source, target) for source, target in module_edges if source != target)
+
+
+def cycle_domain_model(domain_model: DomainModel, cycle: DependencyCycle, name: str) -> DomainModel:
+    """Returns the model of the definitions involved in a cycle between definitions, with the relations of the cycle"""
+    cycle_nodes = set(cycle.nodes)
+    modules_by_name: Dict[str, UmlModule] = {
+        module_name: domain_model.modules_by_name[module_name]
+        for module_name in (
+            node[: -len(MODULE_FUNCTIONS_SUFFIX)] for node in cycle.nodes if node.endswith(MODULE_FUNCTIONS_SUFFIX)
+        )
+        if module_name in domain_model.modules_by_name
+    }
+    return DomainModel(
+        name,
+        {fqn: uml_item for fqn, uml_item in domain_model.items_by_fqn.items() if fqn in cycle_nodes},
+        [
+            uml_relation
+            for uml_relation in domain_model.relations
+            if uml_relation.source_fqn in cycle_nodes and uml_relation.target_fqn in cycle_nodes
+        ],
+        modules_by_name,
+    )
+
+
+def format_cycles_report(cycles_kind: str, cycles: List[DependencyCycle]) -> Iterable[str]:
+    yield f'{len(cycles)} {cycles_kind} cycle(s)\n'
+    for cycle_index, cycle in enumerate(cycles, start=1):
+        yield f'{cycles_kind} cycle {cycle_index} ({len(cycle.nodes)} nodes, {len(cycle.edges)} edges):\n'
+        for source, target in cycle.edges:
+            yield f'  {source} -> {target}\n'
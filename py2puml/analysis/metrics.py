@@ -0,0 +1,171 @@
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from py2puml.analysis.cycles import MODULE_FUNCTIONS_SUFFIX, dependency_edge
+from py2puml.analysis.summary import package_resolver
+from py2puml.domain.domainmodel import DomainModel
+from py2puml.domain.metrics import ClassMetrics, DomainMetrics, PackageMetrics
+from py2puml.domain.umlfunction import UmlFunction
+from py2puml.domain.umlrelation import RelType
+
+try:
+    import numpy
+except ImportError:
+    # the couplings are counted in pure Python without NumPy
+    numpy = None
+
+# markers of the nodes whose depth of inheritance is not computed yet
+UNKNOWN_DEPTH, VISITED_DEPTH = -1, -2
+
+# the fan-in, fan-out of each node and the afferent, efferent couplings of each package
+Couplings = Tuple[List[int], List[int], List[int], List[int]]
+
+
+def count_couplings(
+    sources: Sequence[int], targets: Sequence[int], node_packages: Sequence[int], packages_count: int
+) -> Couplings:
+    """
+    Counts the couplings of the nodes and of the packages from the deduplicated dependency edges (sources[i] depends on
+    targets[i]), in pure Python
+    """
+    fan_ins, fan_outs = [0] * len(node_packages), [0] * len(node_packages)
+    afferent_pairs: Set[Tuple[int, int]] = set()
+    efferent_nodes: Set[int] = set()
+    for source, target in zip(sources, targets):
+        fan_outs[source] += 1
+        fan_ins[target] += 1
+        if node_packages[source] != node_packages[target]:
+            afferent_pairs.add((source, node_packages[target]))
+            efferent_nodes.add(source)
+
+    afferent_couplings, efferent_couplings = [0] * packages_count, [0] * packages_count
+    for _, target_package in afferent_pairs:
+        afferent_couplings[target_package] += 1
+    for source in efferent_nodes:
+        efferent_couplings[node_packages[source]] += 1
+
+    return fan_ins, fan_outs, afferent_couplings, efferent_couplings
+
+
+def count_couplings_with_numpy(
+    sources: Sequence[int], targets: Sequence[int], node_packages: Sequence[int], packages_count: int
+) -> Couplings:
+    """Counts the couplings like count_couplings, with vectorised operations on the arrays of the edges"""
+    nodes_count = len(node_packages)
+    source_nodes = numpy.asarray(sources, dtype=numpy.int64)
+    target_nodes = numpy.asarray(targets, dtype=numpy.int64)
+    packages = numpy.asarray(node_packages, dtype=numpy.int64)
+    fan_ins = numpy.bincount(target_nodes, minlength=nodes_count)
+    fan_outs = numpy.bincount(source_nodes, minlength=nodes_count)
+
+    target_packages = packages[target_nodes]
+    crossing = packages[source_nodes] != target_packages
+    crossing_sources = source_nodes[crossing]
+    # the (source node, target package) pairs are encoded as integers to be deduplicated
+    afferent_pairs = numpy.unique(crossing_sources * packages_count + target_packages[crossing])
+    afferent_couplings = numpy.bincount(afferent_pairs % packages_count, minlength=packages_count)
+    efferent_couplings = numpy.bincount(packages[numpy.unique(crossing_sources)], minlength=packages_count)
+
+    return fan_ins.tolist(), fan_outs.tolist(), afferent_couplings.tolist(), efferent_couplings.tolist()
+
+
+def compute_depths_of_inheritance(parents_by_node: List[List[int]]) -> List[int]:
+    """Returns the length of the longest path towards a root class for each node, given the parents of the nodes"""
+    depths: List[int] = [UNKNOWN_DEPTH] * len(parents_by_node)
+    for start_node in range(len(parents_by_node)):
+        # iterative depth-first traversal: the depth of a node is computed once the ones of its parents are known
+        stack: List[int] = [start_node]
+        while stack:
+            node = stack[-1]
+            if depths[node] == UNKNOWN_DEPTH:
+                depths[node] = VISITED_DEPTH
+                stack.extend(parent for parent in parents_by_node[node] if depths[parent] == UNKNOWN_DEPTH)
+                continue
+            stack.pop()
+            if depths[node] == VISITED_DEPTH:
+                depths[node] = max(
+                    (depths[parent] + 1 for parent in parents_by_node[node] if depths[parent] >= 0), default=0
+                )
+
+    return depths
+
+
+def instability(afferent: int, efferent: int) -> float:
+    return efferent / (afferent + efferent) if afferent + efferent > 0 else 0.0
+
+
+def compute_metrics(
+    domain_model: DomainModel, root_module_names: Sequence[str], depth: Optional[int] = None, vectorized: bool = True
+) -> DomainMetrics:
+    """
+    Computes the coupling metrics of the definitions and of the packages of the domain (its modules, or its packages at
+    the given depth below their root) from the relations of the model: the dependency edges are indexed once in
+    arrays, whose couplings are counted in one pass, vectorised with NumPy when it is available and vectorized is True.
+    The relations towards nodes outside of the roots are ignored.
+    """
+    package_of = package_resolver(domain_model, root_module_names, depth)
+    node_indices: Dict[str, int] = {}
+    package_indices: Dict[str, int] = {}
+    node_packages: List[int] = []
+
+    def index_node(node_fqn: str) -> Optional[int]:
+        if node_fqn not in node_indices:
+            package_name = package_of(node_fqn)
+            if package_name is None:
+                return None
+            node_indices[node_fqn] = len(node_packages)
+            node_packages.append(package_indices.setdefault(package_name, len(package_indices)))
+        return node_indices[node_fqn]
+
+    # the module functions are the nodes of the relations through their '<module>.Methods' box
+    for fqn, uml_item in domain_model.items_by_fqn.items():
+        index_node(f'{uml_item.module}{MODULE_FUNCTIONS_SUFFIX}' if isinstance(uml_item, UmlFunction) else fqn)
+
+    edges: Set[Tuple[int, int]] = set()
+    inheritances: List[Tuple[int, int]] = []
+    for uml_relation in domain_model.relations:
+        source, target = (index_node(node_fqn) for node_fqn in dependency_edge(uml_relation))
+        if source is None or target is None or source == target:
+            continue
+        edges.add((source, target))
+        if uml_relation.type == RelType.INHERITANCE:
+            inheritances.append((source, target))
+
+    parents_by_node: List[List[int]] = [[] for _ in node_packages]
+    for child, parent in inheritances:
+        parents_by_node[child].append(parent)
+    sources, targets = [source for source, _ in edges], [target for _, target in edges]
+    counter = count_couplings_with_numpy if vectorized and numpy is not None else count_couplings
+    fan_ins, fan_outs, afferent_couplings, efferent_couplings = counter(
+        sources, targets, node_packages, len(package_indices)
+    )
+    depths_of_inheritance = compute_depths_of_inheritance(parents_by_node)
+
+    definitions_counts = [0] * len(package_indices)
+    for fqn in domain_model.items_by_fqn:
+        package_name = package_of(fqn)
+        if package_name is not None:
+            definitions_counts[package_indices[package_name]] += 1
+
+    return DomainMetrics(
+        domain_model.name,
+        [
+            ClassMetrics(
+                node_fqn,
+                fan_ins[node],
+                fan_outs[node],
+                instability(fan_ins[node], fan_outs[node]),
+                depths_of_inheritance[node],
+            )
+            for node_fqn, node in node_indices.items()
+        ],
+        [
+            PackageMetrics(
+                package_name,
+                definitions_counts[package],
+                afferent_couplings[package],
+                efferent_couplings[package],
+                instability(afferent_couplings[package], efferent_couplings[package]),
+            )
+            for package_name, package in package_indices.items()
+        ],
+    )
@@ -0,0 +1,84 @@
+from typing import Collection, Iterable, List, Set, Tuple
+
+from py2puml.analysis.cycles import build_adjacency, strongly_connected_components
+from py2puml.domain.domainmodel import DomainModel
+from py2puml.domain.umlrelation import RelType, UmlRelation
+
+# the relations whose transitive edges are redundant: the compositions document attributes, they are all kept
+REDUCED_RELATION_TYPES: Tuple[RelType, ...] = (RelType.INHERITANCE, RelType.DEPENDENCY)
+
+
+def find_redundant_edges(edges: Iterable[Tuple[str, str]]) -> Set[Tuple[str, str]]:
+    """
+    Returns the edges implied by longer paths of the graph (transitive reduction).
+    The strongly-connected components are condensed into the nodes of a DAG, which is reduced in the reverse
+    topological order produced by Tarjan's algorithm: the components reachable from each component are stored as the
+    bits of an integer, an edge between two components is redundant if its target is reachable from another successor.
+    The edges within a cycle are all kept.
+    """
+    node_names, successors = build_adjacency(edges)
+    components = strongly_connected_components(successors)
+    component_indices: List[int] = [0] * len(node_names)
+    for component_index, component in enumerate(components):
+        for node in component:
+            component_indices[node] = component_index
+
+    # the components are produced after the components they lead to: their reachable components are already known
+    reachable_components: List[int] = [0] * len(components)
+    redundant_edges: Set[Tuple[str, str]] = set()
+    for component_index, component in enumerate(components):
+        successor_components = {
+            component_indices[successor]
+            for node in component
+            for successor in successors[node]
+            if component_indices[successor] != component_index
+        }
+        transitively_reachable = 0
+        for successor_component in successor_components:
+            transitively_reachable |= reachable_components[successor_component]
+        for node in component:
+            for successor in successors[node]:
+                if (transitively_reachable >> component_indices[successor]) & 1:
+                    redundant_edges.add((node_names[node], node_names[successor]))
+
+        for successor_component in successor_components:
+            transitively_reachable |= 1 << successor_component
+        reachable_components[component_index] = transitively_reachable
+
+    return redundant_edges
+
+
+def reduce_relations(
+    uml_relations: Iterable[UmlRelation], relation_types: Collection[RelType] = REDUCED_RELATION_TYPES
+) -> List[UmlRelation]:
+    """
+    Removes the relations implied by longer paths of relations of the same type, for the given relation types.
+    The order of the kept relations is preserved.
+    """
+    uml_relations = list(uml_relations)
+    redundant_edges_by_type = {
+        relation_type: find_redundant_edges(
+            (uml_relation.source_fqn, uml_relation.target_fqn)
+            for uml_relation in uml_relations
+            if uml_relation.type == relation_type
+        )
+        for relation_type in relation_types
+    }
+
+    return [
+        uml_relation
+        for uml_relation in uml_relations
+        if (uml_relation.source_fqn, uml_relation.target_fqn) not in redundant_edges_by_type.get(uml_relation.type, ())
+    ]
+
+
+def transitively_reduced(domain_model: DomainModel) -> DomainModel:
+    """Returns the model without the inheritance and dependency relations implied by longer paths of relations"""
+    return DomainModel(
+        domain_model.name,
+        domain_model.items_by_fqn,
+        reduce_relations(domain_model.relations),
+        domain_model.modules_by_name,
+        domain_model.diagnostics,
+        domain_model.incomplete_fqns,
+    )
@@ -0,0 +1,167 @@
+import sys
+from contextlib import suppress
+from fnmatch import translate
+from inspect import getsourcelines
+from re import compile as re_compile
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from py2puml.analysis.cycles import MODULE_FUNCTIONS_SUFFIX, dependency_edge, get_node_module_name
+from py2puml.domain.architecturerules import ForbiddenDependency, LayeredArchitecture, RuleViolation
+from py2puml.domain.domainmodel import DomainModel
+from py2puml.query import get_definition_line_number
+
+# the roles of a module: the forbidden dependencies it is the source of, the ones it is the target of, its layer in
+# each layered architecture
+ModuleRoles = Tuple[FrozenSet[int], FrozenSet[int], Tuple[Optional[int], ...]]
+
+
+class ModulePatterns:
+    """
+    Glob patterns compiled once, matched like the patterns of the domain filter (a module matches a pattern if it or
+    one of its parent packages does). The matches are memoised per package prefix: each package is matched once,
+    whatever the number of relations involving its modules.
+    """
+
+    def __init__(self, patterns: Sequence[str]):
+        self.pattern_regexes = [re_compile(translate(pattern)) for pattern in patterns]
+        self.matches_by_prefix: Dict[str, FrozenSet[int]] = {}
+        self.matches_by_module: Dict[str, FrozenSet[int]] = {}
+
+    def prefix_matches(self, prefix: str) -> FrozenSet[int]:
+        if prefix not in self.matches_by_prefix:
+            self.matches_by_prefix[prefix] = frozenset(
+                pattern_index
+                for pattern_index, pattern_regex in enumerate(self.pattern_regexes)
+                if pattern_regex.match(prefix)
+            )
+        return self.matches_by_prefix[prefix]
+
+    def module_matches(self, module_name: str) -> FrozenSet[int]:
+        """The indices of the patterns matched by the module or by one of its parent packages"""
+        if module_name not in self.matches_by_module:
+            module_parts = module_name.split('.')
+            self.matches_by_module[module_name] = frozenset().union(
+                *(
+                    self.prefix_matches('.'.join(module_parts[:parts_number]))
+                    for parts_number in range(1, len(module_parts) + 1)
+                )
+            )
+        return self.matches_by_module[module_name]
+
+
+def locate_node(node_fqn: str, module_name: str) -> Tuple[Optional[str], Optional[int]]:
+    """Returns the source file of the node and the line of its definition, when its module was imported"""
+    module = sys.modules.get(module_name)
+    if module is None:
+        return None, None
+    definition = (
+        None if node_fqn.endswith(MODULE_FUNCTIONS_SUFFIX) else getattr(module, node_fqn.rpartition('.')[2], None)
+    )
+    line_number = None if definition is None else get_definition_line_number(definition)
+    if definition is not None and line_number is None:
+        with suppress(OSError, TypeError):
+            line_number = getsourcelines(definition)[1]
+
+    return getattr(module, '__file__', None), line_number
+
+
+def check_architecture(
+    domain_model: DomainModel,
+    forbidden_dependencies: Iterable[ForbiddenDependency] = (),
+    layered_architectures: Iterable[LayeredArchitecture] = (),
+) -> List[RuleViolation]:
+    """
+    Returns the relations of the domain breaking the rules: the dependencies (the inheritance being the dependency of
+    the child class on its parent) between modules which are forbidden, or from a layer towards an upper layer.
+    The relations within a module are not checked. All the patterns are compiled once, the roles of each module
+    (forbidden sources and targets, layers) are computed once from the matches of its package prefixes.
+    """
+    forbidden_dependencies = list(forbidden_dependencies)
+    layered_architectures = list(layered_architectures)
+    patterns: List[str] = [
+        pattern
+        for forbidden_dependency in forbidden_dependencies
+        for pattern in (forbidden_dependency.source_pattern, forbidden_dependency.target_pattern)
+    ]
+    layers_offsets: List[int] = []
+    for layered_architecture in layered_architectures:
+        layers_offsets.append(len(patterns))
+        patterns.extend(layered_architecture.layer_patterns)
+    module_patterns = ModulePatterns(patterns)
+
+    roles_by_module: Dict[str, ModuleRoles] = {}
+
+    def roles_of(module_name: str) -> ModuleRoles:
+        if module_name not in roles_by_module:
+            matches = module_patterns.module_matches(module_name)
+            roles_by_module[module_name] = (
+                frozenset(rule_index for rule_index in range(len(forbidden_dependencies)) if 2 * rule_index in matches),
+                frozenset(
+                    rule_index for rule_index in range(len(forbidden_dependencies)) if 2 * rule_index + 1 in matches
+                ),
+                tuple(
+                    # a module belongs to the first layer it matches
+                    next(
+                        (
+                            layer_index
+                            for layer_index in range(len(layered_architecture.layer_patterns))
+                            if layers_offset + layer_index in matches
+                        ),
+                        None,
+                    )
+                    for layered_architecture, layers_offset in zip(layered_architectures, layers_offsets)
+                ),
+            )
+        return roles_by_module[module_name]
+
+    module_names_by_node: Dict[str, str] = {}
+
+    def module_name_of(node_fqn: str) -> str:
+        if node_fqn not in module_names_by_node:
+            module_names_by_node[node_fqn] = get_node_module_name(node_fqn, domain_model)
+        return module_names_by_node[node_fqn]
+
+    violations: List[RuleViolation] = []
+    for uml_relation in domain_model.relations:
+        dependent_fqn, dependency_fqn = dependency_edge(uml_relation)
+        dependent_module, dependency_module = module_name_of(dependent_fqn), module_name_of(dependency_fqn)
+        if dependent_module == dependency_module:
+            continue
+        forbidden_sources, _, dependent_layers = roles_of(dependent_module)
+        _, forbidden_targets, dependency_layers = roles_of(dependency_module)
+        broken_rules: List[str] = [
+            str(forbidden_dependencies[rule_index]) for rule_index in sorted(forbidden_sources & forbidden_targets)
+        ]
+        for layered_architecture, dependent_layer, dependency_layer in zip(
+            layered_architectures, dependent_layers, dependency_layers
+        ):
+            if dependent_layer is not None and dependency_layer is not None and dependent_layer > dependency_layer:
+                layer_patterns = layered_architecture.layer_patterns
+                broken_rules.append(
+                    f'layer {layer_patterns[dependent_layer]} must not depend on upper layer '
+                    f'{layer_patterns[dependency_layer]}'
+                )
+        for broken_rule in broken_rules:
+            violations.append(
+                RuleViolation(
+                    broken_rule,
+                    dependent_fqn,
+                    dependency_fqn,
+                    uml_relation.type,
+                    *locate_node(dependent_fqn, dependent_module),
+                )
+            )
+
+    return violations
+
+
+def format_violations_report(violations: List[RuleViolation]) -> Iterable[str]:
+    yield f'{len(violations)} architecture rule violation(s)\n'
+    for violation in violations:
+        location = '' if violation.source_path is None else f'{violation.source_path}:'
+        if violation.source_path is not None and violation.line_number is not None:
+            location += f'{violation.line_number}:'
+        yield (
+            f'{location}{" " if location else ""}{violation.source_fqn} -> {violation.target_fqn} '
+            f'({violation.relation_type.name.lower()}): {violation.rule}\n'
+        )
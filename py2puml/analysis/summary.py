@@ -0,0 +1,64 @@
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from py2puml.analysis.cycles import get_node_module_name
+from py2puml.domain.domainmodel import DomainModel
+from py2puml.domain.packagesummary import PackageRelation, PackageSummary
+from py2puml.domain.umlrelation import RelType
+from py2puml.inspection.inspectimports import collapse_module_name
+from py2puml.py2puml import belongs_to_root
+
+
+def package_resolver(
+    domain_model: DomainModel, root_module_names: Iterable[str], depth: Optional[int]
+) -> Callable[[str], Optional[str]]:
+    """
+    Returns the function giving the package of a node of the relations (a definition or a module functions box) at the
+    given depth below its root module (its module without depth), or None if the node is outside of the roots
+    """
+    # the innermost root of nested roots is the root of their definitions
+    root_module_names = sorted(root_module_names, key=len, reverse=True)
+    packages_by_fqn: Dict[str, Optional[str]] = {}
+
+    def package_of(node_fqn: str) -> Optional[str]:
+        if node_fqn not in packages_by_fqn:
+            module_name = get_node_module_name(node_fqn, domain_model)
+            root_module_name = next(
+                (root_name for root_name in root_module_names if belongs_to_root(module_name, root_name)), None
+            )
+            packages_by_fqn[node_fqn] = (
+                None if root_module_name is None else collapse_module_name(module_name, root_module_name, depth)
+            )
+        return packages_by_fqn[node_fqn]
+
+    return package_of
+
+
+def summarize_packages(domain_model: DomainModel, root_module_names: Iterable[str], depth: int = 1) -> PackageSummary:
+    """
+    Groups the definitions of the domain by their package at the given depth below their root module and counts the
+    relations between the packages per relation type, in a single pass on the relations.
+    The relations within a package and the ones towards definitions outside of the roots are ignored.
+    """
+    package_of = package_resolver(domain_model, root_module_names, depth)
+    definitions_counts: Dict[str, int] = {}
+    for fqn in domain_model.items_by_fqn:
+        package_name = package_of(fqn)
+        if package_name is not None:
+            definitions_counts[package_name] = definitions_counts.get(package_name, 0) + 1
+
+    counts_by_edge: Dict[Tuple[str, str, RelType], int] = {}
+    for uml_relation in domain_model.relations:
+        source_package, target_package = package_of(uml_relation.source_fqn), package_of(uml_relation.target_fqn)
+        if source_package is None or target_package is None or source_package == target_package:
+            continue
+        edge = (source_package, target_package, uml_relation.type)
+        counts_by_edge[edge] = counts_by_edge.get(edge, 0) + uml_relation.count
+
+    return PackageSummary(
+        domain_model.name,
+        definitions_counts,
+        [
+            PackageRelation(source_package, target_package, relation_type, count)
+            for (source_package, target_package, relation_type), count in counts_by_edge.items()
+        ],
+    )
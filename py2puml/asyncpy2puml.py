@@ -0,0 +1,322 @@
+import sys
+from asyncio import Semaphore, gather, get_running_loop, sleep
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
+
+from py2puml.domain.diagnostic import DiagnosticType, InspectionDiagnostic
+from py2puml.domain.domainfilter import DomainFilter
+from py2puml.domain.domainmodel import DomainModel
+from py2puml.domain.inspectionprofile import FULL_PROFILE, InspectionProfile
+from py2puml.domain.umlfunction import UmlModule
+from py2puml.domain.umlitem import UmlItem
+from py2puml.domain.umlrelation import UmlRelation
+from py2puml.export.puml import to_puml_diagram
+from py2puml.inspection.inspectpackage import aggregate_relations_in_place, list_domain_module_names
+from py2puml.inspection.inspectworkers import (
+    ModuleInspection,
+    SharedInspectionState,
+    inspect_module_in_worker,
+    merge_module_inspection,
+)
+
+# number of characters gathered in a chunk before giving the control back to the event loop when rendering
+RENDERING_CHUNK_SIZE = 8192
+
+
+# the state shared by the inspections of the modules in a worker process of an InspectionProcessPool
+worker_shared_state: Optional[SharedInspectionState] = None
+
+
+def share_state_in_worker(shared_state: SharedInspectionState):
+    """Initializer of the worker processes: keeps the state shared by the inspections of all the modules"""
+    global worker_shared_state
+    worker_shared_state = shared_state
+
+
+def inspect_module_with_worker_state(
+    module_name: str, root_module_names: Tuple[str, ...], first_pass: bool
+) -> ModuleInspection:
+    return inspect_module_in_worker(worker_shared_state, module_name, root_module_names, first_pass, False)
+
+
+def inspection_error(module_name: str, error: Exception) -> InspectionDiagnostic:
+    return InspectionDiagnostic(module_name, DiagnosticType.ERROR, f'{error.__class__.__name__}: {error}')
+
+
+class InspectionProcessPool:
+    """
+    A process pool whose worker processes receive the shared state once, when they start.
+    A pool broken by a crashing module is replaced by a new one.
+    """
+
+    def __init__(self, concurrency: int, shared_state: SharedInspectionState):
+        self.concurrency = concurrency
+        self.shared_state = shared_state
+        self.executor = self.create_executor()
+
+    def create_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            self.concurrency, get_context(), initializer=share_state_in_worker, initargs=(self.shared_state,)
+        )
+
+    def replace(self, broken_executor: ProcessPoolExecutor):
+        """Replaces the broken executor, unless it was already replaced after the failure of another module"""
+        if self.executor is broken_executor:
+            self.executor = self.create_executor()
+            broken_executor.shutdown(wait=False)
+
+    async def shutdown(self):
+        # the worker processes are idle but joining them takes time, which must not block the event loop
+        await get_running_loop().run_in_executor(None, self.executor.shutdown)
+
+    def terminate(self):
+        """Stops the worker processes without waiting for the modules being imported"""
+        # the processes are forgotten by the executor once shut down
+        worker_processes = list((self.executor._processes or {}).values())
+        if sys.version_info >= (3, 9):
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            # the futures of the pending modules are cancelled along with the coroutine
+            self.executor.shutdown(wait=False)
+        for worker_process in worker_processes:
+            worker_process.terminate()
+
+
+async def inspect_modules_in_pool(
+    module_names: List[str],
+    root_module_names: Tuple[str, ...],
+    first_pass: bool,
+    pool: InspectionProcessPool,
+    diagnostics: List[InspectionDiagnostic],
+) -> List[Optional[ModuleInspection]]:
+    """
+    Inspects each module in the pool, at most as many modules at a time as the pool concurrency.
+    A crashing module breaks the pool and fails the modules running along with it: they are inspected again one at
+    a time in a new pool so that only the crashing module is reported.
+    """
+    loop = get_running_loop()
+    semaphore = Semaphore(pool.concurrency)
+    crash_suspect_indices: List[int] = []
+
+    async def inspect_module_async(module_index: int, module_name: str) -> Optional[ModuleInspection]:
+        async with semaphore:
+            executor = pool.executor
+            try:
+                return await loop.run_in_executor(
+                    executor, inspect_module_with_worker_state, module_name, root_module_names, first_pass
+                )
+            except BrokenProcessPool:
+                pool.replace(executor)
+                crash_suspect_indices.append(module_index)
+            except Exception as error:
+                diagnostics.append(inspection_error(module_name, error))
+            return None
+
+    module_inspections = await gather(
+        *(inspect_module_async(module_index, module_name) for module_index, module_name in enumerate(module_names))
+    )
+
+    for module_index in sorted(crash_suspect_indices):
+        module_name = module_names[module_index]
+        executor = pool.executor
+        try:
+            module_inspections[module_index] = await loop.run_in_executor(
+                executor, inspect_module_with_worker_state, module_name, root_module_names, first_pass
+            )
+        except BrokenProcessPool:
+            pool.replace(executor)
+            diagnostics.append(
+                InspectionDiagnostic(module_name, DiagnosticType.CRASH, 'worker process terminated abruptly')
+            )
+        except Exception as error:
+            diagnostics.append(inspection_error(module_name, error))
+
+    return module_inspections
+
+
+async def inspect_modules_in_executor(
+    module_names: List[str],
+    root_module_names: Tuple[str, ...],
+    first_pass: bool,
+    shared_state: SharedInspectionState,
+    semaphore: Semaphore,
+    executor: Executor,
+    diagnostics: List[InspectionDiagnostic],
+) -> List[Optional[ModuleInspection]]:
+    """
+    Inspects each module in the given executor, at most as many modules at a time as allowed by the semaphore.
+    The shared state is sent along with each module.
+    """
+    loop = get_running_loop()
+
+    async def inspect_module_async(module_name: str) -> Optional[ModuleInspection]:
+        async with semaphore:
+            try:
+                return await loop.run_in_executor(
+                    executor,
+                    inspect_module_in_worker,
+                    shared_state,
+                    module_name,
+                    root_module_names,
+                    first_pass,
+                    False,
+                )
+            except Exception as error:
+                diagnostics.append(inspection_error(module_name, error))
+                return None
+
+    return await gather(*(inspect_module_async(module_name) for module_name in module_names))
+
+
+async def inspect_modules_async(
+    module_names: List[str],
+    root_module_names: Tuple[str, ...],
+    first_pass: bool,
+    shared_state: SharedInspectionState,
+    concurrency: int,
+    executor: Optional[Executor],
+    diagnostics: List[InspectionDiagnostic],
+) -> List[Optional[ModuleInspection]]:
+    """
+    Inspects the modules in the given executor or in a process pool created for this pass.
+    The results are returned in the order of the module names so that the documentation is deterministic.
+    A module which fails is reported in the diagnostics, its result is None.
+    """
+    if executor is not None:
+        semaphore = Semaphore(concurrency if isinstance(executor, ProcessPoolExecutor) else 1)
+        return await inspect_modules_in_executor(
+            module_names, root_module_names, first_pass, shared_state, semaphore, executor, diagnostics
+        )
+
+    pool = InspectionProcessPool(concurrency, shared_state)
+    inspection_completed = False
+    try:
+        module_inspections = await inspect_modules_in_pool(
+            module_names, root_module_names, first_pass, pool, diagnostics
+        )
+        inspection_completed = True
+        return module_inspections
+    finally:
+        if inspection_completed:
+            await pool.shutdown()
+        else:
+            # cancelled: the modules being imported are abandoned instead of blocking the event loop until they end
+            pool.terminate()
+
+
+async def inspect_async(
+    domain_path: str,
+    domain_module: str,
+    additional_roots: Iterable[Tuple[str, str]] = (),
+    concurrency: int = 1,
+    executor: Optional[Executor] = None,
+    domain_filter: Optional[DomainFilter] = None,
+    inspection_profile: InspectionProfile = FULL_PROFILE,
+) -> DomainModel:
+    """
+    Asynchronous version of py2puml.inspect(): the modules are imported and inspected in worker processes so that
+    the event loop is not blocked, at most `concurrency` modules at the same time. Cancelling the coroutine cancels the
+    inspection of the modules which have not started yet and terminates the worker processes.
+
+    The worker processes are created for each inspection pass and receive the shared state once, unless an executor
+    is given: the shared state (including the items found by the first pass) is then sent along with each module,
+    a crashing module breaks a given process executor and the modules being imported are not interrupted by a
+    cancellation. The imports mutate the import system (sys.modules), which is not safe from several threads: with
+    another executor (a thread pool), the modules are inspected one at a time whatever the concurrency.
+
+    The modules which fail to be inspected are reported in the diagnostics of the model. The domain_filter and the
+    inspection_profile are applied like in py2puml.inspect().
+    """
+    loop = get_running_loop()
+    domain_roots: List[Tuple[str, str]] = [(domain_path, domain_module), *additional_roots]
+    root_module_names: Tuple[str, ...] = tuple(root_module for _, root_module in domain_roots)
+    # walking the domain does not import its modules
+    domain_module_names: List[str] = await loop.run_in_executor(
+        None, list_domain_module_names, domain_roots, domain_filter
+    )
+    inspected_module_names = frozenset(root_module_names).union(domain_module_names)
+
+    domain_items_by_fqn: Dict[str, UmlItem] = {}
+    domain_relations: List[UmlRelation] = []
+    modules_by_name: Dict[str, UmlModule] = {}
+    diagnostics: List[InspectionDiagnostic] = []
+    for module_inspection in await inspect_modules_async(
+        list(root_module_names) + domain_module_names,
+        root_module_names,
+        True,
+        SharedInspectionState(inspected_module_names, None, domain_filter, inspection_profile),
+        concurrency,
+        executor,
+        diagnostics,
+    ):
+        if module_inspection is not None:
+            merge_module_inspection(module_inspection, domain_items_by_fqn, domain_relations, modules_by_name)
+
+    # the second pass links the dependencies towards the items found during the first pass, if the profile inspects them
+    if inspection_profile.dependencies:
+        failed_module_names = {diagnostic.module_name for diagnostic in diagnostics}
+        for module_inspection in await inspect_modules_async(
+            [module_name for module_name in domain_module_names if module_name not in failed_module_names],
+            root_module_names,
+            False,
+            SharedInspectionState(inspected_module_names, domain_items_by_fqn, domain_filter, inspection_profile),
+            concurrency,
+            executor,
+            diagnostics,
+        ):
+            if module_inspection is not None:
+                domain_relations.extend(module_inspection.domain_relations)
+
+    aggregate_relations_in_place(domain_relations)
+
+    return DomainModel(domain_module, domain_items_by_fqn, domain_relations, modules_by_name, diagnostics)
+
+
+async def render_async(
+    domain_model: DomainModel,
+    exporter: Callable[[DomainModel], Iterable[str]] = to_puml_diagram,
+    chunk_size: int = RENDERING_CHUNK_SIZE,
+) -> AsyncIterator[str]:
+    """
+    Streams the rendering of the domain model by chunks of about chunk_size characters,
+    giving the control back to the event loop between the chunks.
+    """
+    chunk_parts: List[str] = []
+    chunk_length = 0
+    for content in exporter(domain_model):
+        chunk_parts.append(content)
+        chunk_length += len(content)
+        if chunk_length >= chunk_size:
+            yield ''.join(chunk_parts)
+            chunk_parts = []
+            chunk_length = 0
+            await sleep(0)
+
+    if chunk_parts:
+        yield ''.join(chunk_parts)
+
+
+async def py2puml_async(
+    domain_path: str,
+    domain_module: str,
+    additional_roots: Iterable[Tuple[str, str]] = (),
+    concurrency: int = 1,
+    executor: Optional[Executor] = None,
+    diagnostics: Optional[List[InspectionDiagnostic]] = None,
+    domain_filter: Optional[DomainFilter] = None,
+    inspection_profile: InspectionProfile = FULL_PROFILE,
+) -> AsyncIterator[str]:
+    """
+    Asynchronous version of py2puml(): inspects the domain without blocking the event loop
+    and streams the PlantUML documentation by chunks.
+    The modules which could not be inspected are added to the given diagnostics list.
+    """
+    domain_model = await inspect_async(
+        domain_path, domain_module, additional_roots, concurrency, executor, domain_filter, inspection_profile
+    )
+    if diagnostics is not None:
+        diagnostics.extend(domain_model.diagnostics)
+    async for chunk in render_async(domain_model):
+        yield chunk
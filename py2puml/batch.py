@@ -0,0 +1,211 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from py2puml.analysis.cycles import MODULE_FUNCTIONS_SUFFIX, get_node_module_name
+from py2puml.domain.domainfilter import DomainFilter
+from py2puml.domain.domainmodel import DomainModel
+from py2puml.export.json import to_json_content
+from py2puml.export.output import is_file_content, write_if_changed
+from py2puml.export.puml import to_puml_diagram
+from py2puml.py2puml import belongs_to_root, inspect
+
+try:
+    from tomllib import load as load_toml
+except ImportError:
+    # tomllib is part of the standard library since Python 3.11, tomli is its backport
+    try:
+        from tomli import load as load_toml
+    except ImportError:
+        load_toml = None
+
+BATCH_EXPORTERS: Dict[str, Callable[[DomainModel], Iterable[str]]] = {
+    'puml': to_puml_diagram,
+    'json': to_json_content,
+}
+
+
+@dataclass
+class DiagramConfiguration:
+    """A diagram declared in the [[tool.py2puml.diagrams]] tables of a pyproject.toml file"""
+
+    name: str
+    path: str
+    module: str
+    output: Path
+    roots: List[Tuple[str, str]] = field(default_factory=list)
+    # glob patterns on the module names: a module is documented if it (or one of its packages) matches an include
+    # pattern (all the modules are included when there is none) and none of the exclude patterns
+    include: List[str] = field(default_factory=list)
+    exclude: List[str] = field(default_factory=list)
+    # glob patterns on the fully-qualified names of the documented definitions (like the --focus option)
+    focus: List[str] = field(default_factory=list)
+    format: str = 'puml'
+
+    @property
+    def domain_roots(self) -> List[Tuple[str, str]]:
+        return [(self.path, self.module), *self.roots]
+
+    @property
+    def domain_filter(self) -> DomainFilter:
+        return DomainFilter(tuple(self.include), tuple(self.exclude), tuple(self.focus))
+
+
+@dataclass
+class BatchConfiguration:
+    diagrams: List[DiagramConfiguration]
+    workers: int = 0
+
+
+def read_batch_configuration(pyproject_path: Path) -> BatchConfiguration:
+    """Reads the [tool.py2puml] table of the pyproject.toml file"""
+    if load_toml is None:
+        raise ValueError('reading pyproject.toml requires Python 3.11+ or the tomli package (pip install tomli)')
+    with open(pyproject_path, 'rb') as pyproject_file:
+        pyproject = load_toml(pyproject_file)
+
+    return parse_batch_configuration(pyproject.get('tool', {}).get('py2puml', {}), pyproject_path.parent)
+
+
+def parse_batch_configuration(py2puml_table: Dict[str, Any], base_path: Path) -> BatchConfiguration:
+    """Builds the configuration of the diagrams, whose paths are relative to the folder of the pyproject.toml file"""
+    diagram_tables: List[Dict[str, Any]] = py2puml_table.get('diagrams', [])
+    if len(diagram_tables) == 0:
+        raise ValueError('no diagram is declared in the [[tool.py2puml.diagrams]] tables')
+
+    diagrams: List[DiagramConfiguration] = []
+    for diagram_index, diagram_table in enumerate(diagram_tables, start=1):
+        missing_keys = [key for key in ('path', 'module', 'output') if key not in diagram_table]
+        if len(missing_keys) > 0:
+            raise ValueError(f'diagram {diagram_index} misses the {", ".join(missing_keys)} key(s)')
+        diagram_format = diagram_table.get('format', 'puml')
+        if diagram_format not in BATCH_EXPORTERS:
+            raise ValueError(f'diagram {diagram_index} has an unsupported format: {diagram_format}')
+
+        diagrams.append(
+            DiagramConfiguration(
+                name=diagram_table.get('name', diagram_table['module']),
+                path=str(base_path / diagram_table['path']),
+                module=diagram_table['module'],
+                output=base_path / diagram_table['output'],
+                roots=[
+                    (str(base_path / root_path), root_module)
+                    for root_path, root_module in diagram_table.get('roots', [])
+                ],
+                include=list(diagram_table.get('include', [])),
+                exclude=list(diagram_table.get('exclude', [])),
+                focus=list(diagram_table.get('focus', [])),
+                format=diagram_format,
+            )
+        )
+
+    return BatchConfiguration(diagrams, py2puml_table.get('workers', 0))
+
+
+def union_patterns(diagrams_patterns: List[List[str]]) -> Tuple[str, ...]:
+    """The patterns of all the diagrams, or none (everything is selected) if a diagram has none"""
+    if any(len(diagram_patterns) == 0 for diagram_patterns in diagrams_patterns):
+        return ()
+    return tuple(dict.fromkeys(pattern for diagram_patterns in diagrams_patterns for pattern in diagram_patterns))
+
+
+def diagrams_domain_filter(diagrams: List[DiagramConfiguration]) -> Optional[DomainFilter]:
+    """
+    The filter selecting what at least one of the diagrams documents: the include and focus patterns of the diagrams
+    are combined, a module is excluded only by the exclude patterns shared by all the diagrams.
+    Returns None when the diagrams select everything.
+    """
+    domain_filter = DomainFilter(
+        include_modules=union_patterns([diagram.include for diagram in diagrams]),
+        exclude_modules=tuple(
+            pattern
+            for pattern in dict.fromkeys(diagrams[0].exclude)
+            if all(pattern in diagram.exclude for diagram in diagrams)
+        ),
+        include_definitions=union_patterns([diagram.focus for diagram in diagrams]),
+    )
+    return None if domain_filter == DomainFilter() else domain_filter
+
+
+def inspect_diagrams_domain(batch_configuration: BatchConfiguration) -> DomainModel:
+    """
+    Inspects the union of the roots of all the diagrams in a single session.
+    The modules and definitions which no diagram documents are not inspected (their modules are not imported).
+    """
+    domain_roots: Dict[Tuple[str, str], None] = {
+        domain_root: None for diagram in batch_configuration.diagrams for domain_root in diagram.domain_roots
+    }
+    (domain_path, domain_module), *additional_roots = domain_roots.keys()
+
+    return inspect(
+        domain_path,
+        domain_module,
+        additional_roots,
+        batch_configuration.workers,
+        domain_filter=diagrams_domain_filter(batch_configuration.diagrams),
+    )
+
+
+def diagram_domain_model(domain_model: DomainModel, diagram: DiagramConfiguration) -> DomainModel:
+    """
+    Returns the view of the shared model documented by the diagram.
+    The relations towards definitions of other roots are kept, the ones towards filtered-out definitions are not.
+    """
+
+    domain_filter = diagram.domain_filter
+
+    def is_selected(fqn: str) -> bool:
+        if fqn in domain_model.items_by_fqn:
+            return domain_filter.accepts_definition(get_node_module_name(fqn, domain_model), fqn)
+        # the definitions which no diagram documents were not inspected
+        if fqn not in domain_model.modules_by_name and not fqn.endswith(MODULE_FUNCTIONS_SUFFIX):
+            return False
+        # the focus patterns apply to the definitions, not to the modules nor to their functions box
+        module_name = fqn if fqn in domain_model.modules_by_name else get_node_module_name(fqn, domain_model)
+        return domain_filter.accepts_module(module_name)
+
+    def is_documented(fqn: str) -> bool:
+        return is_selected(fqn) and any(belongs_to_root(fqn, root_module) for _, root_module in diagram.domain_roots)
+
+    diagram_model = domain_model.filtered(is_documented, diagram.name)
+    return DomainModel(
+        diagram_model.name,
+        diagram_model.items_by_fqn,
+        [
+            uml_relation
+            for uml_relation in diagram_model.relations
+            if is_selected(uml_relation.source_fqn) and is_selected(uml_relation.target_fqn)
+        ],
+        diagram_model.modules_by_name,
+        diagram_model.diagnostics,
+        diagram_model.incomplete_fqns,
+    )
+
+
+def render_diagram(domain_model: DomainModel, diagram: DiagramConfiguration, check: bool) -> bool:
+    """Writes the diagram if it changed, or checks that its output file is up-to-date; returns False if it is not"""
+    contents = chain(BATCH_EXPORTERS[diagram.format](diagram_domain_model(domain_model, diagram)), ['\n'])
+    if check:
+        return is_file_content(diagram.output, contents)
+
+    diagram.output.parent.mkdir(parents=True, exist_ok=True)
+    write_if_changed(diagram.output, contents)
+    return True
+
+
+def render_diagrams(
+    domain_model: DomainModel,
+    diagrams: List[DiagramConfiguration],
+    check: bool = False,
+    render_workers: Optional[int] = None,
+) -> List[DiagramConfiguration]:
+    """
+    Renders the diagrams from the shared domain model in a pool of threads (the file comparisons and writes overlap).
+    Returns the diagrams whose output file is not up-to-date in check mode.
+    """
+    with ThreadPoolExecutor(render_workers) as executor:
+        are_up_to_date = list(executor.map(lambda diagram: render_diagram(domain_model, diagram, check), diagrams))
+
+    return [diagram for diagram, is_up_to_date in zip(diagrams, are_up_to_date) if not is_up_to_date]
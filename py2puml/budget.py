@@ -0,0 +1,121 @@
+from dataclasses import replace
+from time import monotonic
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from py2puml.domain.domainfilter import DomainFilter
+from py2puml.domain.domainmodel import DomainModel
+from py2puml.domain.inspectionprofile import FULL_PROFILE, InspectionProfile
+from py2puml.domain.umlfunction import UmlFunction, UmlModule
+from py2puml.domain.umlitem import UmlItem
+from py2puml.domain.umlrelation import RelType, UmlRelation
+from py2puml.inspection.inspectmodule import inspect_domain_definition
+from py2puml.inspection.inspectpackage import aggregate_relations_in_place
+from py2puml.query import DomainQuery
+
+
+def inspect_boxes(
+    domain_query: DomainQuery, inspection_profile: InspectionProfile
+) -> Tuple[Dict[str, UmlItem], Dict[str, List[UmlRelation]]]:
+    """
+    Inspects the boxes of all the discovered definitions and their inheritance relations, which is cheap:
+    the class annotations, constructor bodies and methods are not read
+    """
+    boxes_profile = replace(inspection_profile, name='boxes', attributes=False, methods=False, dependencies=False)
+    boxes_by_fqn: Dict[str, UmlItem] = {}
+    box_relations_by_fqn: Dict[str, List[UmlRelation]] = {}
+    for fqn, stub in domain_query.stubs_by_fqn.items():
+        definition_items_by_fqn: Dict[str, UmlItem] = {}
+        box_relations: List[UmlRelation] = []
+        inspect_domain_definition(
+            domain_query.definitions_by_fqn[fqn],
+            domain_query.root_module_names,
+            definition_items_by_fqn,
+            box_relations,
+            UmlModule(stub.module),
+            inspection_profile=boxes_profile,
+        )
+        boxes_by_fqn[fqn] = definition_items_by_fqn[fqn]
+        box_relations_by_fqn[fqn] = box_relations
+
+    return boxes_by_fqn, box_relations_by_fqn
+
+
+def prioritize_definitions(fqns: Iterable[str], box_relations: Iterable[UmlRelation]) -> List[str]:
+    """
+    Orders the definitions by decreasing number of direct subclasses (the base classes structure the diagram),
+    keeping the discovery order between the definitions having as many subclasses
+    """
+    subclasses_counts: Dict[str, int] = {}
+    for uml_relation in box_relations:
+        if uml_relation.type == RelType.INHERITANCE:
+            subclasses_counts[uml_relation.source_fqn] = subclasses_counts.get(uml_relation.source_fqn, 0) + 1
+
+    return sorted(fqns, key=lambda fqn: -subclasses_counts.get(fqn, 0))
+
+
+def inspect_within_budget(
+    domain_path: str,
+    domain_module: str,
+    time_budget: float,
+    additional_roots: Iterable[Tuple[str, str]] = (),
+    domain_filter: Optional[DomainFilter] = None,
+    inspection_profile: InspectionProfile = FULL_PROFILE,
+) -> DomainModel:
+    """
+    Best-effort inspection of the domain within the time budget (in seconds).
+    The discovery and the boxes of the definitions (with their inheritance relations) are always inspected; then the
+    features of the definitions (attributes, methods) and their dependencies are inspected in priority order until the
+    budget runs out. The definitions whose features or dependencies were not inspected are listed in the
+    incomplete_fqns of the returned model.
+    """
+    deadline = monotonic() + time_budget
+    domain_query = DomainQuery(domain_path, domain_module, additional_roots, domain_filter, inspection_profile)
+    boxes_by_fqn, box_relations_by_fqn = inspect_boxes(domain_query, inspection_profile)
+    prioritized_fqns = prioritize_definitions(
+        boxes_by_fqn,
+        (uml_relation for box_relations in box_relations_by_fqn.values() for uml_relation in box_relations),
+    )
+
+    # features of the definitions, then their dependencies, for as long as the budget allows it
+    inspected_fqns: List[str] = []
+    for fqn in prioritized_fqns:
+        if monotonic() >= deadline:
+            break
+        domain_query.item(fqn)
+        inspected_fqns.append(fqn)
+    linked_fqns: Set[str] = set()
+    for fqn in inspected_fqns:
+        if monotonic() >= deadline:
+            break
+        domain_query.relations(fqn)
+        linked_fqns.add(fqn)
+
+    items_by_fqn: Dict[str, UmlItem] = {
+        fqn: domain_query.items_by_fqn.get(fqn, uml_box) for fqn, uml_box in boxes_by_fqn.items()
+    }
+    modules_by_name: Dict[str, UmlModule] = {}
+    for uml_item in items_by_fqn.values():
+        if isinstance(uml_item, UmlFunction):
+            modules_by_name.setdefault(uml_item.module, UmlModule(uml_item.module)).functions.append(uml_item)
+
+    # module functions are documented in a '<module>.Methods' box
+    documented_fqns = set(items_by_fqn) | {f'{module_name}.Methods' for module_name in modules_by_name}
+    relations: List[UmlRelation] = [
+        uml_relation
+        for fqn in items_by_fqn
+        for uml_relation in (
+            domain_query.relations(fqn)
+            if fqn in linked_fqns
+            else domain_query.structural_relations_by_fqn.get(fqn, box_relations_by_fqn[fqn])
+        )
+        if uml_relation.source_fqn in documented_fqns and uml_relation.target_fqn in documented_fqns
+    ]
+    aggregate_relations_in_place(relations)
+
+    return DomainModel(
+        domain_query.name,
+        items_by_fqn,
+        relations,
+        modules_by_name,
+        incomplete_fqns=frozenset(items_by_fqn) - linked_fqns,
+    )
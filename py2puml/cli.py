@@ -1,22 +1,68 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
+from itertools import chain
 from pathlib import Path
-from sys import path
+from sys import argv, exit, path, stderr
+from typing import Callable, Dict, Iterable, List, Optional
 
-from py2puml.py2puml import py2puml
+from py2puml.analysis.cycles import cycle_domain_model, find_class_cycles, find_module_cycles, format_cycles_report
+from py2puml.analysis.metrics import compute_metrics
+from py2puml.analysis.reduction import transitively_reduced
+from py2puml.analysis.rules import check_architecture, format_violations_report
+from py2puml.analysis.summary import summarize_packages
+from py2puml.batch import inspect_diagrams_domain, read_batch_configuration, render_diagrams
+from py2puml.budget import inspect_within_budget
+from py2puml.domain.architecturerules import ForbiddenDependency, LayeredArchitecture
+from py2puml.domain.callgraph import CallGraph
+from py2puml.domain.domainfilter import DomainFilter
+from py2puml.domain.domainmodel import DomainModel
+from py2puml.domain.importgraph import ImportGraph
+from py2puml.domain.inspectionprofile import FULL_PROFILE, INSPECTION_PROFILES
+from py2puml.domain.metrics import DomainMetrics
+from py2puml.domain.packagesummary import PackageSummary
+from py2puml.export.csv import to_csv_metrics
+from py2puml.export.json import (
+    to_json_call_graph,
+    to_json_content,
+    to_json_import_graph,
+    to_json_metrics,
+    to_json_package_summary,
+)
+from py2puml.export.output import is_file_content, write_if_changed
+from py2puml.export.puml import to_puml_call_graph, to_puml_diagram, to_puml_import_graph, to_puml_package_summary
+from py2puml.inspection.inspectcalls import call_dependency_relations, inspect_calls
+from py2puml.inspection.inspectimports import inspect_imports
+from py2puml.inspection.inspectpackage import aggregate_relations_in_place
+from py2puml.inspection.staticsources import split_archive_path
+from py2puml.py2puml import inspect, inspect_revision, inspect_static, split_by_roots
+from py2puml.query import DomainQuery
 
+EXPORTERS: Dict[str, Callable[[DomainModel], Iterable[str]]] = {
+    'puml': to_puml_diagram,
+    'json': to_json_content,
+}
+CALL_GRAPH_EXPORTERS: Dict[str, Callable[[CallGraph], Iterable[str]]] = {
+    'puml': to_puml_call_graph,
+    'json': to_json_call_graph,
+}
+IMPORT_GRAPH_EXPORTERS: Dict[str, Callable[[ImportGraph], Iterable[str]]] = {
+    'puml': to_puml_import_graph,
+    'json': to_json_import_graph,
+}
+METRICS_EXPORTERS: Dict[str, Callable[[DomainMetrics], Iterable[str]]] = {
+    'csv': to_csv_metrics,
+    'json': to_json_metrics,
+}
+PACKAGE_SUMMARY_EXPORTERS: Dict[str, Callable[[PackageSummary], Iterable[str]]] = {
+    'puml': to_puml_package_summary,
+    'json': to_json_package_summary,
+}
 
-def run():
-    # adds the current working directory to the system path in the first place
-    # to ease module resolution when py2puml imports them
-    current_working_directory = str(Path.cwd().resolve())
-    path.insert(0, current_working_directory)
 
-    argparser = ArgumentParser(description='Generate PlantUML class diagrams to document your Python application.')
-
-    argparser.add_argument('-v', '--version', action='version', version='py2puml 0.9.1')
+def add_domain_arguments(argparser: ArgumentParser):
+    """Adds the arguments describing the documented domain"""
     argparser.add_argument('path', metavar='path', type=str, help='the filepath to the domain')
     argparser.add_argument(
         'module',
@@ -25,6 +71,524 @@ def run():
         help='the module name of the domain',
         default=None,
     )
+    argparser.add_argument(
+        '-r',
+        '--root',
+        metavar=('path', 'module'),
+        nargs=2,
+        action='append',
+        default=[],
+        help='an additional domain (filepath and module name) inspected along with the first one',
+    )
+    argparser.add_argument(
+        '--include',
+        metavar='pattern',
+        action='append',
+        default=[],
+        help='inspects only the modules (and subpackages) whose name matches this glob pattern',
+    )
+    argparser.add_argument(
+        '--exclude',
+        metavar='pattern',
+        action='append',
+        default=[],
+        help='skips the modules (and subpackages) whose name matches this glob pattern, without importing them',
+    )
+    argparser.add_argument(
+        '--include-definition',
+        metavar='pattern',
+        action='append',
+        default=[],
+        help='inspects only the definitions whose fully-qualified name matches this glob pattern',
+    )
+    argparser.add_argument(
+        '--exclude-definition',
+        metavar='pattern',
+        action='append',
+        default=[],
+        help='skips the definitions whose fully-qualified name matches this glob pattern',
+    )
+
+
+def add_inspection_arguments(argparser: ArgumentParser):
+    """Adds the arguments describing how the domain modules are imported and inspected"""
+    argparser.add_argument(
+        '-w',
+        '--workers',
+        type=int,
+        default=0,
+        help='imports and inspects the modules in this number of worker processes',
+    )
+    argparser.add_argument(
+        '--module-timeout',
+        metavar='seconds',
+        type=float,
+        default=None,
+        help='skips the modules whose import and inspection exceed this duration (uses worker processes)',
+    )
+    argparser.add_argument(
+        '--bounded-memory',
+        action='store_true',
+        help='releases the inspected modules once their definitions are captured, to cap the memory usage',
+    )
+    argparser.add_argument(
+        '--profile',
+        choices=INSPECTION_PROFILES.keys(),
+        default=FULL_PROFILE.name,
+        help='the inspected features: structure (boxes and inheritance), attributes, methods (and functions) or full '
+        '(with the dependencies)',
+    )
+
+
+def add_output_arguments(argparser: ArgumentParser):
+    """Adds the arguments describing where the documentation is output"""
+    argparser.add_argument(
+        '-o',
+        '--output',
+        metavar='path',
+        default=None,
+        help='writes the documentation to this file, which is left untouched if its contents are unchanged',
+    )
+    argparser.add_argument(
+        '--check',
+        action='store_true',
+        help='checks that the output file is up-to-date instead of writing it (exits with 1 if it is not)',
+    )
+
+
+def emit_output(argparser: ArgumentParser, args: Namespace, contents: Iterable[str]) -> bool:
+    """
+    Prints the contents, or writes them to the output file, or compares them with it in check mode.
+    Returns False if the checked output file is not up-to-date.
+    """
+    if args.check:
+        if args.output is None:
+            argparser.error('--check needs the --output file to compare the documentation with')
+        if not is_file_content(args.output, contents):
+            print(f'py2puml: {args.output} is not up-to-date', file=stderr)
+            return False
+    elif args.output is not None:
+        write_if_changed(args.output, contents)
+    else:
+        print(''.join(contents), end='')
+    return True
+
+
+def get_domain_filter(args: Namespace) -> Optional[DomainFilter]:
+    domain_filter = DomainFilter(
+        tuple(args.include), tuple(args.exclude), tuple(args.include_definition), tuple(args.exclude_definition)
+    )
+    # no filtering without patterns
+    return None if domain_filter == DomainFilter() else domain_filter
+
+
+def inspect_domain(args: Namespace) -> DomainModel:
+    return inspect(
+        args.path,
+        args.module,
+        [tuple(root) for root in args.root],
+        args.workers,
+        args.module_timeout,
+        args.bounded_memory,
+        get_domain_filter(args),
+        INSPECTION_PROFILES[args.profile],
+    )
+
+
+def print_diagnostics(domain_model: DomainModel):
+    for diagnostic in domain_model.diagnostics:
+        print(f'py2puml: {diagnostic}', file=stderr)
+    if len(domain_model.incomplete_fqns) > 0:
+        print(
+            f'py2puml: {len(domain_model.incomplete_fqns)} definitions were partially inspected within the time budget',
+            file=stderr,
+        )
+
+
+def with_call_dependencies(domain_model: DomainModel) -> DomainModel:
+    domain_relations = list(domain_model.relations)
+    domain_relations.extend(call_dependency_relations(inspect_calls(domain_model), domain_model))
+    aggregate_relations_in_place(domain_relations)
+    return DomainModel(
+        domain_model.name,
+        domain_model.items_by_fqn,
+        domain_relations,
+        domain_model.modules_by_name,
+        domain_model.diagnostics,
+        domain_model.incomplete_fqns,
+    )
+
+
+def iter_diagrams_contents(
+    domain_models: Iterable[DomainModel], exporter: Callable[[DomainModel], Iterable[str]]
+) -> Iterable[str]:
+    """Yields the contents of the diagrams, separated and ended by a line return"""
+    for model_index, domain_model in enumerate(domain_models):
+        if model_index > 0:
+            yield '\n'
+        yield from exporter(domain_model)
+    yield '\n'
+
+
+def run_diagram(arguments: List[str]):
+    argparser = ArgumentParser(description='Generate PlantUML class diagrams to document your Python application.')
+
+    argparser.add_argument('-v', '--version', action='version', version='py2puml 0.9.1')
+    add_domain_arguments(argparser)
+    add_inspection_arguments(argparser)
+    add_output_arguments(argparser)
+    argparser.add_argument(
+        '--split-roots',
+        action='store_true',
+        help='outputs one diagram per domain root instead of a single diagram',
+    )
+    argparser.add_argument(
+        '-f',
+        '--format',
+        choices=list(EXPORTERS.keys()),
+        default='puml',
+        help='the output format of the documentation',
+    )
+    argparser.add_argument(
+        '--focus',
+        metavar='pattern',
+        action='append',
+        default=[],
+        help='documents only the definitions whose fully-qualified name matches this glob pattern (inspected lazily)',
+    )
+    argparser.add_argument(
+        '--calls',
+        action='store_true',
+        help='adds the dependencies resulting from the calls of the domain functions, classes and methods',
+    )
+    argparser.add_argument(
+        '--revision',
+        metavar='rev',
+        default=None,
+        help='documents the domain as it is at this git revision, parsing its sources without checking it out',
+    )
+    argparser.add_argument(
+        '--static',
+        action='store_true',
+        help='documents the domain by parsing its sources (or their .pyi stubs) instead of importing it '
+        '(implied when a path leads into a .whl, .zip or .pyz archive)',
+    )
+    argparser.add_argument(
+        '--reduce',
+        action='store_true',
+        help='removes the inheritance and dependency relations implied by longer paths of relations of the same type',
+    )
+    argparser.add_argument(
+        '--time-budget',
+        metavar='seconds',
+        type=float,
+        default=None,
+        help='inspects the features and dependencies of the definitions until this duration is spent, '
+        'marking the partially inspected definitions as incomplete',
+    )
+
+    args = argparser.parse_args(arguments)
+    additional_roots = [tuple(root) for root in args.root]
+    # the modules of the archives are parsed by the static inspection, without being extracted nor imported
+    domain_paths = [args.path, *(root_path for root_path, _ in additional_roots)]
+    reads_archives = any(split_archive_path(domain_path) is not None for domain_path in domain_paths)
+    if args.revision is not None or args.static or reads_archives:
+        if args.focus or args.calls or args.time_budget is not None:
+            argparser.error(
+                'archives, --revision and --static cannot be combined with --focus, --calls nor --time-budget'
+            )
+        try:
+            domain_model = (
+                inspect_revision(args.path, args.module, args.revision, additional_roots, get_domain_filter(args))
+                if args.revision is not None
+                else inspect_static(args.path, args.module, additional_roots, get_domain_filter(args))
+            )
+        except ValueError as error:
+            argparser.error(str(error))
+    elif args.time_budget is not None:
+        if args.focus:
+            argparser.error('--time-budget cannot be combined with --focus')
+        domain_model = inspect_within_budget(
+            args.path,
+            args.module,
+            args.time_budget,
+            additional_roots,
+            get_domain_filter(args),
+            INSPECTION_PROFILES[args.profile],
+        )
+    elif args.focus:
+        domain_query = DomainQuery(
+            args.path, args.module, additional_roots, get_domain_filter(args), INSPECTION_PROFILES[args.profile]
+        )
+        domain_model = domain_query.model(
+            {stub.fqn: None for focus_pattern in args.focus for stub in domain_query.find(focus_pattern)}.keys()
+        )
+    else:
+        domain_model = inspect_domain(args)
+    if args.calls:
+        domain_model = with_call_dependencies(domain_model)
+    if args.reduce:
+        domain_model = transitively_reduced(domain_model)
+    domain_models = (
+        split_by_roots(domain_model, [args.module] + [root_module for _, root_module in additional_roots])
+        if args.split_roots
+        else [domain_model]
+    )
+    exporter = EXPORTERS[args.format]
+    is_up_to_date = emit_output(argparser, args, iter_diagrams_contents(domain_models, exporter))
+    print_diagnostics(domain_model)
+    if not is_up_to_date:
+        exit(1)
+
+
+def run_cycles(arguments: List[str]):
+    argparser = ArgumentParser(
+        prog='py2puml cycles',
+        description='Report the dependency cycles between the classes and between the modules of a domain.',
+    )
+    add_domain_arguments(argparser)
+    add_inspection_arguments(argparser)
+    argparser.add_argument(
+        '--diagrams',
+        action='store_true',
+        help='outputs a PlantUML diagram of each cycle between classes after the report',
+    )
+
+    args = argparser.parse_args(arguments)
+    domain_model = inspect_domain(args)
+    class_cycles = find_class_cycles(domain_model)
+    print(''.join(format_cycles_report('class', class_cycles)), end='')
+    print(''.join(format_cycles_report('module', find_module_cycles(domain_model))), end='')
+    if args.diagrams:
+        for cycle_index, cycle in enumerate(class_cycles, start=1):
+            cycle_model = cycle_domain_model(domain_model, cycle, f'{domain_model.name} cycle {cycle_index}')
+            print(''.join(to_puml_diagram(cycle_model)), end='')
+    print_diagnostics(domain_model)
+
+
+def run_check(arguments: List[str]):
+    argparser = ArgumentParser(
+        prog='py2puml check',
+        description='Check the dependencies between the modules of a domain against architecture rules.',
+    )
+    add_domain_arguments(argparser)
+    add_inspection_arguments(argparser)
+    argparser.add_argument(
+        '--forbid',
+        metavar=('source', 'target'),
+        nargs=2,
+        action='append',
+        default=[],
+        help='forbids the dependencies of the modules matching the source glob pattern on the ones matching the target '
+        'pattern (repeatable)',
+    )
+    argparser.add_argument(
+        '--layers',
+        metavar='pattern',
+        nargs='+',
+        action='append',
+        default=[],
+        help='the glob patterns of the modules of each layer, from the top one: a layer must not depend on the layers '
+        'above it (repeatable)',
+    )
+
+    args = argparser.parse_args(arguments)
+    if len(args.forbid) == 0 and len(args.layers) == 0:
+        argparser.error('no architecture rule is given, use --forbid or --layers')
+    domain_model = inspect_domain(args)
+    violations = check_architecture(
+        domain_model,
+        [ForbiddenDependency(source_pattern, target_pattern) for source_pattern, target_pattern in args.forbid],
+        [LayeredArchitecture(list(layer_patterns)) for layer_patterns in args.layers],
+    )
+    print(''.join(format_violations_report(violations)), end='')
+    print_diagnostics(domain_model)
+    if len(violations) > 0:
+        exit(1)
+
+
+def run_imports(arguments: List[str]):
+    argparser = ArgumentParser(
+        prog='py2puml imports',
+        description='Generate the diagram of the imports between the modules of a domain, without importing them.',
+    )
+    add_domain_arguments(argparser)
+    add_output_arguments(argparser)
+    argparser.add_argument(
+        '-d',
+        '--depth',
+        type=int,
+        default=None,
+        help='collapses the modules into their packages at this depth below the domain root',
+    )
+    argparser.add_argument(
+        '-f',
+        '--format',
+        choices=list(IMPORT_GRAPH_EXPORTERS.keys()),
+        default='puml',
+        help='the output format of the import graph',
+    )
+
+    args = argparser.parse_args(arguments)
+    import_graph = inspect_imports(
+        [(args.path, args.module)] + [tuple(root) for root in args.root], args.depth, get_domain_filter(args)
+    )
+    if not emit_output(argparser, args, chain(IMPORT_GRAPH_EXPORTERS[args.format](import_graph), ['\n'])):
+        exit(1)
+
+
+def run_packages(arguments: List[str]):
+    argparser = ArgumentParser(
+        prog='py2puml packages',
+        description='Generate the overview diagram of the packages of a domain, with the relations between them.',
+    )
+    add_domain_arguments(argparser)
+    add_inspection_arguments(argparser)
+    add_output_arguments(argparser)
+    argparser.add_argument(
+        '-d',
+        '--depth',
+        type=int,
+        default=1,
+        help='groups the definitions by their package at this depth below the domain root',
+    )
+    argparser.add_argument(
+        '-f',
+        '--format',
+        choices=list(PACKAGE_SUMMARY_EXPORTERS.keys()),
+        default='puml',
+        help='the output format of the package summary',
+    )
+
+    args = argparser.parse_args(arguments)
+    domain_model = inspect_domain(args)
+    package_summary = summarize_packages(
+        domain_model, [args.module] + [root_module for _, root_module in args.root], args.depth
+    )
+    is_up_to_date = emit_output(argparser, args, chain(PACKAGE_SUMMARY_EXPORTERS[args.format](package_summary), ['\n']))
+    print_diagnostics(domain_model)
+    if not is_up_to_date:
+        exit(1)
+
+
+def run_metrics(arguments: List[str]):
+    argparser = ArgumentParser(
+        prog='py2puml metrics',
+        description='Compute the coupling metrics of the definitions and of the packages of a domain.',
+    )
+    add_domain_arguments(argparser)
+    add_inspection_arguments(argparser)
+    add_output_arguments(argparser)
+    argparser.add_argument(
+        '-d',
+        '--depth',
+        type=int,
+        default=None,
+        help='computes the metrics of the packages at this depth below the domain root (of the modules by default)',
+    )
+    argparser.add_argument(
+        '-f',
+        '--format',
+        choices=list(METRICS_EXPORTERS.keys()),
+        default='csv',
+        help='the output format of the metrics',
+    )
+
+    args = argparser.parse_args(arguments)
+    domain_model = inspect_domain(args)
+    domain_metrics = compute_metrics(
+        domain_model, [args.module] + [root_module for _, root_module in args.root], args.depth
+    )
+    contents = METRICS_EXPORTERS[args.format](domain_metrics)
+    # the CSV rows end with a line break
+    is_up_to_date = emit_output(argparser, args, contents if args.format == 'csv' else chain(contents, ['\n']))
+    print_diagnostics(domain_model)
+    if not is_up_to_date:
+        exit(1)
+
+
+def run_calls(arguments: List[str]):
+    argparser = ArgumentParser(
+        prog='py2puml calls',
+        description='Generate the call graph between the functions and methods of a domain.',
+    )
+    add_domain_arguments(argparser)
+    add_inspection_arguments(argparser)
+    add_output_arguments(argparser)
+    argparser.add_argument(
+        '-f',
+        '--format',
+        choices=list(CALL_GRAPH_EXPORTERS.keys()),
+        default='puml',
+        help='the output format of the call graph',
+    )
+
+    args = argparser.parse_args(arguments)
+    domain_model = inspect_domain(args)
+    is_up_to_date = emit_output(
+        argparser, args, chain(CALL_GRAPH_EXPORTERS[args.format](inspect_calls(domain_model)), ['\n'])
+    )
+    print_diagnostics(domain_model)
+    if not is_up_to_date:
+        exit(1)
+
+
+def run_batch(arguments: List[str]):
+    argparser = ArgumentParser(
+        prog='py2puml batch',
+        description='Generate the diagrams declared in the [tool.py2puml] table of a pyproject.toml file.',
+    )
+    argparser.add_argument(
+        '-c',
+        '--config',
+        metavar='path',
+        default='pyproject.toml',
+        help='the pyproject.toml file declaring the diagrams',
+    )
+    argparser.add_argument(
+        '--check',
+        action='store_true',
+        help='checks that the output files are up-to-date instead of writing them (exits with 1 if one is not)',
+    )
+
+    args = argparser.parse_args(arguments)
+    config_path = Path(args.config)
+    try:
+        batch_configuration = read_batch_configuration(config_path)
+    except (OSError, ValueError) as error:
+        argparser.error(str(error))
+    # the domain modules are imported relatively to the folder of the configuration file
+    path.insert(0, str(config_path.parent.resolve()))
+
+    domain_model = inspect_diagrams_domain(batch_configuration)
+    outdated_diagrams = render_diagrams(domain_model, batch_configuration.diagrams, args.check)
+    for outdated_diagram in outdated_diagrams:
+        print(f'py2puml: {outdated_diagram.output} is not up-to-date', file=stderr)
+    print_diagnostics(domain_model)
+    if len(outdated_diagrams) > 0:
+        exit(1)
+
+
+# the commands run by the first argument, the class diagram being generated otherwise
+COMMANDS: Dict[str, Callable[[List[str]], None]] = {
+    'batch': run_batch,
+    'calls': run_calls,
+    'check': run_check,
+    'cycles': run_cycles,
+    'imports': run_imports,
+    'metrics': run_metrics,
+    'packages': run_packages,
+}
+
+
+def run():
+    # adds the current working directory to the system path in the first place
+    # to ease module resolution when py2puml imports them
+    current_working_directory = str(Path.cwd().resolve())
+    path.insert(0, current_working_directory)
 
-    args = argparser.parse_args()
-    print(''.join(py2puml(args.path, args.module)))
+    arguments = argv[1:]
+    if len(arguments) > 0 and arguments[0] in COMMANDS:
+        COMMANDS[arguments[0]](arguments[1:])
+    else:
+        run_diagram(arguments)
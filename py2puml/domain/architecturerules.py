@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+from py2puml.domain.umlrelation import RelType
+
+
+@dataclass(frozen=True)
+class ForbiddenDependency:
+    """The modules matching the source glob pattern must not depend on the modules matching the target pattern"""
+
+    source_pattern: str
+    target_pattern: str
+
+    def __str__(self) -> str:
+        return f'{self.source_pattern} must not depend on {self.target_pattern}'
+
+
+@dataclass
+class LayeredArchitecture:
+    """
+    The glob patterns of the modules of each layer, from the top layer to the bottom one:
+    a layer may depend on the layers below it, not on the layers above it
+    """
+
+    layer_patterns: List[str]
+
+
+@dataclass
+class RuleViolation:
+    """A relation breaking an architecture rule, located at the definition of its dependent node when it is known"""
+
+    rule: str
+    source_fqn: str
+    target_fqn: str
+    relation_type: RelType
+    source_path: Optional[str] = None
+    line_number: Optional[int] = None
@@ -0,0 +1,19 @@
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class FunctionCall:
+    """The calls of a domain function, method or class by a function, a method or a module, with their count"""
+
+    caller_fqn: str
+    callee_fqn: str
+    count: int = 1
+
+
+@dataclass
+class CallGraph:
+    """The calls between the functions and methods of a domain"""
+
+    name: str
+    calls: List[FunctionCall] = field(default_factory=list)
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class DefinitionStub:
+    """
+    Lightweight description of a domain definition (class or function) registered during the discovery,
+    before its attributes, methods and relations are inspected
+    """
+
+    name: str
+    fqn: str
+    module: str
+    source_path: Optional[str] = None
+    line_number: Optional[int] = None
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from enum import Enum, unique
+
+
+@unique
+class DiagnosticType(Enum):
+    TIMEOUT = 'timed out'
+    ERROR = 'failed'
+    CRASH = 'crashed'
+
+
+@dataclass
+class InspectionDiagnostic:
+    """A module which could not be inspected and whose definitions are missing from the diagram"""
+
+    module_name: str
+    type: DiagnosticType
+    message: str
+
+    def __str__(self) -> str:
+        return f'inspection of module {self.module_name} {self.type.value}: {self.message}'
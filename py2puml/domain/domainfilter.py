@@ -0,0 +1,69 @@
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Iterable, Tuple
+
+# characters starting the wildcards of the glob patterns
+GLOB_WILDCARDS = '*?['
+
+
+def matches_module_patterns(module_name: str, module_patterns: Iterable[str]) -> bool:
+    """Whether the module, or one of its parent packages, matches one of the glob patterns"""
+    module_parts = module_name.split('.')
+    return any(
+        fnmatchcase('.'.join(module_parts[:parts_number]), module_pattern)
+        for module_pattern in module_patterns
+        for parts_number in range(1, len(module_parts) + 1)
+    )
+
+
+def may_contain_matching_modules(package_name: str, module_pattern: str) -> bool:
+    """Whether modules of the package may match the pattern: the literal prefix of the pattern leads to the package"""
+    literal_prefix_length = min(
+        (module_pattern.index(wildcard) for wildcard in GLOB_WILDCARDS if wildcard in module_pattern),
+        default=len(module_pattern),
+    )
+    literal_prefix = module_pattern[:literal_prefix_length]
+    return literal_prefix.startswith(package_name) or package_name.startswith(literal_prefix)
+
+
+@dataclass(frozen=True)
+class DomainFilter:
+    """
+    Glob patterns selecting the inspected modules and definitions.
+    A module is inspected if it (or one of its parent packages) matches an include pattern, all the modules being
+    included when there is none, and none of the exclude patterns. The fully-qualified names of the definitions
+    are filtered likewise.
+    """
+
+    include_modules: Tuple[str, ...] = ()
+    exclude_modules: Tuple[str, ...] = ()
+    include_definitions: Tuple[str, ...] = ()
+    exclude_definitions: Tuple[str, ...] = ()
+
+    def walks_package(self, package_name: str) -> bool:
+        """Whether the subpackage is walked: it must not be excluded and may contain included modules"""
+        if matches_module_patterns(package_name, self.exclude_modules):
+            return False
+        return (
+            len(self.include_modules) == 0
+            or matches_module_patterns(package_name, self.include_modules)
+            or any(
+                may_contain_matching_modules(package_name, module_pattern) for module_pattern in self.include_modules
+            )
+        )
+
+    def accepts_module(self, module_name: str) -> bool:
+        if len(self.include_modules) > 0 and not matches_module_patterns(module_name, self.include_modules):
+            return False
+        return not matches_module_patterns(module_name, self.exclude_modules)
+
+    def accepts_definition(self, module_name: str, definition_fqn: str) -> bool:
+        if not self.accepts_module(module_name):
+            return False
+        if len(self.include_definitions) > 0 and not any(
+            fnmatchcase(definition_fqn, definition_pattern) for definition_pattern in self.include_definitions
+        ):
+            return False
+        return not any(
+            fnmatchcase(definition_fqn, definition_pattern) for definition_pattern in self.exclude_definitions
+        )
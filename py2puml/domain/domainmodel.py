@@ -0,0 +1,96 @@
+from copy import deepcopy
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, Iterable, List, Mapping, Tuple
+
+from py2puml.domain.diagnostic import InspectionDiagnostic
+from py2puml.domain.umlfunction import UmlFunction, UmlModule
+from py2puml.domain.umlitem import UmlItem
+from py2puml.domain.umlrelation import RelType, UmlRelation
+
+
+def get_item_module_name(uml_item: UmlItem) -> str:
+    return uml_item.module if isinstance(uml_item, UmlFunction) else uml_item.fqn.rpartition('.')[0]
+
+
+@dataclass(frozen=True)
+class DomainModel:
+    """
+    The result of the inspection of a domain, from which the exporters render their outputs.
+    The collections of the model are read-only and indexed by fully-qualified name, by module and by relation type.
+    """
+
+    name: str
+    items_by_fqn: Mapping[str, UmlItem]
+    relations: Tuple[UmlRelation, ...]
+    modules_by_name: Mapping[str, UmlModule]
+    diagnostics: Tuple[InspectionDiagnostic, ...] = ()
+    # the items whose features or dependencies were not inspected (best-effort inspection within a time budget)
+    incomplete_fqns: FrozenSet[str] = frozenset()
+    items_by_module: Mapping[str, Tuple[UmlItem, ...]] = field(init=False, repr=False, compare=False)
+    relations_by_type: Mapping[RelType, Tuple[UmlRelation, ...]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        items_by_module: Dict[str, List[UmlItem]] = {}
+        for uml_item in self.items_by_fqn.values():
+            items_by_module.setdefault(get_item_module_name(uml_item), []).append(uml_item)
+        relations_by_type: Dict[RelType, List[UmlRelation]] = {}
+        for uml_relation in self.relations:
+            relations_by_type.setdefault(uml_relation.type, []).append(uml_relation)
+
+        # the model is frozen: the attributes are set through object.__setattr__
+        object.__setattr__(self, 'items_by_fqn', MappingProxyType(dict(self.items_by_fqn)))
+        object.__setattr__(self, 'relations', tuple(self.relations))
+        object.__setattr__(self, 'modules_by_name', MappingProxyType(dict(self.modules_by_name)))
+        object.__setattr__(self, 'diagnostics', tuple(self.diagnostics))
+        object.__setattr__(self, 'incomplete_fqns', frozenset(self.incomplete_fqns))
+        object.__setattr__(
+            self,
+            'items_by_module',
+            MappingProxyType({module_name: tuple(items) for module_name, items in items_by_module.items()}),
+        )
+        object.__setattr__(
+            self,
+            'relations_by_type',
+            MappingProxyType({rel_type: tuple(relations) for rel_type, relations in relations_by_type.items()}),
+        )
+
+    @property
+    def items(self) -> Iterable[UmlItem]:
+        return self.items_by_fqn.values()
+
+    def filtered(self, fqn_predicate: Callable[[str], bool], name: str = None) -> 'DomainModel':
+        """
+        Returns a view of the model restricted to the items and module functions whose fully-qualified name matches
+        the predicate. The relations having at least one matching end are kept.
+        The items are copied (the module functions and their items being the same copies): the attributes, methods and
+        members of the view can be modified without affecting the model.
+        """
+        copied_items: Dict[int, object] = {}
+        return DomainModel(
+            self.name if name is None else name,
+            {
+                fqn: deepcopy(uml_item, copied_items)
+                for fqn, uml_item in self.items_by_fqn.items()
+                if fqn_predicate(fqn)
+            },
+            [
+                uml_relation
+                for uml_relation in self.relations
+                if fqn_predicate(uml_relation.source_fqn) or fqn_predicate(uml_relation.target_fqn)
+            ],
+            {
+                module_name: UmlModule(
+                    module_name,
+                    [
+                        deepcopy(uml_function, copied_items)
+                        for uml_function in uml_module.functions
+                        if fqn_predicate(uml_function.fqn)
+                    ],
+                )
+                for module_name, uml_module in self.modules_by_name.items()
+                if fqn_predicate(module_name)
+            },
+            self.diagnostics,
+            frozenset(fqn for fqn in self.incomplete_fqns if fqn_predicate(fqn)),
+        )
@@ -0,0 +1,20 @@
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class ModuleImport:
+    """The imports of a module by another one, weighted by the number of imported names"""
+
+    source_module: str
+    target_module: str
+    weight: int = 1
+
+
+@dataclass
+class ImportGraph:
+    """The import dependencies between the modules of a domain"""
+
+    name: str
+    module_names: List[str] = field(default_factory=list)
+    module_imports: List[ModuleImport] = field(default_factory=list)
@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from typing import Dict
+
+
+@dataclass(frozen=True)
+class InspectionProfile:
+    """
+    The stages of the inspection pipeline run on the domain definitions.
+    The boxes of the classes, enums and named tuples and the inheritance relations are always inspected.
+    """
+
+    name: str
+    # class annotations, constructor bodies (ConstructorVisitor) and the resulting compositions
+    attributes: bool = True
+    # method signatures (ClassVisitor)
+    methods: bool = True
+    # module functions (inspect_function)
+    functions: bool = True
+    # second pass linking the dependencies of the methods and functions (handle_methods_dependencies)
+    dependencies: bool = True
+
+
+FULL_PROFILE = InspectionProfile('full')
+
+INSPECTION_PROFILES: Dict[str, InspectionProfile] = {
+    inspection_profile.name: inspection_profile
+    for inspection_profile in (
+        InspectionProfile('structure', attributes=False, methods=False, functions=False, dependencies=False),
+        InspectionProfile('attributes', methods=False, functions=False, dependencies=False),
+        InspectionProfile('methods', dependencies=False),
+        FULL_PROFILE,
+    )
+}
@@ -0,0 +1,42 @@
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class ClassMetrics:
+    """
+    The coupling metrics of a definition (or of the functions box of a module):
+    - fan_in: the number of definitions depending on it
+    - fan_out: the number of definitions it depends on
+    - instability: fan_out / (fan_in + fan_out), 0 for an isolated definition
+    - depth_of_inheritance: the number of ancestor classes of the domain on its longest inheritance path
+    """
+
+    fqn: str
+    fan_in: int = 0
+    fan_out: int = 0
+    instability: float = 0.0
+    depth_of_inheritance: int = 0
+
+
+@dataclass
+class PackageMetrics:
+    """
+    The coupling metrics of a package:
+    - afferent_coupling (Ca): the number of definitions outside of the package depending on definitions of the package
+    - efferent_coupling (Ce): the number of definitions of the package depending on definitions outside of the package
+    - instability: Ce / (Ca + Ce), 0 for an isolated package
+    """
+
+    name: str
+    definitions_count: int = 0
+    afferent_coupling: int = 0
+    efferent_coupling: int = 0
+    instability: float = 0.0
+
+
+@dataclass
+class DomainMetrics:
+    name: str
+    class_metrics: List[ClassMetrics] = field(default_factory=list)
+    package_metrics: List[PackageMetrics] = field(default_factory=list)
@@ -0,0 +1,23 @@
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from py2puml.domain.umlrelation import RelType
+
+
+@dataclass
+class PackageRelation:
+    """The relations of a type from the definitions of a package towards the ones of another package, counted"""
+
+    source_package: str
+    target_package: str
+    type: RelType
+    count: int = 1
+
+
+@dataclass
+class PackageSummary:
+    """The overview of a domain: its definitions grouped by package, and the relations between the packages"""
+
+    name: str
+    definitions_counts: Dict[str, int] = field(default_factory=dict)
+    package_relations: List[PackageRelation] = field(default_factory=list)
@@ -45,9 +45,9 @@ class UmlModule:
     name: str
     functions: List[UmlFunction] = field(default_factory=list)
 
-    def represent_as_puml(self):
+    def represent_as_puml(self, stereotype: str = ''):
         if len(self.functions) > 0:
-            lines = [f'annotation {self.name}.Methods {{']
+            lines = [f'annotation {self.name}.Methods{stereotype} {{']
             for func in self.functions:
                 lines.append(f'  {func.represent_as_puml()}')
             lines.append('}\n')
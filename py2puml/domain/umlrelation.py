@@ -11,11 +11,15 @@ class RelType(Enum):
 
 
 class UmlRelation:
-    def __init__(self, source, target, rel_type, text=''):
+    def __init__(self, source, target, rel_type, text='', count=1, labels=None):
         self.source_fqn = source
         self.target_fqn = target
         self.type = rel_type
         self.text = text
+        # number of occurrences aggregated in this relation (see aggregate_relations_in_place)
+        self.count = count
+        # all the distinct labels of the aggregated occurrences, the text may display only some of them
+        self.labels = (text,) if labels is None and text != '' else tuple(labels or ())
 
     def __eq__(self, other):
         return (
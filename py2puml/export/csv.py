@@ -0,0 +1,62 @@
+from csv import writer
+from io import StringIO
+from itertools import chain
+from typing import Iterable, List
+
+from py2puml.domain.metrics import DomainMetrics
+
+METRICS_CSV_HEADER = [
+    'scope',
+    'name',
+    'definitions_count',
+    'fan_in',
+    'fan_out',
+    'afferent_coupling',
+    'efferent_coupling',
+    'instability',
+    'depth_of_inheritance',
+]
+
+
+def to_csv_rows(rows: Iterable[List]) -> Iterable[str]:
+    """Formats each row as a CSV line"""
+    line_buffer = StringIO()
+    csv_writer = writer(line_buffer, lineterminator='\n')
+    for row in rows:
+        csv_writer.writerow(row)
+        yield line_buffer.getvalue()
+        line_buffer.seek(0)
+        line_buffer.truncate()
+
+
+def to_csv_metrics(domain_metrics: DomainMetrics) -> Iterable[str]:
+    """One row per package then one row per definition, the metrics not applying to the scope being left empty"""
+    package_rows = (
+        [
+            'package',
+            package_metrics.name,
+            package_metrics.definitions_count,
+            '',
+            '',
+            package_metrics.afferent_coupling,
+            package_metrics.efferent_coupling,
+            f'{package_metrics.instability:.3f}',
+            '',
+        ]
+        for package_metrics in domain_metrics.package_metrics
+    )
+    class_rows = (
+        [
+            'class',
+            class_metrics.fqn,
+            '',
+            class_metrics.fan_in,
+            class_metrics.fan_out,
+            '',
+            '',
+            f'{class_metrics.instability:.3f}',
+            class_metrics.depth_of_inheritance,
+        ]
+        for class_metrics in domain_metrics.class_metrics
+    )
+    yield from to_csv_rows(chain([METRICS_CSV_HEADER], package_rows, class_rows))
@@ -0,0 +1,158 @@
+from dataclasses import asdict
+from json import JSONEncoder
+from typing import Any, Dict, Iterable
+
+from py2puml.domain.callgraph import CallGraph
+from py2puml.domain.domainmodel import DomainModel
+from py2puml.domain.importgraph import ImportGraph
+from py2puml.domain.metrics import DomainMetrics
+from py2puml.domain.packagesummary import PackageSummary
+from py2puml.domain.umlclass import UmlClass, UmlMethod
+from py2puml.domain.umlenum import UmlEnum
+from py2puml.domain.umlfunction import UmlFunction, get_class_name_from_abcmeta
+from py2puml.domain.umlitem import UmlItem
+from py2puml.domain.umlrelation import UmlRelation
+
+
+def method_to_dict(uml_method: UmlMethod) -> Dict[str, Any]:
+    return {
+        'name': uml_method.name,
+        'arguments': uml_method.arguments,
+        'return_type': uml_method.return_type,
+        'is_static': uml_method.is_static,
+        'is_class': uml_method.is_class,
+    }
+
+
+def item_to_dict(uml_item: UmlItem) -> Dict[str, Any]:
+    if isinstance(uml_item, UmlEnum):
+        return {
+            'type': 'enum',
+            'name': uml_item.name,
+            'fqn': uml_item.fqn,
+            'members': [{'name': member.name, 'value': member.value} for member in uml_item.members],
+        }
+    elif isinstance(uml_item, UmlClass):
+        return {
+            'type': 'class',
+            'name': uml_item.name,
+            'fqn': uml_item.fqn,
+            'is_abstract': uml_item.is_abstract,
+            'attributes': [
+                {'name': attribute.name, 'type': attribute.type, 'static': attribute.static}
+                for attribute in uml_item.attributes
+            ],
+            'methods': [method_to_dict(uml_method) for uml_method in uml_item.methods],
+        }
+    elif isinstance(uml_item, UmlFunction):
+        return {
+            'type': 'function',
+            'name': uml_item.name,
+            'fqn': uml_item.fqn,
+            'module': uml_item.module,
+            'arguments': uml_item.arguments,
+            'return_type': uml_item.return_type,
+        }
+    else:
+        raise TypeError(f'cannot process uml_item of type {uml_item.__class__}')
+
+
+def relation_to_dict(uml_relation: UmlRelation) -> Dict[str, Any]:
+    return {
+        'source_fqn': uml_relation.source_fqn,
+        'target_fqn': uml_relation.target_fqn,
+        'type': uml_relation.type.name,
+        'text': uml_relation.text,
+        'count': uml_relation.count,
+        'labels': list(uml_relation.labels),
+    }
+
+
+def to_json_dict(domain_model: DomainModel) -> Dict[str, Any]:
+    return {
+        'name': domain_model.name,
+        'items': [item_to_dict(uml_item) for uml_item in domain_model.items],
+        'relations': [relation_to_dict(uml_relation) for uml_relation in domain_model.relations],
+        'modules': [
+            {'name': uml_module.name, 'functions': [uml_function.fqn for uml_function in uml_module.functions]}
+            for uml_module in domain_model.modules_by_name.values()
+        ],
+        'diagnostics': [
+            {'module_name': diagnostic.module_name, 'type': diagnostic.type.name, 'message': diagnostic.message}
+            for diagnostic in domain_model.diagnostics
+        ],
+        'incomplete_fqns': sorted(domain_model.incomplete_fqns),
+    }
+
+
+def to_json_content(domain_model: DomainModel, indent: int = None) -> Iterable[str]:
+    """
+    Yields the JSON document of the domain model by chunks.
+    Runtime types involved in type annotations are documented by their names.
+    """
+    json_encoder = JSONEncoder(indent=indent, default=get_class_name_from_abcmeta)
+    yield from json_encoder.iterencode(to_json_dict(domain_model))
+
+
+def to_json_import_graph(import_graph: ImportGraph, indent: int = None) -> Iterable[str]:
+    yield from JSONEncoder(indent=indent).iterencode(
+        {
+            'name': import_graph.name,
+            'modules': import_graph.module_names,
+            'imports': [
+                {
+                    'source_module': module_import.source_module,
+                    'target_module': module_import.target_module,
+                    'weight': module_import.weight,
+                }
+                for module_import in import_graph.module_imports
+            ],
+        }
+    )
+
+
+def to_json_package_summary(package_summary: PackageSummary, indent: int = None) -> Iterable[str]:
+    yield from JSONEncoder(indent=indent).iterencode(
+        {
+            'name': package_summary.name,
+            'packages': [
+                {'name': package_name, 'definitions_count': definitions_count}
+                for package_name, definitions_count in package_summary.definitions_counts.items()
+            ],
+            'relations': [
+                {
+                    'source_package': package_relation.source_package,
+                    'target_package': package_relation.target_package,
+                    'type': package_relation.type.name,
+                    'count': package_relation.count,
+                }
+                for package_relation in package_summary.package_relations
+            ],
+        }
+    )
+
+
+def to_json_metrics(domain_metrics: DomainMetrics, indent: int = None) -> Iterable[str]:
+    yield from JSONEncoder(indent=indent).iterencode(
+        {
+            'name': domain_metrics.name,
+            'packages': [asdict(package_metrics) for package_metrics in domain_metrics.package_metrics],
+            'classes': [asdict(class_metrics) for class_metrics in domain_metrics.class_metrics],
+        }
+    )
+
+
+def to_json_call_graph(call_graph: CallGraph, indent: int = None) -> Iterable[str]:
+    yield from JSONEncoder(indent=indent).iterencode(
+        {
+            'name': call_graph.name,
+            'calls': [
+                {
+                    'caller_fqn': function_call.caller_fqn,
+                    'callee_fqn': function_call.callee_fqn,
+                    'count': function_call.count,
+                }
+                for function_call in call_graph.calls
+            ],
+        }
+    )
@@ -0,0 +1,57 @@
+from hashlib import sha256
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+
+# number of bytes read at once when hashing an existing output file
+HASHING_BLOCK_SIZE = 65536
+
+
+def hash_file(file_path: Union[str, Path]) -> Optional[bytes]:
+    """Returns the SHA-256 digest of the file contents, None if the file does not exist"""
+    file_path = Path(file_path)
+    if not file_path.is_file():
+        return None
+
+    file_hash = sha256()
+    with open(file_path, 'rb') as output_file:
+        while block := output_file.read(HASHING_BLOCK_SIZE):
+            file_hash.update(block)
+    return file_hash.digest()
+
+
+def write_if_changed(file_path: Union[str, Path], contents: Iterable[str]) -> bool:
+    """
+    Writes the contents to the file unless the file already holds them: its modification time is preserved so that
+    the tools watching it (PlantUML renders, build systems) are not triggered.
+    The contents are hashed while being generated and compared with the hash of the existing file.
+    Returns whether the file was written.
+    """
+    content_hash = sha256()
+    chunks: List[str] = []
+    for content in contents:
+        chunks.append(content)
+        content_hash.update(content.encode('utf8'))
+
+    if hash_file(file_path) == content_hash.digest():
+        return False
+
+    with open(file_path, 'w', encoding='utf8', newline='') as output_file:
+        output_file.writelines(chunks)
+    return True
+
+
+def is_file_content(file_path: Union[str, Path], contents: Iterable[str]) -> bool:
+    """
+    Compares the contents with the ones of the file, chunk by chunk: the comparison stops at the first differing chunk,
+    the remaining contents are not generated.
+    """
+    file_path = Path(file_path)
+    if not file_path.is_file():
+        return False
+
+    with open(file_path, 'r', encoding='utf8', newline='') as output_file:
+        for content in contents:
+            if output_file.read(len(content)) != content:
+                return False
+        # the file must not have additional contents
+        return output_file.read(1) == ''
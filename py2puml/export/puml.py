@@ -1,5 +1,9 @@
-from typing import Iterable, List, Dict
+from typing import Collection, Iterable, List, Dict
 
+from py2puml.domain.callgraph import CallGraph
+from py2puml.domain.domainmodel import DomainModel
+from py2puml.domain.importgraph import ImportGraph
+from py2puml.domain.packagesummary import PackageSummary
 from py2puml.domain.umlclass import UmlClass
 from py2puml.domain.umlenum import UmlEnum
 from py2puml.domain.umlfunction import UmlFunction, UmlModule
@@ -14,35 +18,67 @@ PUML_FILE_FOOTER = """footer Generated by //py2puml//
 """
 PUML_FILE_END = """@enduml
 """
-PUML_ITEM_START_TPL = """{item_type} {item_fqn} {{
+PUML_ITEM_START_TPL = """{item_type} {item_fqn}{stereotype} {{
 """
 PUML_ATTR_TPL = """  {attr_name}: {attr_type}{staticity}
 """
 PUML_ITEM_END = """}
 """
-PUML_RELATION_TPL_TEXT = """{source_fqn} {rel_type}-- {target_fqn}: used by {text}
+PUML_RELATION_TPL_TEXT = """{source_fqn} {rel_type}-- {target_fqn}: used by {text}{count}
+"""
+PUML_RELATION_TPL_COUNT = """{source_fqn} {rel_type}-- {target_fqn}: x{count}
 """
 PUML_RELATION_TPL = """{source_fqn} {rel_type}-- {target_fqn}
 """
+# the number of occurrences of an aggregated relation, following its labels
+RELATION_COUNT_TPL = ' (x{count})'
+PUML_PACKAGE_TPL = """package {module_name} {{
+}}
+"""
+PUML_IMPORT_TPL = """{source_module} ..> {target_module}: {weight}
+"""
+PUML_SUMMARY_PACKAGE_TPL = """package {package_name} <<{definitions_count} definitions>> {{
+}}
+"""
+PUML_SUMMARY_RELATION_TPL = """{source_package} {rel_type}-- {target_package}: {count}
+"""
+# the names of the called functions and methods are not split into namespaces
+PUML_CALL_GRAPH_SEPARATOR = """set namespaceSeparator none
+"""
+PUML_CALL_TPL = """{caller_fqn} --> {callee_fqn}: {count}
+"""
 FEATURE_STATIC = ' {static}'
 FEATURE_INSTANCE = ''
+# marks the items which were partially inspected
+INCOMPLETE_STEREOTYPE = ' <<incomplete>>'
+PUML_INCOMPLETE_LEGEND = """legend right
+  <<incomplete>>: partially inspected within the time budget
+endlegend
+"""
 
 
-def to_puml_content(diagram_name: str, uml_items: List[UmlItem], uml_relations: List[UmlRelation], modules_by_name: Dict[str, UmlModule]) -> Iterable[str]:
+def to_puml_content(diagram_name: str, uml_items: List[UmlItem], uml_relations: List[UmlRelation], modules_by_name: Dict[str, UmlModule],
+                    incomplete_fqns: Collection[str] = ()) -> Iterable[str]:
     yield PUML_FILE_START.format(diagram_name=diagram_name)
 
     # exports the domain classes and enums
     for uml_item in uml_items:
         if isinstance(uml_item, UmlEnum):
             uml_enum: UmlEnum = uml_item
-            yield PUML_ITEM_START_TPL.format(item_type='enum', item_fqn=uml_enum.fqn)
+            yield PUML_ITEM_START_TPL.format(
+                item_type='enum',
+                item_fqn=uml_enum.fqn,
+                stereotype=INCOMPLETE_STEREOTYPE if uml_enum.fqn in incomplete_fqns else '',
+            )
             for member in uml_enum.members:
                 yield PUML_ATTR_TPL.format(attr_name=member.name, attr_type=member.value, staticity=FEATURE_STATIC)
             yield PUML_ITEM_END
         elif isinstance(uml_item, UmlClass):
             uml_class: UmlClass = uml_item
             yield PUML_ITEM_START_TPL.format(
-                item_type='abstract class' if uml_item.is_abstract else 'class', item_fqn=uml_class.fqn
+                item_type='abstract class' if uml_item.is_abstract else 'class',
+                item_fqn=uml_class.fqn,
+                stereotype=INCOMPLETE_STEREOTYPE if uml_class.fqn in incomplete_fqns else '',
             )
             for uml_attr in uml_class.attributes:
                 yield PUML_ATTR_TPL.format(
@@ -58,20 +94,82 @@ def to_puml_content(diagram_name: str, uml_items: List[UmlItem], uml_relations:
         else:
             raise TypeError(f'cannot process uml_item of type {uml_item.__class__}')
 
+    # the functions of a module are documented together: the box is incomplete if one of them is
     for uml_module in modules_by_name.values():
-        yield uml_module.represent_as_puml()
+        is_incomplete = any(uml_function.fqn in incomplete_fqns for uml_function in uml_module.functions)
+        yield uml_module.represent_as_puml(INCOMPLETE_STEREOTYPE if is_incomplete else '')
 
 
     # exports the domain relationships between classes and enums
     for uml_relation in uml_relations:
         if uml_relation.text != '':
             yield PUML_RELATION_TPL_TEXT.format(
-                source_fqn=uml_relation.source_fqn, rel_type=uml_relation.type.value, target_fqn=uml_relation.target_fqn, text=uml_relation.text
+                source_fqn=uml_relation.source_fqn, rel_type=uml_relation.type.value, target_fqn=uml_relation.target_fqn, text=uml_relation.text,
+                count=RELATION_COUNT_TPL.format(count=uml_relation.count) if uml_relation.count > 1 else ''
+            )
+        elif uml_relation.count > 1:
+            yield PUML_RELATION_TPL_COUNT.format(
+                source_fqn=uml_relation.source_fqn, rel_type=uml_relation.type.value, target_fqn=uml_relation.target_fqn, count=uml_relation.count
             )
         else:
             yield PUML_RELATION_TPL.format(
                 source_fqn=uml_relation.source_fqn, rel_type=uml_relation.type.value, target_fqn=uml_relation.target_fqn
             )
 
+    if len(incomplete_fqns) > 0:
+        yield PUML_INCOMPLETE_LEGEND
+    yield PUML_FILE_FOOTER
+    yield PUML_FILE_END
+
+
+def to_puml_diagram(domain_model: DomainModel) -> Iterable[str]:
+    return to_puml_content(
+        domain_model.name,
+        domain_model.items,
+        domain_model.relations,
+        domain_model.modules_by_name,
+        domain_model.incomplete_fqns,
+    )
+
+
+def to_puml_import_graph(import_graph: ImportGraph) -> Iterable[str]:
+    """Renders the modules as packages and the imports as dependencies labelled with their weights"""
+    yield PUML_FILE_START.format(diagram_name=import_graph.name)
+    for module_name in import_graph.module_names:
+        yield PUML_PACKAGE_TPL.format(module_name=module_name)
+    for module_import in import_graph.module_imports:
+        yield PUML_IMPORT_TPL.format(
+            source_module=module_import.source_module,
+            target_module=module_import.target_module,
+            weight=module_import.weight,
+        )
+    yield PUML_FILE_FOOTER
+    yield PUML_FILE_END
+
+
+def to_puml_package_summary(package_summary: PackageSummary) -> Iterable[str]:
+    """Renders the packages with their number of definitions, and one relation per type between two packages"""
+    yield PUML_FILE_START.format(diagram_name=package_summary.name)
+    for package_name, definitions_count in package_summary.definitions_counts.items():
+        yield PUML_SUMMARY_PACKAGE_TPL.format(package_name=package_name, definitions_count=definitions_count)
+    for package_relation in package_summary.package_relations:
+        yield PUML_SUMMARY_RELATION_TPL.format(
+            source_package=package_relation.source_package,
+            rel_type=package_relation.type.value,
+            target_package=package_relation.target_package,
+            count=package_relation.count,
+        )
+    yield PUML_FILE_FOOTER
+    yield PUML_FILE_END
+
+
+def to_puml_call_graph(call_graph: CallGraph) -> Iterable[str]:
+    """Renders the calls between the functions and methods, labelled with their counts"""
+    yield PUML_FILE_START.format(diagram_name=call_graph.name)
+    yield PUML_CALL_GRAPH_SEPARATOR
+    for function_call in call_graph.calls:
+        yield PUML_CALL_TPL.format(
+            caller_fqn=function_call.caller_fqn, callee_fqn=function_call.callee_fqn, count=function_call.count
+        )
     yield PUML_FILE_FOOTER
     yield PUML_FILE_END
@@ -0,0 +1,48 @@
+from typing import Dict
+
+from py2puml.domain.umlenum import UmlEnum
+from py2puml.domain.umlfunction import UmlFunction, get_class_name_from_abcmeta
+from py2puml.domain.umlitem import UmlItem
+
+PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+
+
+def detach_uml_function(uml_function: UmlFunction):
+    """
+    Replaces the runtime types of the function signature by their displayed names.
+    The rendered documentation is unchanged.
+    """
+    uml_function.arguments = {
+        argument_name: argument_type if argument_type is None else get_class_name_from_abcmeta(argument_type)
+        for argument_name, argument_type in uml_function.arguments.items()
+    }
+    if isinstance(uml_function.return_type, list):
+        uml_function.return_type = [
+            get_class_name_from_abcmeta(return_type) for return_type in uml_function.return_type
+        ]
+
+
+def detach_uml_enum(uml_enum: UmlEnum):
+    """Replaces the values of the enum members which are not primitive values by their displayed value"""
+    for member in uml_enum.members:
+        if not isinstance(member.value, PRIMITIVE_TYPES):
+            member.value = format(member.value)
+
+
+def detach_uml_item(uml_item: UmlItem):
+    if isinstance(uml_item, UmlFunction):
+        detach_uml_function(uml_item)
+    elif isinstance(uml_item, UmlEnum):
+        detach_uml_enum(uml_item)
+
+
+def detach_domain_items(domain_items_by_fqn: Dict[str, UmlItem]) -> Dict[str, UmlItem]:
+    """
+    Removes the references to runtime objects (classes, enum values) from the inspected items, so that:
+    - they can be serialized without importing the inspected modules when deserializing them
+    - they do not prevent the inspected modules from being garbage-collected
+    """
+    for uml_item in domain_items_by_fqn.values():
+        detach_uml_item(uml_item)
+
+    return domain_items_by_fqn
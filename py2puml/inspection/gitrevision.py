@@ -0,0 +1,76 @@
+from os.path import relpath
+from pathlib import PurePosixPath
+from subprocess import PIPE, run
+from typing import List, Optional, Tuple
+
+from py2puml.domain.domainfilter import DomainFilter
+from py2puml.inspection.inspectstatic import StaticModule
+from py2puml.inspection.staticsources import SOURCE_SUFFIX, STUB_SUFFIX, select_module_files
+
+# type of the file entries listed by 'git ls-tree'
+GIT_BLOB_TYPE = 'blob'
+
+
+def run_git(git_arguments: List[str], stdin: bytes = None) -> bytes:
+    git_process = run(['git', *git_arguments], input=stdin, stdout=PIPE, stderr=PIPE)
+    if git_process.returncode != 0:
+        raise ValueError(
+            f'git {git_arguments[0]} failed ({git_process.returncode}): {git_process.stderr.decode(errors="replace").strip()}'
+        )
+    return git_process.stdout
+
+
+def list_revision_python_files(revision: str, domain_path: str) -> List[Tuple[str, PurePosixPath]]:
+    """
+    Lists the (object id, path relative to the domain path) of the Python files (modules and stubs) of the domain
+    folder at the given revision, without checking the revision out
+    """
+    domain_git_path = PurePosixPath(PurePosixPath(relpath(domain_path)).as_posix())
+    ls_tree_output = run_git(['ls-tree', '-r', '-z', revision, '--', str(domain_git_path)])
+
+    python_files: List[Tuple[str, PurePosixPath]] = []
+    for entry in ls_tree_output.decode().split('\0'):
+        if len(entry) == 0:
+            continue
+        entry_description, _, entry_path = entry.partition('\t')
+        _, entry_type, object_id = entry_description.split(' ')
+        if entry_type == GIT_BLOB_TYPE and entry_path.endswith((SOURCE_SUFFIX, STUB_SUFFIX)):
+            python_files.append((object_id, PurePosixPath(entry_path).relative_to(domain_git_path)))
+
+    return python_files
+
+
+def read_git_blobs(object_ids: List[str]) -> List[bytes]:
+    """Reads the contents of the blobs through a single 'git cat-file --batch' process, in the order of the ids"""
+    if len(object_ids) == 0:
+        return []
+    batch_output = run_git(['cat-file', '--batch'], ''.join(f'{object_id}\n' for object_id in object_ids).encode())
+
+    blobs: List[bytes] = []
+    position = 0
+    for object_id in object_ids:
+        header_end = batch_output.index(b'\n', position)
+        # each blob is introduced by a '<object id> <type> <size>' header and followed by a line feed
+        header_parts = batch_output[position:header_end].decode().split(' ')
+        if len(header_parts) != 3:
+            raise ValueError(f'git object {object_id} cannot be read: {" ".join(header_parts)}')
+        blob_size = int(header_parts[2])
+        blobs.append(batch_output[header_end + 1 : header_end + 1 + blob_size])
+        position = header_end + 1 + blob_size + 1
+
+    return blobs
+
+
+def read_revision_modules(
+    domain_path: str, domain_module: str, revision: str, domain_filter: Optional[DomainFilter] = None
+) -> List[StaticModule]:
+    """
+    Returns the sources of the domain modules at the given git revision, preferring their stubs when they exist.
+    The blobs of the modules rejected by the domain filter (except the root package) are not read.
+    """
+    module_files = select_module_files(domain_module, list_revision_python_files(revision, domain_path), domain_filter)
+    blobs = read_git_blobs([module_file.file_key for module_file in module_files])
+    return [
+        StaticModule(name, is_package, blob.decode('utf-8', errors='replace'), is_stub)
+        for (name, is_package, is_stub, _), blob in zip(module_files, blobs)
+    ]
@@ -0,0 +1,164 @@
+from ast import parse
+from importlib import import_module
+from inspect import getattr_static, getsource, isclass, isfunction, ismodule
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from py2puml.domain.callgraph import CallGraph, FunctionCall
+from py2puml.domain.domainmodel import DomainModel
+from py2puml.domain.umlclass import UmlClass
+from py2puml.domain.umlfunction import UmlFunction
+from py2puml.domain.umlrelation import RelType, UmlRelation
+from py2puml.parsing.astvisitors import CallsCollector
+
+# returned by getattr_static when an attribute is missing
+MISSING_ATTRIBUTE = object()
+
+
+def get_callable_fqn(definition: Any) -> Optional[str]:
+    """Returns the fully-qualified name of a function, a class or a static or class method, None otherwise"""
+    if isinstance(definition, (staticmethod, classmethod)):
+        definition = definition.__func__
+    if not (isfunction(definition) or isclass(definition)):
+        return None
+    qualname: str = getattr(definition, '__qualname__', '')
+    # functions and classes defined in functions cannot be referenced
+    if '<locals>' in qualname:
+        return None
+
+    return f'{definition.__module__}.{qualname}'
+
+
+def resolve_call_target(
+    module: ModuleType, self_class_qualname: Optional[str], attribute_chain: Tuple[str, ...]
+) -> Optional[str]:
+    """
+    Resolves the called attribute chain with the definitions of the module: 'self.method' starts from the class of the
+    method, 'name.attribute' from the module namespace. The attributes are looked up statically (without triggering
+    descriptors nor module-level instance properties) and only through modules and classes, following the
+    method resolution order of the classes.
+    The calls through instance attributes ('self.pricer.price()') or local variables are not resolved: the types of
+    the instances are not known without running the code.
+    """
+    if self_class_qualname is None:
+        looked_up_names = attribute_chain
+    else:
+        looked_up_names = tuple(self_class_qualname.split('.')) + attribute_chain[1:]
+    target = module
+    for attribute_name in looked_up_names:
+        if not (ismodule(target) or isclass(target)):
+            return None
+        target = getattr_static(target, attribute_name, MISSING_ATTRIBUTE)
+        if target is MISSING_ATTRIBUTE:
+            return None
+
+    return get_callable_fqn(target)
+
+
+def get_domain_callee_fqn(callable_fqn: Optional[str], domain_model: DomainModel) -> Optional[str]:
+    """Returns the fqn if it is a function, a class or a class method of the domain, using the index of the items"""
+    if callable_fqn is None:
+        return None
+    if callable_fqn in domain_model.items_by_fqn:
+        return callable_fqn
+    owner_item = domain_model.items_by_fqn.get(callable_fqn.rpartition('.')[0])
+    if isinstance(owner_item, UmlClass):
+        return callable_fqn
+    return None
+
+
+def inspect_module_calls(module: ModuleType, domain_model: DomainModel, calls_counts: Dict[Tuple[str, str], int]):
+    try:
+        module_source = getsource(module)
+    except (OSError, TypeError):
+        # modules without source code (compiled extensions, empty modules) are skipped
+        return
+
+    calls_collector = CallsCollector()
+    calls_collector.visit(parse(module_source))
+    # call sites targeting the same attribute chain are resolved once
+    callee_fqns_by_target: Dict[Tuple[Optional[str], Tuple[str, ...]], Optional[str]] = {}
+    for (caller_qualname, self_class_qualname, attribute_chain), count in calls_collector.calls_counts.items():
+        call_target = (self_class_qualname, attribute_chain)
+        if call_target not in callee_fqns_by_target:
+            callee_fqns_by_target[call_target] = get_domain_callee_fqn(
+                resolve_call_target(module, self_class_qualname, attribute_chain), domain_model
+            )
+        callee_fqn = callee_fqns_by_target[call_target]
+        if callee_fqn is not None:
+            caller_fqn = f'{module.__name__}.{caller_qualname}' if caller_qualname else module.__name__
+            calls_counts[caller_fqn, callee_fqn] = calls_counts.get((caller_fqn, callee_fqn), 0) + count
+
+
+def inspect_calls(domain_model: DomainModel) -> CallGraph:
+    """
+    Builds the call graph of the inspected domain: the calls made in the source of each domain module are resolved
+    to the functions, classes (instantiations) and methods of the domain, the calls being counted per edge.
+    The calls made through instance attributes or variables are missing (see resolve_call_target).
+    """
+    calls_counts: Dict[Tuple[str, str], int] = {}
+    for module_name in domain_model.modules_by_name:
+        inspect_module_calls(import_module(module_name), domain_model, calls_counts)
+
+    return CallGraph(
+        domain_model.name,
+        [FunctionCall(caller_fqn, callee_fqn, count) for (caller_fqn, callee_fqn), count in calls_counts.items()],
+    )
+
+
+def get_call_node_fqn(callable_fqn: str, domain_model: DomainModel) -> Optional[str]:
+    """Returns the fqn of the diagram element documenting the callable: its class, or the functions of its module"""
+    uml_item = domain_model.items_by_fqn.get(callable_fqn)
+    if isinstance(uml_item, UmlFunction):
+        return f'{uml_item.module}.Methods'
+    if uml_item is not None:
+        return callable_fqn
+    owner_fqn = callable_fqn.rpartition('.')[0]
+    if isinstance(domain_model.items_by_fqn.get(owner_fqn), UmlClass):
+        return owner_fqn
+    # calls made in the body of a module
+    return None
+
+
+def list_base_class_fqns(class_fqn: str, parent_fqns_by_child: Dict[str, List[str]]) -> Set[str]:
+    """Returns the fqns of the direct and indirect base classes of the class, given the parents of the domain classes"""
+    base_class_fqns: Set[str] = set()
+    class_fqns_to_visit: List[str] = [class_fqn]
+    while class_fqns_to_visit:
+        for parent_fqn in parent_fqns_by_child.get(class_fqns_to_visit.pop(), ()):
+            if parent_fqn not in base_class_fqns:
+                base_class_fqns.add(parent_fqn)
+                class_fqns_to_visit.append(parent_fqn)
+
+    return base_class_fqns
+
+
+def call_dependency_relations(call_graph: CallGraph, domain_model: DomainModel) -> List[UmlRelation]:
+    """
+    Converts the calls into dependency relations between the classes and the module functions of the class diagram,
+    labelled with the names of the calling functions.
+    The calls of inherited methods are not converted: the inheritance relation already links the class to its base
+    classes.
+    """
+    # the inheritance relations go from the parent class to the child class
+    parent_fqns_by_child: Dict[str, List[str]] = {}
+    for uml_relation in domain_model.relations_by_type.get(RelType.INHERITANCE, ()):
+        parent_fqns_by_child.setdefault(uml_relation.target_fqn, []).append(uml_relation.source_fqn)
+    base_class_fqns_by_class: Dict[str, Set[str]] = {}
+
+    caller_names_by_edge: Dict[Tuple[str, str], Dict[str, None]] = {}
+    for function_call in call_graph.calls:
+        source_fqn = get_call_node_fqn(function_call.caller_fqn, domain_model)
+        target_fqn = get_call_node_fqn(function_call.callee_fqn, domain_model)
+        if source_fqn is None or target_fqn is None or source_fqn == target_fqn:
+            continue
+        if source_fqn not in base_class_fqns_by_class:
+            base_class_fqns_by_class[source_fqn] = list_base_class_fqns(source_fqn, parent_fqns_by_child)
+        if target_fqn not in base_class_fqns_by_class[source_fqn]:
+            caller_name = function_call.caller_fqn.rpartition('.')[2]
+            caller_names_by_edge.setdefault((source_fqn, target_fqn), {})[caller_name] = None
+
+    return [
+        UmlRelation(source_fqn, target_fqn, RelType.DEPENDENCY, ', '.join(caller_names))
+        for (source_fqn, target_fqn), caller_names in caller_names_by_edge.items()
+    ]
@@ -3,11 +3,14 @@ from ast import AST, parse
 from importlib import import_module
 from inspect import getsource, isabstract, signature
 from re import compile as re_compile
-from typing import Dict, List, Type
+from typing import Dict, List, Tuple, Type
 
-from py2puml.domain.umlclass import UmlAttribute, UmlClass
+from py2puml.domain.inspectionprofile import FULL_PROFILE, InspectionProfile
+from py2puml.domain.umlclass import UmlAttribute, UmlClass, UmlMethod
 from py2puml.domain.umlitem import UmlItem
 from py2puml.domain.umlrelation import RelType, UmlRelation
+from py2puml.inspection.inspectcode import inspect_code_constructor, inspect_code_methods
+from py2puml.inspection.inspectsignature import inspect_reflected_methods, is_extension_type
 from py2puml.parsing.astvisitors import ClassVisitor, shorten_compound_type_annotation
 from py2puml.parsing.moduleresolver import ModuleResolver
 from py2puml.parsing.parseclassconstructor import parse_class_constructor
@@ -24,6 +27,19 @@ def handle_inheritance_relation(
             domain_relations.append(UmlRelation(base_type_fqn, class_fqn, RelType.INHERITANCE))
 
 
+def add_uml_class(class_type: Type, class_type_fqn: str, domain_items_by_fqn: Dict[str, UmlItem]) -> UmlClass:
+    """Adds the box of the class, without attributes nor methods"""
+    uml_class = UmlClass(
+        name=class_type.__name__,
+        fqn=class_type_fqn,
+        attributes=[],
+        is_abstract=isabstract(class_type),
+        methods=[],
+    )
+    domain_items_by_fqn[class_type_fqn] = uml_class
+    return uml_class
+
+
 def inspect_static_attributes(
     class_type: Type,
     class_type_fqn: str,
@@ -37,15 +53,8 @@ def inspect_static_attributes(
     - of its static attributes from the class annotations (type and relation)
     """
     # defines the class being inspected
-    definition_attrs: List[UmlAttribute] = []
-    uml_class = UmlClass(
-        name=class_type.__name__,
-        fqn=class_type_fqn,
-        attributes=definition_attrs,
-        is_abstract=isabstract(class_type),
-        methods=[],
-    )
-    domain_items_by_fqn[class_type_fqn] = uml_class
+    uml_class = add_uml_class(class_type, class_type_fqn, domain_items_by_fqn)
+    definition_attrs: List[UmlAttribute] = uml_class.attributes
     # investigate_domain_definition(class_type)
 
     type_annotations = getattr(class_type, '__annotations__', None)
@@ -111,28 +120,21 @@ def resolve_type_fqn(type_hint: str, domain_items_by_fqn: Dict[str, UmlClass]) -
     # Return None if no match is found
     return None
 
-def handle_methods_dependencies(
-    definition_methods: List,
-    class_type: Type,
+def add_methods_dependencies(
+    uml_methods: List[UmlMethod],
+    class_type_fqn: str,
     root_module_name: str,
     domain_items_by_fqn: Dict[str, UmlItem],
     domain_relations: List[UmlRelation],
 ):
-    print(f'inspecting {class_type.__name__} from {class_type.__module__}')
-    class_source: str = getsource(class_type)
-    class_ast: AST = parse(class_source)
-    visitor = ClassVisitor(class_type, root_module_name)
-    visitor.visit(class_ast)
-    for method in visitor.uml_methods:
+    """Adds the dependencies of the class towards the domain types of the arguments and return types of its methods"""
+    for method in uml_methods:
         if "__init__" in method.name:
             continue
         if len(method.arguments) == 1:
             ## TODO: also exclude non class without arguments
             continue
 
-            # Fully qualified name of the current class
-        class_type_fqn = f'{class_type.__module__}.{class_type.__name__}'
-
         for param_name, param_type in method.arguments.items():
             if param_type:
                 # If param_type is a string or custom representation, resolve it to an FQN
@@ -177,6 +179,52 @@ def handle_methods_dependencies(
                     domain_relations.append(UmlRelation(class_type_fqn, return_fqn, RelType.DEPENDENCY))
 
 
+def get_constructor_attributes(
+    class_type: Type, class_type_fqn: str, root_module_name: str
+) -> Tuple[List[UmlAttribute], Dict[str, UmlRelation]]:
+    """Parses the instance attributes from the constructor source, or scans its bytecode without source"""
+    try:
+        return parse_class_constructor(class_type, class_type_fqn, root_module_name)
+    except (OSError, TypeError):
+        # modules compiled without their source (.pyc files only)
+        return inspect_code_constructor(class_type, class_type_fqn, root_module_name)
+
+
+def get_class_methods(class_type: Type, root_module_name: str) -> List[UmlMethod]:
+    """
+    Parses the methods of the class from its source, or reads them from their code objects without source.
+    The methods of the compiled classes (C extensions, Cython) are documented from their signatures.
+    """
+    if is_extension_type(class_type):
+        return inspect_reflected_methods(class_type)
+    try:
+        class_source: str = getsource(class_type)
+    except (OSError, TypeError):
+        # modules compiled without their source (.pyc files only)
+        return inspect_code_methods(class_type)
+    class_ast: AST = parse(class_source)
+    visitor = ClassVisitor(class_type, root_module_name)
+    visitor.visit(class_ast)
+    return visitor.uml_methods
+
+
+def handle_methods_dependencies(
+    definition_methods: List,
+    class_type: Type,
+    root_module_name: str,
+    domain_items_by_fqn: Dict[str, UmlItem],
+    domain_relations: List[UmlRelation],
+):
+    print(f'inspecting {class_type.__name__} from {class_type.__module__}')
+    add_methods_dependencies(
+        get_class_methods(class_type, root_module_name),
+        f'{class_type.__module__}.{class_type.__name__}',
+        root_module_name,
+        domain_items_by_fqn,
+        domain_relations,
+    )
+
+
 def inspect_class_methods(
     definition_methods: List,
     class_type: Type,
@@ -185,11 +233,7 @@ def inspect_class_methods(
     domain_relations: List[UmlRelation],
 ):
     print(f'inspecting {class_type.__name__} from {class_type.__module__}')
-    class_source: str = getsource(class_type)
-    class_ast: AST = parse(class_source)
-    visitor = ClassVisitor(class_type, root_module_name)
-    visitor.visit(class_ast)
-    definition_methods.extend(visitor.uml_methods)
+    definition_methods.extend(get_class_methods(class_type, root_module_name))
 
 
 
@@ -212,15 +256,20 @@ def inspect_class_type(
     root_module_name: str,
     domain_items_by_fqn: Dict[str, UmlItem],
     domain_relations: List[UmlRelation],
+    inspection_profile: InspectionProfile = FULL_PROFILE,
 ):
-    attributes = inspect_static_attributes(
-        class_type, class_type_fqn, root_module_name, domain_items_by_fqn, domain_relations
-    )
-    instance_attributes, compositions = parse_class_constructor(class_type, class_type_fqn, root_module_name)
-    attributes.extend(instance_attributes)
-    domain_relations.extend(compositions.values())
-
-    inspect_class_methods(domain_items_by_fqn[class_type_fqn].methods, class_type, root_module_name, domain_items_by_fqn, domain_relations)
+    if inspection_profile.attributes:
+        attributes = inspect_static_attributes(
+            class_type, class_type_fqn, root_module_name, domain_items_by_fqn, domain_relations
+        )
+        instance_attributes, compositions = get_constructor_attributes(class_type, class_type_fqn, root_module_name)
+        attributes.extend(instance_attributes)
+        domain_relations.extend(compositions.values())
+    else:
+        add_uml_class(class_type, class_type_fqn, domain_items_by_fqn)
+
+    if inspection_profile.methods:
+        inspect_class_methods(domain_items_by_fqn[class_type_fqn].methods, class_type, root_module_name, domain_items_by_fqn, domain_relations)
 
     handle_inheritance_relation(class_type, class_type_fqn, root_module_name, domain_relations)
 
@@ -233,10 +282,14 @@ def inspect_dataclass_type(
     root_module_name: str,
     domain_items_by_fqn: Dict[str, UmlItem],
     domain_relations: List[UmlRelation],
+    inspection_profile: InspectionProfile = FULL_PROFILE,
 ):
-    for attribute in inspect_static_attributes(
-        class_type, class_type_fqn, root_module_name, domain_items_by_fqn, domain_relations
-    ):
-        attribute.static = False
+    if inspection_profile.attributes:
+        for attribute in inspect_static_attributes(
+            class_type, class_type_fqn, root_module_name, domain_items_by_fqn, domain_relations
+        ):
+            attribute.static = False
+    else:
+        add_uml_class(class_type, class_type_fqn, domain_items_by_fqn)
 
     handle_inheritance_relation(class_type, class_type_fqn, root_module_name, domain_relations)
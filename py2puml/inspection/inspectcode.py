@@ -0,0 +1,129 @@
+from dis import get_instructions
+from inspect import CO_VARARGS, CO_VARKEYWORDS, unwrap
+from re import compile as re_compile
+from types import CodeType, FunctionType
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, get_args
+
+from py2puml.domain.umlclass import UmlAttribute, UmlMethod
+from py2puml.domain.umlrelation import RelType, UmlRelation
+
+# 'package.module.Type' -> 'Type' in the representation of the compound annotations
+QUALIFIED_NAME_PATTERN = re_compile(r'\b(?:\w+\.)+(\w+)')
+
+# instructions loading the local variables: 'self.x = x' is compiled as 'LOAD_FAST x; LOAD_FAST self; STORE_ATTR x'
+# until Python 3.12, the loads are merged in a 'LOAD_FAST_LOAD_FAST (x, self)' instruction since Python 3.13
+LOAD_FAST_OPNAMES = ('LOAD_FAST', 'LOAD_FAST_CHECK', 'LOAD_FAST_BORROW')
+LOAD_FAST_PAIR_OPNAMES = ('LOAD_FAST_LOAD_FAST', 'LOAD_FAST_BORROW_LOAD_FAST_BORROW')
+
+
+def get_annotation_type_name(annotation: Any) -> str:
+    """Short representation of a runtime annotation: 'Type' for classes, 'List[Type]' for compound annotations"""
+    if isinstance(annotation, type) and len(get_args(annotation)) == 0:
+        return annotation.__name__
+    if isinstance(annotation, str):
+        return annotation
+    return QUALIFIED_NAME_PATTERN.sub(r'\1', str(annotation))
+
+
+def get_annotation_domain_fqns(annotation: Any, root_module_name: str) -> List[str]:
+    """Fully-qualified names of the domain classes involved in a runtime annotation"""
+    if isinstance(annotation, type) and len(get_args(annotation)) == 0:
+        annotation_fqn = f'{annotation.__module__}.{annotation.__qualname__}'
+        return [annotation_fqn] if annotation_fqn.startswith(root_module_name) else []
+    return [
+        domain_fqn
+        for annotation_argument in get_args(annotation)
+        for domain_fqn in get_annotation_domain_fqns(annotation_argument, root_module_name)
+    ]
+
+
+def get_code_argument_names(code: CodeType) -> List[str]:
+    """The names of the arguments of a code object, which are the first local variables"""
+    arguments_count = code.co_argcount + code.co_kwonlyargcount
+    arguments_count += bool(code.co_flags & CO_VARARGS) + bool(code.co_flags & CO_VARKEYWORDS)
+    return list(code.co_varnames[:arguments_count])
+
+
+def iter_class_functions(class_type: Type) -> Iterable[Tuple[FunctionType, bool, bool]]:
+    """Yields the (function, is_static, is_class) methods defined by the class, in the order of their definition"""
+    for class_attribute in vars(class_type).values():
+        is_static, is_class = isinstance(class_attribute, staticmethod), isinstance(class_attribute, classmethod)
+        if is_static or is_class:
+            class_attribute = class_attribute.__func__
+        elif isinstance(class_attribute, property):
+            class_attribute = class_attribute.fget
+        function = unwrap(class_attribute)
+        if isinstance(function, FunctionType):
+            yield function, is_static, is_class
+
+
+def inspect_code_method(function: FunctionType, is_static: bool = False, is_class: bool = False) -> UmlMethod:
+    """Documents a method from its code object and its runtime annotations, without reading its source"""
+    annotations: Dict[str, Any] = getattr(function, '__annotations__', {})
+    uml_method = UmlMethod(name=function.__name__, is_static=is_static, is_class=is_class)
+    for argument_name in get_code_argument_names(function.__code__):
+        argument_annotation = annotations.get(argument_name)
+        uml_method.arguments[argument_name] = (
+            None if argument_annotation is None else get_annotation_type_name(argument_annotation)
+        )
+    if 'return' in annotations:
+        uml_method.return_type = get_annotation_type_name(annotations['return'])
+
+    return uml_method
+
+
+def inspect_code_methods(class_type: Type) -> List[UmlMethod]:
+    """Documents the methods defined by the class from their code objects (no source file is read)"""
+    return [
+        inspect_code_method(function, is_static, is_class)
+        for function, is_static, is_class in iter_class_functions(class_type)
+    ]
+
+
+def iter_self_stores(constructor_code: CodeType) -> Iterable[Tuple[str, Optional[str]]]:
+    """
+    Scans the bytecode of the constructor for the attributes stored on the instance ('self.x = ...').
+    Yields the name of each attribute and the name of the local variable assigned to it, if it is a plain variable
+    """
+    self_name = constructor_code.co_varnames[0] if constructor_code.co_argcount > 0 else None
+    value_instruction, owner_instruction = None, None
+    for instruction in get_instructions(constructor_code):
+        if instruction.opname == 'STORE_ATTR' and owner_instruction is not None:
+            if owner_instruction.opname in LOAD_FAST_OPNAMES and owner_instruction.argval == self_name:
+                is_variable = value_instruction is not None and value_instruction.opname in LOAD_FAST_OPNAMES
+                yield instruction.argval, value_instruction.argval if is_variable else None
+            elif owner_instruction.opname in LOAD_FAST_PAIR_OPNAMES and owner_instruction.argval[1] == self_name:
+                yield instruction.argval, owner_instruction.argval[0]
+        value_instruction, owner_instruction = owner_instruction, instruction
+
+
+def inspect_code_constructor(
+    class_type: Type, class_fqn: str, root_module_name: str
+) -> Tuple[List[UmlAttribute], Dict[str, UmlRelation]]:
+    """
+    Documents the instance attributes assigned in the constructor of the class by scanning its bytecode.
+    The type of an attribute is the annotation of the constructor argument assigned to it, if any.
+    """
+    constructor = vars(class_type).get('__init__')
+    if not isinstance(constructor, FunctionType):
+        return [], {}
+    constructor = unwrap(constructor)
+
+    annotations: Dict[str, Any] = getattr(constructor, '__annotations__', {})
+    uml_attributes: Dict[str, UmlAttribute] = {}
+    uml_relations_by_target_fqn: Dict[str, UmlRelation] = {}
+    for attribute_name, variable_name in iter_self_stores(constructor.__code__):
+        if attribute_name in uml_attributes:
+            continue
+        variable_annotation = annotations.get(variable_name)
+        if variable_annotation is None:
+            uml_attributes[attribute_name] = UmlAttribute(attribute_name, None, False)
+            continue
+
+        uml_attributes[attribute_name] = UmlAttribute(
+            attribute_name, get_annotation_type_name(variable_annotation), False
+        )
+        for target_fqn in get_annotation_domain_fqns(variable_annotation, root_module_name):
+            uml_relations_by_target_fqn.setdefault(target_fqn, UmlRelation(class_fqn, target_fqn, RelType.COMPOSITION))
+
+    return list(uml_attributes.values()), uml_relations_by_target_fqn
@@ -0,0 +1,101 @@
+from ast import parse
+from typing import Dict, List, Optional, Tuple
+
+from py2puml.domain.domainfilter import DomainFilter
+from py2puml.domain.importgraph import ImportGraph, ModuleImport
+from py2puml.inspection.inspectstatic import StaticModule
+from py2puml.inspection.staticsources import read_static_modules
+from py2puml.parsing.astvisitors import ImportsCollector
+
+
+def list_namespace_package_names(module_names: List[str], root_module_name: str) -> List[str]:
+    """
+    Returns the names of the implicit namespace packages (folders without __init__.py file) of the domain: the root
+    module and the parent packages of the domain modules which are not modules themselves
+    """
+    known_module_names = set(module_names)
+    namespace_package_names: Dict[str, None] = {}
+    for module_name in [root_module_name, *module_names]:
+        package_name = module_name if module_name == root_module_name else module_name.rpartition('.')[0]
+        while (
+            package_name == root_module_name or package_name.startswith(f'{root_module_name}.')
+        ) and package_name not in known_module_names:
+            namespace_package_names[package_name] = None
+            package_name = package_name.rpartition('.')[0]
+
+    return list(namespace_package_names)
+
+
+def parse_imported_names(static_module: StaticModule) -> List[Tuple[str, str]]:
+    imports_collector = ImportsCollector(static_module.name, static_module.is_package)
+    imports_collector.visit(parse(static_module.source, static_module.name))
+
+    return imports_collector.imported_names
+
+
+def resolve_imported_module(imported_module: str, imported_name: Optional[str], domain_module_names: Dict[str, None]):
+    """
+    Returns the domain module targeted by an import: the imported name itself when it is a submodule
+    ('from package import module'), the imported module otherwise. None is returned for modules outside the domain.
+    """
+    if imported_name is not None and f'{imported_module}.{imported_name}' in domain_module_names:
+        return f'{imported_module}.{imported_name}'
+    if imported_module in domain_module_names:
+        return imported_module
+    return None
+
+
+def collapse_module_name(module_name: str, root_module_name: str, depth: Optional[int]) -> str:
+    """Truncates the module name to the given number of package levels below its root module"""
+    if depth is None:
+        return module_name
+    root_levels = root_module_name.count('.') + 1
+    return '.'.join(module_name.split('.')[: root_levels + depth])
+
+
+def inspect_imports(
+    domain_roots: List[Tuple[str, str]], depth: Optional[int] = None, domain_filter: Optional[DomainFilter] = None
+) -> ImportGraph:
+    """
+    Builds the import graph between the modules of the domain roots by parsing their sources: nothing is imported.
+    The modules are read like in the static inspection (see read_static_modules): from the working tree or an archive,
+    their stub being parsed when they have one, the modules rejected by the domain filter being neither read nor
+    parsed. The implicit namespace packages are nodes of the graph.
+    With a depth, the modules are collapsed into their packages at this depth below their root module,
+    the weights of the merged imports being summed and the imports within a collapsed package being ignored.
+    """
+    static_modules_by_root: List[Tuple[str, List[StaticModule]]] = [
+        (domain_module, read_static_modules(domain_path, domain_module, domain_filter))
+        for domain_path, domain_module in domain_roots
+    ]
+    root_module_names_by_module: Dict[str, str] = {}
+    for root_module_name, static_modules in static_modules_by_root:
+        module_names = [static_module.name for static_module in static_modules]
+        # the modules of each root are listed in the alphabetical order: each package precedes its modules
+        for module_name in sorted(module_names + list_namespace_package_names(module_names, root_module_name)):
+            root_module_names_by_module.setdefault(module_name, root_module_name)
+    # a dict is used as an ordered set
+    domain_module_names: Dict[str, None] = dict.fromkeys(root_module_names_by_module)
+
+    def collapse(module_name: str) -> str:
+        return collapse_module_name(module_name, root_module_names_by_module[module_name], depth)
+
+    node_names: Dict[str, None] = {collapse(module_name): None for module_name in domain_module_names}
+    weights_by_edge: Dict[Tuple[str, str], int] = {}
+    for _, static_modules in static_modules_by_root:
+        for static_module in static_modules:
+            source_node = collapse(static_module.name)
+            for imported_module, imported_name in parse_imported_names(static_module):
+                target_module = resolve_imported_module(imported_module, imported_name, domain_module_names)
+                if target_module is None:
+                    continue
+                target_node = collapse(target_module)
+                if target_node != source_node:
+                    edge = (source_node, target_node)
+                    weights_by_edge[edge] = weights_by_edge.get(edge, 0) + 1
+
+    return ImportGraph(
+        domain_roots[0][1],
+        list(node_names.keys()),
+        [ModuleImport(source, target, weight) for (source, target), weight in weights_by_edge.items()],
+    )
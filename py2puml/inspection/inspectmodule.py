@@ -1,10 +1,12 @@
 import types
 from dataclasses import is_dataclass
 from enum import Enum
-from inspect import getmembers, isclass, ismethod, isfunction, signature
+from inspect import isclass, ismethod, isfunction, signature
 from types import ModuleType
-from typing import Dict, Iterable, List, Type, get_args, Union, get_origin
+from typing import Collection, Dict, Iterable, List, Optional, Set, Type, get_args, Union, get_origin
 
+from py2puml.domain.domainfilter import DomainFilter
+from py2puml.domain.inspectionprofile import FULL_PROFILE, InspectionProfile
 from py2puml.domain.umlclass import UmlMethod
 from py2puml.domain.umlfunction import UmlFunction, UmlModule
 from py2puml.domain.umlitem import UmlItem
@@ -15,25 +17,48 @@ from py2puml.inspection.inspectenum import inspect_enum_type
 from py2puml.inspection.inspectnamedtuple import inspect_namedtuple_type
 
 
-def filter_domain_definitions(module: ModuleType, root_module_name: str) -> Iterable[Type]:
+def filter_domain_definitions(
+    module: ModuleType,
+    root_module_name: str,
+    inspected_module_names: Optional[Collection[str]] = None,
+    domain_filter: Optional[DomainFilter] = None,
+) -> Iterable[Type]:
+    """
+    Yields the classes and functions of the domain bound in the module, each definition once.
+    The owner module of a definition is read from its __module__ attribute: the members of the classes are not
+    evaluated, so that the discovery time does not depend on the size of the classes.
+    When the names of all the inspected modules are given (the owner-module index), a definition imported from
+    another inspected module is skipped: it is discovered in its defining module only.
+    The definitions (and the modules owning them) rejected by the domain filter are skipped.
+    """
+    module_name = module.__name__
+    yielded_definition_ids: Set[int] = set()
     for definition_key in dir(module):
         definition_type = getattr(module, definition_key)
-        if isclass(definition_type):
-            definition_members = getmembers(definition_type)
-            definition_module_member = next(
-                (
-                    member
-                    for member in definition_members
-                    # ensures that the type belongs to the module being parsed
-                    if member[0] == '__module__' and member[1].startswith(root_module_name)
-                ),
-                None,
-            )
-            if definition_module_member is not None:
-                yield definition_type
-        if isfunction(definition_type) and definition_type.__module__.startswith(root_module_name):
+        if not (isclass(definition_type) or isfunction(definition_type)):
+            continue
+
+        # ensures that the type belongs to the domain being parsed
+        owner_module_name = getattr(definition_type, '__module__', None)
+        if not isinstance(owner_module_name, str) or not owner_module_name.startswith(root_module_name):
+            continue
+        if (
+            owner_module_name != module_name
+            and inspected_module_names is not None
+            and owner_module_name in inspected_module_names
+        ):
+            continue
+        if domain_filter is not None and not domain_filter.accepts_definition(
+            owner_module_name, f'{owner_module_name}.{definition_type.__name__}'
+        ):
+            continue
+
+        # a definition bound to several names in the module (aliases) is yielded once
+        if id(definition_type) not in yielded_definition_ids:
+            yielded_definition_ids.add(id(definition_type))
             yield definition_type
 
+
 def get_type_name(annotation):
     # Handle typing.Union (Python 3.7 - 3.9) and UnionType (Python 3.10+)
     if getattr(annotation, '__origin__', None) is Union or isinstance(annotation, types.UnionType):
@@ -122,8 +147,9 @@ def inspect_function(
 
     # Create UmlFunction instance
     uml_function = UmlFunction(fqn=func_fqn, name=func.__name__, module=func.__module__)
-    domain_items_by_fqn[func_fqn] = uml_function
+    # the function is registered during the first pass only, the second pass links its dependencies
     if firstPass:
+        domain_items_by_fqn[func_fqn] = uml_function
         uml_module.functions.append(uml_function)  # Add function to module
 
     # Parse function signature
@@ -160,30 +186,34 @@ def inspect_function(
             )
 
 def inspect_domain_definition(definition_type: Type, root_module_name: str, domain_items_by_fqn: Dict[str, UmlItem],
-                              domain_relations: List[UmlRelation], uml_module: UmlModule, firstPass=True):
+                              domain_relations: List[UmlRelation], uml_module: UmlModule, firstPass=True,
+                              inspection_profile: InspectionProfile = FULL_PROFILE):
     definition_type_fqn = f'{definition_type.__module__}.{definition_type.__name__}'
     # First pass: Register all classes in domain_items_by_fqn
     if firstPass:
         if definition_type_fqn not in domain_items_by_fqn:
             if isfunction(definition_type):
-                inspect_function(definition_type, root_module_name, domain_items_by_fqn, uml_module, domain_relations, firstPass)
+                if inspection_profile.functions:
+                    inspect_function(definition_type, root_module_name, domain_items_by_fqn, uml_module, domain_relations, firstPass)
             elif issubclass(definition_type, Enum):
                 inspect_enum_type(definition_type, definition_type_fqn, domain_items_by_fqn)
             elif getattr(definition_type, '_fields', None) is not None:
                 inspect_namedtuple_type(definition_type, definition_type_fqn, domain_items_by_fqn)
             elif is_dataclass(definition_type):
                 inspect_dataclass_type(
-                    definition_type, definition_type_fqn, root_module_name, domain_items_by_fqn, domain_relations
+                    definition_type, definition_type_fqn, root_module_name, domain_items_by_fqn, domain_relations,
+                    inspection_profile
                 )
 
             else:
 
                 inspect_class_type(
-                    definition_type, definition_type_fqn, root_module_name, domain_items_by_fqn, domain_relations
+                    definition_type, definition_type_fqn, root_module_name, domain_items_by_fqn, domain_relations,
+                    inspection_profile
                 )
 
 
-    else:
+    elif inspection_profile.dependencies:
 
         if isfunction(definition_type):
             inspect_function(definition_type, root_module_name, domain_items_by_fqn, uml_module, domain_relations, firstPass=False)
@@ -200,12 +230,18 @@ def inspect_domain_definition(definition_type: Type, root_module_name: str, doma
             )
 
 def inspect_module(domain_item_module: ModuleType, root_module_name: str, domain_items_by_fqn: Dict[str, UmlItem],
-                   domain_relations: List[UmlRelation],modules_by_name: Dict[str, UmlModule], firstPass=True):
+                   domain_relations: List[UmlRelation],modules_by_name: Dict[str, UmlModule], firstPass=True,
+                   inspected_module_names: Optional[Collection[str]] = None,
+                   domain_filter: Optional[DomainFilter] = None,
+                   inspection_profile: InspectionProfile = FULL_PROFILE):
     # processes only the definitions declared or imported within the given root module
     module_name = domain_item_module.__name__
     if module_name not in modules_by_name:
         modules_by_name[module_name] = UmlModule(name=module_name)
     uml_module = modules_by_name[module_name]
 
-    for definition_type in filter_domain_definitions(domain_item_module, root_module_name):
-        inspect_domain_definition(definition_type, root_module_name, domain_items_by_fqn, domain_relations,uml_module, firstPass)
+    for definition_type in filter_domain_definitions(
+        domain_item_module, root_module_name, inspected_module_names, domain_filter
+    ):
+        inspect_domain_definition(definition_type, root_module_name, domain_items_by_fqn, domain_relations,uml_module, firstPass,
+                                  inspection_profile)
@@ -1,59 +1,240 @@
+import sys
 from importlib import import_module
-from pkgutil import walk_packages
+from itertools import islice
+from pathlib import Path
+from pkgutil import iter_modules
 from types import ModuleType
-from typing import Dict, List
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
+from py2puml.domain.diagnostic import InspectionDiagnostic
+from py2puml.domain.domainfilter import DomainFilter
+from py2puml.domain.inspectionprofile import FULL_PROFILE, InspectionProfile
 from py2puml.domain.umlfunction import UmlFunction, UmlModule
 from py2puml.domain.umlitem import UmlItem
-from py2puml.domain.umlrelation import UmlRelation
+from py2puml.domain.umlrelation import RelType, UmlRelation
+from py2puml.inspection.detachitems import detach_uml_item
+from py2puml.inspection.inspectimports import inspect_imports
 from py2puml.inspection.inspectmodule import inspect_module
+from py2puml.inspection.inspectworkers import inspect_modules_in_workers
+from py2puml.inspection.releasemodules import release_domain_modules
+
+# the labels of an aggregated relation are truncated after this number of labels
+MAX_RELATION_LABELS = 3
+RELATION_LABELS_SEPARATOR = ', '
+TRUNCATED_LABELS_TPL = '+{count} more'
+
+
+def merge_relation_labels(labels: Iterable[str]) -> str:
+    """Joins the distinct labels of the aggregated relations, the ones beyond MAX_RELATION_LABELS being counted"""
+    distinct_labels = list(dict.fromkeys(labels))
+    if len(distinct_labels) > MAX_RELATION_LABELS:
+        truncated_labels = TRUNCATED_LABELS_TPL.format(count=len(distinct_labels) - MAX_RELATION_LABELS)
+        distinct_labels = distinct_labels[:MAX_RELATION_LABELS] + [truncated_labels]
+    return RELATION_LABELS_SEPARATOR.join(distinct_labels)
+
+
+def aggregate_relations_in_place(domain_relations: List[UmlRelation]):
+    """
+    Merges the relations having the same source, target and type into one relation (at the position of the first one),
+    counting the merged occurrences and labelled with their distinct labels (see merge_relation_labels).
+    The merged relations are not modified (they may be cached by a DomainQuery), the aggregated ones are new and keep
+    all the distinct labels, so that aggregating them again preserves the truncated labels.
+    """
+    relations_by_key: Dict[Tuple[str, str, RelType], List[UmlRelation]] = {}
+    for uml_relation in domain_relations:
+        relations_by_key.setdefault(
+            (uml_relation.source_fqn, uml_relation.target_fqn, uml_relation.type), []
+        ).append(uml_relation)
+
+    aggregated_relations: List[UmlRelation] = []
+    for (source_fqn, target_fqn, rel_type), relations in relations_by_key.items():
+        if len(relations) == 1:
+            aggregated_relations.append(relations[0])
+            continue
+        labels = tuple(dict.fromkeys(label for uml_relation in relations for label in uml_relation.labels))
+        aggregated_relations.append(
+            UmlRelation(
+                source_fqn,
+                target_fqn,
+                rel_type,
+                merge_relation_labels(labels),
+                sum(uml_relation.count for uml_relation in relations),
+                labels,
+            )
+        )
+    domain_relations[:] = aggregated_relations
+
+
+def walk_domain_modules(
+    domain_path: str, domain_module: str, domain_filter: Optional[DomainFilter] = None
+) -> Iterable[str]:
+    """
+    Yields the names of the (non-package) modules found in the given domain path.
+    The subpackages are walked through their folders instead of being imported (as pkgutil.walk_packages does):
+    the subpackages and modules rejected by the domain filter are neither imported nor walked.
+    """
+    for _, name, is_pkg in iter_modules([domain_path], f'{domain_module}.'):
+        if is_pkg:
+            if domain_filter is None or domain_filter.walks_package(name):
+                yield from walk_domain_modules(str(Path(domain_path) / name.rpartition('.')[2]), name, domain_filter)
+        elif domain_filter is None or domain_filter.accepts_module(name):
+            yield name
+
+
+def list_domain_module_names(
+    domain_roots: List[Tuple[str, str]], domain_filter: Optional[DomainFilter] = None
+) -> List[str]:
+    return [
+        module_name
+        for domain_path, domain_module in domain_roots
+        for module_name in walk_domain_modules(domain_path, domain_module, domain_filter)
+    ]
+
+
+def list_last_importers(
+    domain_roots: List[Tuple[str, str]], module_names: List[str], domain_filter: Optional[DomainFilter] = None
+) -> Dict[str, int]:
+    """
+    Returns the index (in the given inspection order) of the last module importing each domain module, directly or
+    through other modules, according to the import statements of their sources (the dynamic imports are not seen)
+    """
+    imported_names_by_module: Dict[str, List[str]] = {}
+    for module_import in inspect_imports(domain_roots, domain_filter=domain_filter).module_imports:
+        imported_names_by_module.setdefault(module_import.source_module, []).append(module_import.target_module)
+
+    last_importers: Dict[str, int] = {}
+    for module_index, module_name in enumerate(module_names):
+        visited_names: Set[str] = {module_name}
+        names_to_visit: List[str] = [module_name]
+        while names_to_visit:
+            visited_name = names_to_visit.pop()
+            last_importers[visited_name] = module_index
+            for imported_name in imported_names_by_module.get(visited_name, ()):
+                if imported_name not in visited_names:
+                    visited_names.add(imported_name)
+                    names_to_visit.append(imported_name)
+
+    return last_importers
+
+
+def release_inspected_modules(
+    root_module_names: Tuple[str, ...], preserved_module_names: Set[str], domain_items_by_fqn: Dict[str, UmlItem],
+    inspected_items_number: int
+):
+    """
+    Once the definitions of a module are captured, detaches the new items from their runtime types
+    and releases the imported domain modules, so that the memory footprint remains bounded.
+    """
+    new_items_number = len(domain_items_by_fqn) - inspected_items_number
+    for uml_item in islice(reversed(domain_items_by_fqn.values()), new_items_number):
+        detach_uml_item(uml_item)
+    release_domain_modules(root_module_names, preserved_module_names)
+
+
+def inspect_packages(
+    domain_roots: List[Tuple[str, str]], domain_items_by_fqn: Dict[str, UmlItem], domain_relations: List[UmlRelation],
+    modules_by_name: Dict[str, UmlModule], diagnostics: Optional[List[InspectionDiagnostic]] = None,
+    workers: int = 0, module_timeout: Optional[float] = None, bounded_memory: bool = False,
+    domain_filter: Optional[DomainFilter] = None, inspection_profile: InspectionProfile = FULL_PROFILE
+):
+    """
+    Inspects several (domain_path, domain_module) roots in one session: the modules of all the roots share the same
+    containers, so that the relations between definitions of different roots are resolved.
+
+    With workers (or a module_timeout), the modules are imported in worker processes: a module which fails, crashes
+    or exceeds the timeout while being imported and inspected is reported in the diagnostics and skipped.
+
+    With bounded_memory, the domain modules imported during the inspection are released once their definitions are
+    captured and once the last module importing them is inspected, so that the shared dependencies are not imported
+    again for each dependent module (they are imported again for the second pass): the peak memory depends on the
+    modules imported together instead of the whole package. The worker processes release the domain modules after
+    each inspected module.
+
+    The modules and definitions rejected by the domain filter are skipped, the excluded subpackages are not imported.
+
+    The stages of the inspection switched off by the inspection profile are skipped: without dependencies, the modules
+    are not imported again for the second pass.
+    """
+    # str.startswith accepts a tuple of prefixes: definitions of any root belong to the inspected domain
+    root_module_names: Tuple[str, ...] = tuple(domain_module for _, domain_module in domain_roots)
+    domain_module_names: List[str] = list_domain_module_names(domain_roots, domain_filter)
+    # owner-module index: a definition imported from an inspected module is discovered in its defining module only
+    inspected_module_names: FrozenSet[str] = frozenset(root_module_names).union(domain_module_names)
+
+    if workers or module_timeout is not None:
+        inspect_modules_in_workers(
+            root_module_names, list(root_module_names) + domain_module_names, domain_module_names, domain_items_by_fqn,
+            domain_relations, modules_by_name, [] if diagnostics is None else diagnostics, workers, module_timeout,
+            bounded_memory, inspected_module_names, domain_filter, inspection_profile
+        )
+        aggregate_relations_in_place(domain_relations)
+        return
+
+    # inspects the package modules first, then their children modules and subpackages
+    for _, domain_module in domain_roots:
+        item_module = import_module(domain_module)
+        inspect_module(
+            item_module, root_module_names, domain_items_by_fqn, domain_relations, modules_by_name,
+            inspected_module_names=inspected_module_names, domain_filter=domain_filter,
+            inspection_profile=inspection_profile
+        )
+
+    preserved_module_names: Set[str] = set(sys.modules)
+    last_importers: Dict[str, int] = (
+        list_last_importers(domain_roots, domain_module_names, domain_filter) if bounded_memory else {}
+    )
+
+    def still_imported_module_names(module_index: int) -> Set[str]:
+        """The modules imported beforehand and the ones imported by the modules inspected later in the pass"""
+        return preserved_module_names.union(
+            module_name for module_name, last_importer in last_importers.items() if last_importer > module_index
+        )
+
+    for module_index, name in enumerate(domain_module_names):
+        inspected_items_number = len(domain_items_by_fqn)
+        domain_item_module: ModuleType = import_module(name)
+        inspect_module(
+            domain_item_module, root_module_names, domain_items_by_fqn, domain_relations, modules_by_name,
+            inspected_module_names=inspected_module_names, domain_filter=domain_filter,
+            inspection_profile=inspection_profile
+        )
+        if bounded_memory:
+            del domain_item_module
+            release_inspected_modules(
+                root_module_names, still_imported_module_names(module_index), domain_items_by_fqn,
+                inspected_items_number
+            )
+
+    # the second pass links the dependencies, if the profile inspects them
+    second_pass_module_names: List[str] = domain_module_names if inspection_profile.dependencies else []
+    for module_index, name in enumerate(second_pass_module_names):
+        domain_item_module: ModuleType = import_module(name)
+        inspect_module(
+            domain_item_module, root_module_names, domain_items_by_fqn, domain_relations, modules_by_name,
+            firstPass=False, inspected_module_names=inspected_module_names, domain_filter=domain_filter
+        )
+        if bounded_memory:
+            del domain_item_module
+            release_domain_modules(root_module_names, still_imported_module_names(module_index))
+
+    for _, domain_module in domain_roots:
+        item_module = import_module(f'{domain_module}', f'{domain_module}.')
+        inspect_module(
+            item_module, root_module_names, domain_items_by_fqn, domain_relations, modules_by_name,
+            inspected_module_names=inspected_module_names, domain_filter=domain_filter,
+            inspection_profile=inspection_profile
+        )
+
+    aggregate_relations_in_place(domain_relations)
 
 
-def remove_duplicate_relations_in_place(domain_relations):
-    # Use a set to track unique relation tuples
-    unique_relations_set = set()
-
-    # Modify domain_relations in place
-    i = 0
-    while i < len(domain_relations):
-        relation = domain_relations[i]
-        # Create a tuple of the relation's essential properties
-        relation_tuple = (relation.source_fqn, relation.target_fqn, relation.type)
-
-        if relation_tuple in unique_relations_set:
-            # If the relation is a duplicate, remove it
-            domain_relations.pop(i)
-        else:
-            # Otherwise, add it to the set and move to the next item
-            unique_relations_set.add(relation_tuple)
-            i += 1
 def inspect_package(
     domain_path: str, domain_module: str, domain_items_by_fqn: Dict[str, UmlItem], domain_relations: List[UmlRelation],
-    modules_by_name: Dict[str, UmlModule]
+    modules_by_name: Dict[str, UmlModule], diagnostics: Optional[List[InspectionDiagnostic]] = None,
+    workers: int = 0, module_timeout: Optional[float] = None, bounded_memory: bool = False,
+    domain_filter: Optional[DomainFilter] = None, inspection_profile: InspectionProfile = FULL_PROFILE
 ):
-    # inspects the package module first, then its children modules and subpackages
-    item_module = import_module(domain_module)
-    inspect_module(item_module, domain_module, domain_items_by_fqn, domain_relations, modules_by_name)
-
-    for _, name, is_pkg in walk_packages([domain_path], f'{domain_module}.'):
-        if not is_pkg:
-            domain_item_module: ModuleType = import_module(name)
-            inspect_module(domain_item_module, domain_module, domain_items_by_fqn, domain_relations, modules_by_name)
-
-    for _, name, is_pkg in walk_packages([domain_path], f'{domain_module}.'):
-        if not is_pkg:
-            domain_item_module: ModuleType = import_module(name)
-            inspect_module(domain_item_module, domain_module, domain_items_by_fqn, domain_relations, modules_by_name,firstPass=False)
-
-    item_module = import_module(f'{domain_module}', f'{domain_module}.')
-    inspect_module(item_module, domain_module, domain_items_by_fqn, domain_relations, modules_by_name)
-
-
-    remove_duplicate_relations_in_place(domain_relations)
-
-
-
-
-
-
-
+    inspect_packages(
+        [(domain_path, domain_module)], domain_items_by_fqn, domain_relations, modules_by_name, diagnostics, workers,
+        module_timeout, bounded_memory, domain_filter, inspection_profile
+    )
@@ -0,0 +1,71 @@
+from inspect import Parameter, Signature, isroutine, signature
+from types import BuiltinFunctionType, ClassMethodDescriptorType, WrapperDescriptorType
+from typing import List, Type
+from weakref import WeakKeyDictionary
+
+from py2puml.domain.umlclass import UmlMethod
+from py2puml.inspection.inspectcode import get_annotation_type_name, iter_class_functions
+
+# the methods documented by reflection, cached per class: the classes released by the bounded-memory mode are evicted
+REFLECTED_METHODS_BY_TYPE: WeakKeyDictionary = WeakKeyDictionary()
+
+# flags of the types (type.__flags__): the classes defined in Python are mutable heap types
+HEAP_TYPE_FLAG = 1 << 9
+IMMUTABLE_TYPE_FLAG = 1 << 8
+
+
+def is_extension_type(class_type: Type) -> bool:
+    """
+    Whether the class is compiled (C extension, Cython): it is a static type or an immutable heap type (created from a
+    type specification), and none of its methods is a Python function
+    """
+    type_flags = class_type.__flags__
+    is_compiled = not type_flags & HEAP_TYPE_FLAG or bool(type_flags & IMMUTABLE_TYPE_FLAG)
+    return is_compiled and next(iter_class_functions(class_type), None) is None
+
+
+def is_slot_wrapper(attribute_name: str, class_attribute) -> bool:
+    """The wrappers generated for the C slots of the extension types (__repr__, __new__, etc.) are not documented"""
+    return isinstance(class_attribute, WrapperDescriptorType) or (
+        attribute_name == '__new__' and isinstance(class_attribute, BuiltinFunctionType)
+    )
+
+
+def inspect_reflected_method(method_name: str, class_attribute) -> UmlMethod:
+    """
+    Documents a compiled method from its signature, read from its __text_signature__ (C extensions) or from its
+    annotations (Cython functions). The methods without signature are documented with their name only.
+    """
+    is_static = isinstance(class_attribute, staticmethod)
+    is_class = isinstance(class_attribute, (classmethod, ClassMethodDescriptorType))
+    uml_method = UmlMethod(name=method_name, is_static=is_static, is_class=is_class)
+    try:
+        method_signature = signature(getattr(class_attribute, '__func__', class_attribute))
+    except (TypeError, ValueError):
+        return uml_method
+
+    for parameter in method_signature.parameters.values():
+        uml_method.arguments[parameter.name] = (
+            None if parameter.annotation is Parameter.empty else get_annotation_type_name(parameter.annotation)
+        )
+    if method_signature.return_annotation is not Signature.empty:
+        uml_method.return_type = get_annotation_type_name(method_signature.return_annotation)
+
+    return uml_method
+
+
+def inspect_reflected_methods(class_type: Type) -> List[UmlMethod]:
+    """
+    Documents the methods defined by a compiled class by runtime reflection, without reading any file.
+    The methods are inspected once per class.
+    """
+    reflected_methods = REFLECTED_METHODS_BY_TYPE.get(class_type)
+    if reflected_methods is None:
+        reflected_methods = [
+            inspect_reflected_method(attribute_name, class_attribute)
+            for attribute_name, class_attribute in vars(class_type).items()
+            if isroutine(class_attribute) and not is_slot_wrapper(attribute_name, class_attribute)
+        ]
+        REFLECTED_METHODS_BY_TYPE[class_type] = reflected_methods
+
+    return list(reflected_methods)
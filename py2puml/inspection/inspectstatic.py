@@ -0,0 +1,527 @@
+from ast import (
+    AST,
+    AnnAssign,
+    Assign,
+    AsyncFunctionDef,
+    Attribute,
+    BinOp,
+    Call,
+    ClassDef,
+    Constant,
+    FunctionDef,
+    If,
+    Import,
+    ImportFrom,
+    Index,
+)
+from ast import List as ListNode
+from ast import Module, Name, NodeTransformer, Subscript, Try
+from ast import Tuple as TupleNode
+from ast import expr, get_source_segment, literal_eval, parse, stmt, unparse, walk
+from contextlib import suppress
+from copy import copy, deepcopy
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from py2puml.domain.domainfilter import DomainFilter
+from py2puml.domain.umlclass import UmlAttribute, UmlClass, UmlMethod
+from py2puml.domain.umlenum import Member, UmlEnum
+from py2puml.domain.umlfunction import UmlFunction, UmlModule
+from py2puml.domain.umlitem import UmlItem
+from py2puml.domain.umlrelation import RelType, UmlRelation
+from py2puml.inspection.inspectclass import add_methods_dependencies
+from py2puml.parsing.astvisitors import (
+    ConstructorVisitor,
+    MethodVisitor,
+    resolve_imported_module_name,
+    shorten_compound_type_annotation,
+)
+from py2puml.parsing.moduleresolver import StaticModuleResolver
+
+ENUM_BASE_FQNS = ('enum.Enum', 'enum.IntEnum', 'enum.Flag', 'enum.IntFlag', 'enum.StrEnum')
+NAMEDTUPLE_BASE_FQN = 'typing.NamedTuple'
+NAMEDTUPLE_FACTORY_FQNS = ('collections.namedtuple', 'typing.NamedTuple')
+DATACLASS_DECORATOR_FQN = 'dataclasses.dataclass'
+ABSTRACT_METHOD_DECORATOR_FQN = 'abc.abstractmethod'
+ENUM_AUTO_FQN = 'enum.auto'
+CLASS_VAR_FQN = 'typing.ClassVar'
+
+# errors raised by the AST visitors on the annotations they do not handle
+VISITOR_ERRORS = (AttributeError, TypeError, ValueError)
+
+# maximum number of re-exports followed to find the module defining a definition
+MAX_REEXPORTS_DEPTH = 32
+
+
+class StaticModule(NamedTuple):
+    """The source of a domain module, read without importing it"""
+
+    name: str
+    is_package: bool
+    source: str
+    # whether the source is the stub (.pyi file) of the module
+    is_stub: bool = False
+
+
+class ParsedModule:
+    """A parsed domain module and the bindings of its names (definitions and imports) to fully-qualified names"""
+
+    def __init__(self, static_module: StaticModule):
+        self.name = static_module.name
+        self.source = static_module.source
+        self.is_stub = static_module.is_stub
+        self.tree: Module = parse(static_module.source, static_module.name)
+        self.package_name = static_module.name if static_module.is_package else static_module.name.rpartition('.')[0]
+        self.bindings: Dict[str, str] = {}
+        self.star_imported_module_names: List[str] = []
+
+
+def iter_module_statements(statements: List[stmt]) -> Iterable[stmt]:
+    """Yields the statements of the module body, including the ones of conditional and try blocks"""
+    for statement in statements:
+        if isinstance(statement, If):
+            yield from iter_module_statements(statement.body)
+            yield from iter_module_statements(statement.orelse)
+        elif isinstance(statement, Try):
+            yield from iter_module_statements(statement.body)
+            for handler in statement.handlers:
+                yield from iter_module_statements(handler.body)
+            yield from iter_module_statements(statement.orelse)
+            yield from iter_module_statements(statement.finalbody)
+        else:
+            yield statement
+
+
+def get_dotted_name(node: expr) -> Optional[str]:
+    """Returns 'module.Class' for a name or a chain of attributes, None for other expressions"""
+    if isinstance(node, Name):
+        return node.id
+    if isinstance(node, Attribute):
+        value_name = get_dotted_name(node.value)
+        return None if value_name is None else f'{value_name}.{node.attr}'
+    return None
+
+
+def collect_module_bindings(parsed_module: ParsedModule):
+    for statement in iter_module_statements(parsed_module.tree.body):
+        if isinstance(statement, Import):
+            for alias in statement.names:
+                if alias.asname is None:
+                    # 'import package.module' binds the top-level package
+                    top_level_name = alias.name.split('.')[0]
+                    parsed_module.bindings[top_level_name] = top_level_name
+                else:
+                    parsed_module.bindings[alias.asname] = alias.name
+        elif isinstance(statement, ImportFrom):
+            imported_module = resolve_imported_module_name(parsed_module.package_name, statement)
+            if imported_module is None:
+                continue
+            for alias in statement.names:
+                if alias.name == '*':
+                    parsed_module.star_imported_module_names.append(imported_module)
+                else:
+                    parsed_module.bindings[alias.asname or alias.name] = f'{imported_module}.{alias.name}'
+        elif isinstance(statement, (ClassDef, FunctionDef, AsyncFunctionDef)):
+            parsed_module.bindings[statement.name] = f'{parsed_module.name}.{statement.name}'
+        elif isinstance(statement, Assign) and len(statement.targets) == 1 and isinstance(statement.targets[0], Name):
+            assigned_name = statement.targets[0].id
+            aliased_name = get_dotted_name(statement.value)
+            if aliased_name is None:
+                parsed_module.bindings[assigned_name] = f'{parsed_module.name}.{assigned_name}'
+            else:
+                # an alias of another definition ('Alias = module.Class')
+                aliased_parts = aliased_name.split('.')
+                bound_fqn = parsed_module.bindings.get(aliased_parts[0], f'{parsed_module.name}.{aliased_parts[0]}')
+                parsed_module.bindings[assigned_name] = '.'.join([bound_fqn] + aliased_parts[1:])
+
+
+def expand_star_imports(parsed_module: ParsedModule, parsed_modules: Dict[str, ParsedModule], expanding: set):
+    """Adds the public bindings of the domain modules imported with 'from module import *' to the module bindings"""
+    if parsed_module.name in expanding:
+        return
+    expanding.add(parsed_module.name)
+    for star_imported_module_name in parsed_module.star_imported_module_names:
+        star_imported_module = parsed_modules.get(star_imported_module_name)
+        if star_imported_module is None:
+            continue
+        expand_star_imports(star_imported_module, parsed_modules, expanding)
+        for name, fqn in star_imported_module.bindings.items():
+            if not name.startswith('_'):
+                parsed_module.bindings.setdefault(name, fqn)
+    parsed_module.star_imported_module_names = []
+
+
+class FqnCanonicalizer:
+    """Follows the re-exports of the domain modules ('from .car import Car' in a package) to the defining module"""
+
+    def __init__(self, parsed_modules: Dict[str, ParsedModule]):
+        self.parsed_modules = parsed_modules
+        self.canonical_fqns: Dict[str, str] = {}
+
+    def __call__(self, fqn: str) -> str:
+        if fqn not in self.canonical_fqns:
+            self.canonical_fqns[fqn] = self.canonicalize(fqn, 0)
+        return self.canonical_fqns[fqn]
+
+    def canonicalize(self, fqn: str, depth: int) -> str:
+        fqn_parts = fqn.split('.')
+        # the longest module prefix binds the next name
+        for module_parts_number in range(len(fqn_parts) - 1, 0, -1):
+            parsed_module = self.parsed_modules.get('.'.join(fqn_parts[:module_parts_number]))
+            if parsed_module is not None:
+                bound_name = fqn_parts[module_parts_number]
+                bound_fqn = parsed_module.bindings.get(bound_name)
+                if (
+                    bound_fqn is None
+                    or bound_fqn == f'{parsed_module.name}.{bound_name}'
+                    or depth > MAX_REEXPORTS_DEPTH
+                ):
+                    return fqn
+                return self.canonicalize('.'.join([bound_fqn] + fqn_parts[module_parts_number + 1 :]), depth + 1)
+        return fqn
+
+
+class ForwardReferencesUnquoter(NodeTransformer):
+    def visit_Constant(self, node: Constant) -> AST:
+        if isinstance(node.value, str):
+            # the strings which are not type expressions are kept
+            with suppress(SyntaxError):
+                return parse(node.value, mode='eval').body
+        return node
+
+
+class StaticModuleInspector:
+    """Builds the items and relations of a parsed module, like the runtime inspection does with the imported module"""
+
+    def __init__(
+        self,
+        parsed_module: ParsedModule,
+        canonicalize: FqnCanonicalizer,
+        root_module_name: Tuple[str, ...],
+        domain_items_by_fqn: Dict[str, UmlItem],
+        domain_relations: List[UmlRelation],
+        uml_module: UmlModule,
+        domain_filter: Optional[DomainFilter] = None,
+    ):
+        self.parsed_module = parsed_module
+        self.module_resolver = StaticModuleResolver(parsed_module.name, parsed_module.bindings, canonicalize)
+        self.root_module_name = root_module_name
+        self.domain_items_by_fqn = domain_items_by_fqn
+        self.domain_relations = domain_relations
+        self.uml_module = uml_module
+        self.domain_filter = domain_filter
+        # the dependencies which are linked once all the domain items are known
+        self.regular_classes: List[UmlClass] = []
+        self.functions_dependencies: List[Tuple[UmlFunction, List[str]]] = []
+
+    def resolve_fqn(self, dotted_name: Optional[str]) -> Optional[str]:
+        if dotted_name is None:
+            return None
+        return self.module_resolver.resolve_full_namespace_type(dotted_name).full_namespace
+
+    def derive_annotation_details(self, annotation: Optional[expr], source: str = None) -> Tuple[str, List[str]]:
+        """Returns the short type of an annotation and the fully-qualified names of the types involved in it"""
+        if annotation is None:
+            return None, []
+        source = self.parsed_module.source if source is None else source
+        # string annotations (forward references)
+        if isinstance(annotation, Constant):
+            if not isinstance(annotation.value, str):
+                return str(annotation.value), []
+            try:
+                return self.derive_annotation_details(parse(annotation.value, mode='eval').body, annotation.value)
+            except SyntaxError:
+                return annotation.value, []
+        if isinstance(annotation, (Name, Attribute)):
+            full_namespaced_type, short_type = self.module_resolver.resolve_full_namespace_type(
+                get_dotted_name(annotation) or get_source_segment(source, annotation)
+            )
+            return short_type, [full_namespaced_type]
+        annotation_source = get_source_segment(source, annotation)
+        if isinstance(annotation, (Subscript, BinOp)):
+            # forward references nested in compound types ("List['Node']") are unquoted, like typing evaluates them
+            if any(isinstance(node, Constant) and isinstance(node.value, str) for node in walk(annotation)):
+                annotation_source = unparse(ForwardReferencesUnquoter().visit(deepcopy(annotation)))
+            # annotations which cannot be split into types (literals, callables, etc.) are displayed as is
+            with suppress(ValueError):
+                return shorten_compound_type_annotation(annotation_source, self.module_resolver)
+        return annotation_source, []
+
+    def add_compositions(self, class_fqn: str, target_fqns: Iterable[str], relations_by_target_fqn: Dict):
+        for target_fqn in target_fqns:
+            if target_fqn is not None and target_fqn.startswith(self.root_module_name):
+                relations_by_target_fqn.setdefault(target_fqn, UmlRelation(class_fqn, target_fqn, RelType.COMPOSITION))
+
+    def inspect_definitions(self):
+        definitions: Dict[str, AST] = {}
+        for statement in iter_module_statements(self.parsed_module.tree.body):
+            if isinstance(statement, (ClassDef, FunctionDef, AsyncFunctionDef)):
+                definitions[statement.name] = statement
+            elif (
+                isinstance(statement, Assign)
+                and len(statement.targets) == 1
+                and isinstance(statement.targets[0], Name)
+                and isinstance(statement.value, Call)
+                and self.resolve_fqn(get_dotted_name(statement.value.func)) in NAMEDTUPLE_FACTORY_FQNS
+            ):
+                definitions[statement.targets[0].id] = statement
+
+        # the definitions are inspected in alphabetical order, like the attributes of an imported module
+        for definition_name in sorted(definitions.keys()):
+            definition_fqn = f'{self.parsed_module.name}.{definition_name}'
+            if definition_fqn in self.domain_items_by_fqn:
+                continue
+            if self.domain_filter is not None and not self.domain_filter.accepts_definition(
+                self.parsed_module.name, definition_fqn
+            ):
+                continue
+            definition_node = definitions[definition_name]
+            if isinstance(definition_node, ClassDef):
+                self.inspect_class(definition_node, definition_fqn)
+            elif isinstance(definition_node, (FunctionDef, AsyncFunctionDef)):
+                self.inspect_function(definition_node, definition_fqn)
+            else:
+                self.inspect_namedtuple_factory(definition_node, definition_name, definition_fqn)
+
+    def inspect_class(self, class_node: ClassDef, class_fqn: str):
+        base_fqns = [self.resolve_fqn(get_dotted_name(base)) for base in class_node.bases]
+        decorator_fqns = [
+            self.resolve_fqn(get_dotted_name(decorator.func if isinstance(decorator, Call) else decorator))
+            for decorator in class_node.decorator_list
+        ]
+
+        if any(base_fqn in ENUM_BASE_FQNS for base_fqn in base_fqns):
+            self.domain_items_by_fqn[class_fqn] = UmlEnum(
+                name=class_node.name, fqn=class_fqn, members=self.inspect_enum_members(class_node)
+            )
+            return
+        if NAMEDTUPLE_BASE_FQN in base_fqns:
+            self.domain_items_by_fqn[class_fqn] = UmlClass(
+                name=class_node.name,
+                fqn=class_fqn,
+                attributes=[
+                    UmlAttribute(statement.target.id, 'Any', False)
+                    for statement in class_node.body
+                    if isinstance(statement, AnnAssign) and isinstance(statement.target, Name)
+                ],
+                methods=[],
+            )
+            return
+
+        is_dataclass = DATACLASS_DECORATOR_FQN in decorator_fqns
+        uml_class = UmlClass(name=class_node.name, fqn=class_fqn, attributes=[], methods=[])
+        self.domain_items_by_fqn[class_fqn] = uml_class
+
+        # attributes annotated in the class body: static attributes, or instance attributes of dataclasses.
+        # Stubs declare the instance attributes in the class body, the static ones being annotated with ClassVar
+        relations_by_target_fqn: Dict[str, UmlRelation] = {}
+        for statement in class_node.body:
+            if isinstance(statement, AnnAssign) and isinstance(statement.target, Name):
+                annotation, is_static = statement.annotation, not is_dataclass
+                if self.parsed_module.is_stub:
+                    annotation, is_static = self.unwrap_class_var(annotation)
+                attribute_type, attribute_type_fqns = self.derive_annotation_details(annotation)
+                uml_class.attributes.append(UmlAttribute(statement.target.id, attribute_type, is_static))
+                self.add_compositions(class_fqn, attribute_type_fqns, relations_by_target_fqn)
+        self.domain_relations.extend(relations_by_target_fqn.values())
+
+        if not is_dataclass:
+            method_nodes = [statement for statement in class_node.body if isinstance(statement, FunctionDef)]
+            for method_node in method_nodes:
+                if method_node.name == '__init__':
+                    self.inspect_constructor(method_node, class_node.name, uml_class)
+            uml_class.methods.extend(self.inspect_method(method_node) for method_node in method_nodes)
+            uml_class.is_abstract = any(
+                self.resolve_fqn(get_dotted_name(decorator)) == ABSTRACT_METHOD_DECORATOR_FQN
+                for method_node in method_nodes
+                for decorator in method_node.decorator_list
+            )
+            self.regular_classes.append(uml_class)
+
+        for base_fqn in base_fqns:
+            if base_fqn is not None and base_fqn.startswith(self.root_module_name):
+                self.domain_relations.append(UmlRelation(base_fqn, class_fqn, RelType.INHERITANCE))
+
+    def unwrap_class_var(self, annotation: expr) -> Tuple[Optional[expr], bool]:
+        """Returns the annotation wrapped by 'ClassVar[...]' and whether the attribute is static"""
+        if isinstance(annotation, Subscript) and self.resolve_fqn(get_dotted_name(annotation.value)) == CLASS_VAR_FQN:
+            slice_node = annotation.slice.value if isinstance(annotation.slice, Index) else annotation.slice
+            return slice_node, True
+        if self.resolve_fqn(get_dotted_name(annotation)) == CLASS_VAR_FQN:
+            # a bare ClassVar annotation does not tell the type of the attribute
+            return None, True
+        return annotation, False
+
+    def inspect_constructor(self, constructor_node: FunctionDef, class_name: str, uml_class: UmlClass):
+        constructor_visitor = ConstructorVisitor(
+            self.parsed_module.source, class_name, self.root_module_name, self.module_resolver
+        )
+        # an annotation which the visitor cannot handle ends the constructor parsing
+        with suppress(*VISITOR_ERRORS):
+            constructor_visitor.visit(constructor_node)
+        uml_class.attributes.extend(constructor_visitor.uml_attributes)
+        self.domain_relations.extend(constructor_visitor.uml_relations_by_target_fqn.values())
+
+    def inspect_method(self, method_node: FunctionDef) -> UmlMethod:
+        # the method visitor only handles the decorators which are names ('staticmethod', 'classmethod')
+        named_decorators_node = copy(method_node)
+        named_decorators_node.decorator_list = [
+            decorator for decorator in method_node.decorator_list if isinstance(decorator, Name)
+        ]
+        method_visitor = MethodVisitor()
+        try:
+            method_visitor.visit(named_decorators_node)
+        except VISITOR_ERRORS:
+            # the method is documented with the names of its arguments only
+            arguments = method_node.args
+            return UmlMethod(
+                name=method_node.name,
+                arguments={argument.arg: None for argument in [*arguments.posonlyargs, *arguments.args]},
+            )
+        return method_visitor.uml_method
+
+    def inspect_enum_members(self, enum_node: ClassDef) -> List[Member]:
+        members: List[Member] = []
+        auto_value = 0
+        for statement in enum_node.body:
+            if isinstance(statement, Assign) and len(statement.targets) == 1:
+                target, value = statement.targets[0], statement.value
+            elif isinstance(statement, AnnAssign) and (statement.value is not None or self.parsed_module.is_stub):
+                # the stubs may declare the members without their value
+                target, value = statement.target, statement.value
+            else:
+                continue
+            if not isinstance(target, Name) or target.id.startswith('_'):
+                continue
+
+            if value is None or (isinstance(value, Constant) and value.value is Ellipsis):
+                # members whose value is elided by a stub are documented with their annotated type
+                member_value = (
+                    get_source_segment(self.parsed_module.source, statement.annotation)
+                    if isinstance(statement, AnnAssign)
+                    else '...'
+                )
+            elif isinstance(value, Call) and self.resolve_fqn(get_dotted_name(value.func)) == ENUM_AUTO_FQN:
+                auto_value += 1
+                member_value = auto_value
+            else:
+                try:
+                    member_value = literal_eval(value)
+                except ValueError:
+                    member_value = get_source_segment(self.parsed_module.source, value)
+                if isinstance(member_value, int):
+                    auto_value = member_value
+            members.append(Member(name=target.id, value=member_value))
+
+        return members
+
+    def inspect_namedtuple_factory(self, assignment: Assign, namedtuple_name: str, namedtuple_fqn: str):
+        factory_call: Call = assignment.value
+        fields_node = factory_call.args[1] if len(factory_call.args) > 1 else None
+        for keyword in factory_call.keywords:
+            if keyword.arg in ('field_names', 'fields'):
+                fields_node = keyword.value
+
+        field_names: List[str] = []
+        if isinstance(fields_node, Constant) and isinstance(fields_node.value, str):
+            field_names = fields_node.value.replace(',', ' ').split()
+        elif isinstance(fields_node, (ListNode, TupleNode)):
+            for field_node in fields_node.elts:
+                # typing.NamedTuple('Name', [('field', type), ...])
+                if isinstance(field_node, TupleNode) and len(field_node.elts) > 0:
+                    field_node = field_node.elts[0]
+                if isinstance(field_node, Constant) and isinstance(field_node.value, str):
+                    field_names.append(field_node.value)
+
+        self.domain_items_by_fqn[namedtuple_fqn] = UmlClass(
+            name=namedtuple_name,
+            fqn=namedtuple_fqn,
+            attributes=[UmlAttribute(field_name, 'Any', False) for field_name in field_names],
+            methods=[],
+        )
+
+    def inspect_function(self, function_node: FunctionDef, function_fqn: str):
+        uml_function = UmlFunction(fqn=function_fqn, name=function_node.name, module=self.parsed_module.name)
+        self.domain_items_by_fqn[function_fqn] = uml_function
+        self.uml_module.functions.append(uml_function)
+
+        signature_arguments = function_node.args
+        arguments = [*signature_arguments.posonlyargs, *signature_arguments.args]
+        if signature_arguments.vararg is not None:
+            arguments.append(signature_arguments.vararg)
+        arguments.extend(signature_arguments.kwonlyargs)
+        if signature_arguments.kwarg is not None:
+            arguments.append(signature_arguments.kwarg)
+
+        dependency_fqns: List[str] = []
+        for argument in arguments:
+            argument_type, argument_type_fqns = self.derive_annotation_details(argument.annotation)
+            uml_function.arguments[argument.arg] = argument_type
+            dependency_fqns.extend(argument_type_fqns)
+        return_type, return_type_fqns = self.derive_annotation_details(function_node.returns)
+        uml_function.return_type = return_type
+        dependency_fqns.extend(return_type_fqns)
+        self.functions_dependencies.append((uml_function, dependency_fqns))
+
+    def link_dependencies(self):
+        """Adds the dependencies towards the domain items, once all the modules are inspected"""
+        for uml_class in self.regular_classes:
+            add_methods_dependencies(
+                uml_class.methods, uml_class.fqn, self.root_module_name, self.domain_items_by_fqn, self.domain_relations
+            )
+        for uml_function, dependency_fqns in self.functions_dependencies:
+            for dependency_fqn in dependency_fqns:
+                if (
+                    dependency_fqn is not None
+                    and dependency_fqn.startswith(self.root_module_name)
+                    and dependency_fqn in self.domain_items_by_fqn
+                ):
+                    self.domain_relations.append(
+                        UmlRelation(
+                            f'{uml_function.module}.Methods', dependency_fqn, RelType.DEPENDENCY, uml_function.name
+                        )
+                    )
+
+
+def inspect_static_modules(
+    static_modules: Iterable[StaticModule],
+    root_module_names: Tuple[str, ...],
+    domain_items_by_fqn: Dict[str, UmlItem],
+    domain_relations: List[UmlRelation],
+    modules_by_name: Dict[str, UmlModule],
+    domain_filter: Optional[DomainFilter] = None,
+):
+    """
+    Inspects the domain modules from their sources only: nothing is imported nor executed.
+    The names used in the annotations are resolved with the imports and definitions of the modules,
+    following the re-exports of the domain packages.
+    """
+    # the packages are inspected before their modules, in alphabetical order like the runtime walk
+    parsed_modules: Dict[str, ParsedModule] = {
+        static_module.name: ParsedModule(static_module)
+        for static_module in sorted(static_modules, key=lambda static_module: static_module.name.split('.'))
+    }
+    for parsed_module in parsed_modules.values():
+        collect_module_bindings(parsed_module)
+    expanding_module_names = set()
+    for parsed_module in parsed_modules.values():
+        expand_star_imports(parsed_module, parsed_modules, expanding_module_names)
+
+    canonicalize = FqnCanonicalizer(parsed_modules)
+    module_inspectors: List[StaticModuleInspector] = []
+    for module_name, parsed_module in parsed_modules.items():
+        if module_name not in modules_by_name:
+            modules_by_name[module_name] = UmlModule(name=module_name)
+        module_inspector = StaticModuleInspector(
+            parsed_module,
+            canonicalize,
+            root_module_names,
+            domain_items_by_fqn,
+            domain_relations,
+            modules_by_name[module_name],
+            domain_filter,
+        )
+        module_inspector.inspect_definitions()
+        module_inspectors.append(module_inspector)
+
+    for module_inspector in module_inspectors:
+        module_inspector.link_dependencies()
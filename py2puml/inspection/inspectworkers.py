@@ -0,0 +1,307 @@
+import sys
+from contextlib import suppress
+from importlib import import_module
+from multiprocessing import get_context
+from multiprocessing.connection import Connection, wait
+from os import cpu_count
+from time import monotonic
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from py2puml.domain.diagnostic import DiagnosticType, InspectionDiagnostic
+from py2puml.domain.domainfilter import DomainFilter
+from py2puml.domain.inspectionprofile import FULL_PROFILE, InspectionProfile
+from py2puml.domain.umlfunction import UmlModule
+from py2puml.domain.umlitem import UmlItem
+from py2puml.domain.umlrelation import UmlRelation
+from py2puml.inspection.detachitems import detach_domain_items
+from py2puml.inspection.inspectmodule import inspect_module
+from py2puml.inspection.releasemodules import release_domain_modules
+
+
+class ModuleInspection(NamedTuple):
+    """The serializable result of the inspection of a module in a worker process"""
+
+    domain_items_by_fqn: Dict[str, UmlItem]
+    domain_relations: List[UmlRelation]
+    uml_module: UmlModule
+
+
+class SharedInspectionState(NamedTuple):
+    """The state shared by the inspections of all the modules, sent once to each worker process"""
+
+    # owner-module index: the definitions imported from these modules are discovered in their defining module
+    inspected_module_names: FrozenSet[str]
+    # the items found by the first pass, needed by the second pass
+    domain_items_by_fqn: Optional[Dict[str, UmlItem]] = None
+    domain_filter: Optional[DomainFilter] = None
+    inspection_profile: InspectionProfile = FULL_PROFILE
+
+
+def inspect_module_in_worker(
+    shared_state: SharedInspectionState,
+    module_name: str,
+    root_module_names: Tuple[str, ...],
+    first_pass: bool,
+    bounded_memory: bool,
+) -> ModuleInspection:
+    """
+    Imports and inspects a module in the worker process.
+    The first pass starts from an empty domain; the second pass needs the items found by the first pass of all modules.
+    """
+    preserved_module_names = set(sys.modules)
+    # the second pass only reads the items found by the first pass
+    domain_items_by_fqn: Dict[str, UmlItem] = {} if first_pass else shared_state.domain_items_by_fqn
+    domain_relations: List[UmlRelation] = []
+    modules_by_name: Dict[str, UmlModule] = {}
+    inspect_module(
+        import_module(module_name),
+        root_module_names,
+        domain_items_by_fqn,
+        domain_relations,
+        modules_by_name,
+        first_pass,
+        shared_state.inspected_module_names,
+        shared_state.domain_filter,
+        shared_state.inspection_profile,
+    )
+    if bounded_memory:
+        release_domain_modules(root_module_names, preserved_module_names)
+
+    return ModuleInspection(
+        detach_domain_items(domain_items_by_fqn) if first_pass else {},
+        domain_relations,
+        modules_by_name[module_name],
+    )
+
+
+def serve_tasks(connection: Connection):
+    """
+    Loop of a worker process: receives the shared state or the tasks to run and sends back their results.
+    Exceptions raised by a task are sent back as messages, the worker remains available for the next tasks.
+    """
+    shared_state = None
+    while True:
+        try:
+            message = connection.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+
+        message_type, payload = message
+        if message_type == 'state':
+            shared_state = payload
+        else:
+            task, task_args = payload
+            try:
+                connection.send((True, task(shared_state, *task_args)))
+            except Exception as error:
+                connection.send((False, f'{error.__class__.__name__}: {error}'))
+
+
+class WorkerProcess:
+    def __init__(self, context):
+        self.connection, worker_connection = context.Pipe()
+        self.process = context.Process(target=serve_tasks, args=(worker_connection,), daemon=True)
+        self.process.start()
+        worker_connection.close()
+        self.state_version: int = None
+        self.task_index: int = None
+        self.deadline: float = None
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+    def stop(self):
+        # the worker may already be gone
+        with suppress(BrokenPipeError, OSError):
+            self.connection.send(None)
+        self.process.join(1)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.connection.close()
+
+
+class InspectionWorkerPool:
+    """
+    A pool of worker processes running tasks with a time budget.
+    A worker whose task times out or which crashes is replaced by a new one: the failure is recorded
+    as a diagnostic and the other tasks carry on.
+    """
+
+    def __init__(self, workers: int, task_timeout: Optional[float]):
+        self.context = get_context()
+        self.workers_number = workers
+        self.task_timeout = task_timeout
+        self.workers: List[WorkerProcess] = []
+        self.shared_state = None
+        self.state_version = 0
+
+    def __enter__(self) -> 'InspectionWorkerPool':
+        return self
+
+    def __exit__(self, *exc_info):
+        for worker in self.workers:
+            worker.stop()
+        self.workers = []
+
+    def share_state(self, shared_state: Any):
+        """Sets the state passed as first argument to the next tasks (sent once to each worker)"""
+        self.shared_state = shared_state
+        self.state_version += 1
+
+    def start_task(self, worker: WorkerProcess, task: Callable, task_args: Tuple, task_index: int):
+        if worker.state_version != self.state_version:
+            worker.connection.send(('state', self.shared_state))
+            worker.state_version = self.state_version
+        worker.connection.send(('task', (task, task_args)))
+        worker.task_index = task_index
+        worker.deadline = None if self.task_timeout is None else monotonic() + self.task_timeout
+
+    def replace(self, worker: WorkerProcess) -> WorkerProcess:
+        worker.kill()
+        new_worker = WorkerProcess(self.context)
+        self.workers[self.workers.index(worker)] = new_worker
+        return new_worker
+
+    def run(
+        self, task: Callable, tasks_args: List[Tuple], task_names: List[str], diagnostics: List[InspectionDiagnostic]
+    ) -> List[Any]:
+        """
+        Runs the task with each tuple of arguments and returns the results in the order of the arguments.
+        The result of a failing task is None, its failure being added to the diagnostics.
+        """
+        results: List[Any] = [None] * len(tasks_args)
+        pending_indices = iter(range(len(tasks_args)))
+        while len(self.workers) < min(self.workers_number, len(tasks_args)):
+            self.workers.append(WorkerProcess(self.context))
+
+        def assign_next_task(worker: WorkerProcess):
+            next_index = next(pending_indices, None)
+            if next_index is None:
+                worker.task_index = None
+            else:
+                self.start_task(worker, task, tasks_args[next_index], next_index)
+
+        for worker in self.workers:
+            assign_next_task(worker)
+
+        while busy_workers := [worker for worker in self.workers if worker.task_index is not None]:
+            deadlines = [worker.deadline for worker in busy_workers if worker.deadline is not None]
+            wait_timeout = None if len(deadlines) == 0 else max(0, min(deadlines) - monotonic())
+            ready_connections = wait([worker.connection for worker in busy_workers], wait_timeout)
+
+            for worker in busy_workers:
+                task_index = worker.task_index
+                if worker.connection in ready_connections:
+                    try:
+                        succeeded, result = worker.connection.recv()
+                    except EOFError:
+                        worker.process.join()
+                        exit_code = worker.process.exitcode
+                        diagnostics.append(
+                            InspectionDiagnostic(
+                                task_names[task_index], DiagnosticType.CRASH, f'worker exited with code {exit_code}'
+                            )
+                        )
+                        worker = self.replace(worker)
+                    else:
+                        if succeeded:
+                            results[task_index] = result
+                        else:
+                            diagnostics.append(
+                                InspectionDiagnostic(task_names[task_index], DiagnosticType.ERROR, result)
+                            )
+                elif worker.deadline is not None and worker.deadline <= monotonic():
+                    diagnostics.append(
+                        InspectionDiagnostic(
+                            task_names[task_index], DiagnosticType.TIMEOUT, f'exceeded {self.task_timeout}s'
+                        )
+                    )
+                    worker = self.replace(worker)
+                else:
+                    continue
+
+                assign_next_task(worker)
+
+        return results
+
+
+def merge_module_inspection(
+    module_inspection: ModuleInspection,
+    domain_items_by_fqn: Dict[str, UmlItem],
+    domain_relations: List[UmlRelation],
+    modules_by_name: Dict[str, UmlModule],
+):
+    """
+    Merges the result of a module inspection like if the module had been inspected in the current process:
+    a definition already found in a previously inspected module is not added again.
+    """
+    new_item_fqns = set()
+    for item_fqn, uml_item in module_inspection.domain_items_by_fqn.items():
+        if item_fqn not in domain_items_by_fqn:
+            domain_items_by_fqn[item_fqn] = uml_item
+            new_item_fqns.add(item_fqn)
+    domain_relations.extend(module_inspection.domain_relations)
+
+    module_name = module_inspection.uml_module.name
+    if module_name not in modules_by_name:
+        modules_by_name[module_name] = UmlModule(name=module_name)
+    modules_by_name[module_name].functions.extend(
+        uml_function for uml_function in module_inspection.uml_module.functions if uml_function.fqn in new_item_fqns
+    )
+
+
+def inspect_modules_in_workers(
+    root_module_names: Tuple[str, ...],
+    first_pass_module_names: List[str],
+    second_pass_module_names: List[str],
+    domain_items_by_fqn: Dict[str, UmlItem],
+    domain_relations: List[UmlRelation],
+    modules_by_name: Dict[str, UmlModule],
+    diagnostics: List[InspectionDiagnostic],
+    workers: Optional[int] = None,
+    module_timeout: Optional[float] = None,
+    bounded_memory: bool = False,
+    inspected_module_names: Optional[FrozenSet[str]] = None,
+    domain_filter: Optional[DomainFilter] = None,
+    inspection_profile: InspectionProfile = FULL_PROFILE,
+):
+    """
+    Imports and inspects the modules in a pool of worker processes, each module import being given a time budget.
+    The current process only merges the serialized results and does not import the inspected modules.
+    """
+    if inspected_module_names is None:
+        inspected_module_names = frozenset(first_pass_module_names)
+    with InspectionWorkerPool(workers or cpu_count() or 1, module_timeout) as worker_pool:
+        worker_pool.share_state(SharedInspectionState(inspected_module_names, None, domain_filter, inspection_profile))
+        for module_inspection in worker_pool.run(
+            inspect_module_in_worker,
+            [(module_name, root_module_names, True, bounded_memory) for module_name in first_pass_module_names],
+            first_pass_module_names,
+            diagnostics,
+        ):
+            if module_inspection is not None:
+                merge_module_inspection(module_inspection, domain_items_by_fqn, domain_relations, modules_by_name)
+
+        # the second pass links the dependencies towards the items found during the first pass
+        if not inspection_profile.dependencies:
+            return
+        failed_module_names = {diagnostic.module_name for diagnostic in diagnostics}
+        second_pass_module_names = [
+            module_name for module_name in second_pass_module_names if module_name not in failed_module_names
+        ]
+        worker_pool.share_state(
+            SharedInspectionState(inspected_module_names, domain_items_by_fqn, domain_filter, inspection_profile)
+        )
+        for module_inspection in worker_pool.run(
+            inspect_module_in_worker,
+            [(module_name, root_module_names, False, bounded_memory) for module_name in second_pass_module_names],
+            second_pass_module_names,
+            diagnostics,
+        ):
+            if module_inspection is not None:
+                domain_relations.extend(module_inspection.domain_relations)
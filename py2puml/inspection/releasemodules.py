@@ -0,0 +1,48 @@
+import sys
+from linecache import cache as linecache_cache
+from typing import Iterable, List, Set, Tuple
+
+
+def release_module(module_name: str):
+    """
+    Removes an imported module from the import system and its source lines from the linecache,
+    so that the module can be garbage-collected once the inspection no longer references its definitions
+    """
+    module = sys.modules.pop(module_name, None)
+    if module is None:
+        return
+
+    # the import system binds each submodule as an attribute of its parent package
+    parent_name, _, child_name = module_name.rpartition('.')
+    parent_module = sys.modules.get(parent_name)
+    if parent_module is not None and getattr(parent_module, child_name, None) is module:
+        delattr(parent_module, child_name)
+
+    module_file = getattr(module, '__file__', None)
+    if module_file is not None:
+        linecache_cache.pop(module_file, None)
+
+
+def releasable_module_names(root_module_names: Tuple[str, ...], preserved_module_names: Set[str]) -> Iterable[str]:
+    """
+    Yields the names of the imported modules which can be safely released:
+    - modules of the inspected domain (third-party and extension modules cannot be safely reimported)
+    - which were imported during the inspection (the modules imported beforehand may be used by the caller)
+    - which are not packages (their submodules would be orphans)
+    """
+    root_module_prefixes = tuple(f'{root_module_name}.' for root_module_name in root_module_names)
+    for module_name, module in list(sys.modules.items()):
+        if (
+            module_name.startswith(root_module_prefixes)
+            and module_name not in preserved_module_names
+            and not hasattr(module, '__path__')
+        ):
+            yield module_name
+
+
+def release_domain_modules(root_module_names: Tuple[str, ...], preserved_module_names: Set[str]) -> List[str]:
+    released_module_names = list(releasable_module_names(root_module_names, preserved_module_names))
+    for module_name in released_module_names:
+        release_module(module_name)
+
+    return released_module_names
@@ -0,0 +1,159 @@
+from mmap import ACCESS_READ, mmap
+from os import walk
+from pathlib import Path, PurePath, PurePosixPath
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from zipfile import BadZipFile, ZipFile
+
+from py2puml.domain.domainfilter import DomainFilter
+from py2puml.inspection.inspectstatic import StaticModule
+
+SOURCE_SUFFIX = '.py'
+STUB_SUFFIX = '.pyi'
+# wheels, zip files and zipapps, importable like folders
+ARCHIVE_SUFFIXES = ('.whl', '.zip', '.pyz')
+
+
+class ModuleFile(NamedTuple):
+    name: str
+    is_package: bool
+    is_stub: bool
+    # identifies the file: its path in the working tree, its blob id in a git revision
+    file_key: Any
+
+
+def select_module_files(
+    domain_module: str,
+    relative_files: Iterable[Tuple[Any, PurePath]],
+    domain_filter: Optional[DomainFilter] = None,
+) -> List[ModuleFile]:
+    """
+    Selects the file documenting each domain module among the .py and .pyi files of the domain folder (given with their
+    path relative to it): the stub of a module is preferred to its implementation, being smaller and fully annotated.
+    The modules rejected by the domain filter (except the root package) are not selected.
+    """
+    module_files_by_name: Dict[str, ModuleFile] = {}
+    for file_key, file_path in relative_files:
+        if file_path.suffix not in (SOURCE_SUFFIX, STUB_SUFFIX):
+            continue
+        is_package = file_path.stem == '__init__'
+        module_parts = file_path.parent.parts if is_package else file_path.with_suffix('').parts
+        if not all(module_part.isidentifier() for module_part in module_parts):
+            continue
+        module_name = '.'.join((domain_module, *module_parts))
+        if domain_filter is not None and module_name != domain_module and not domain_filter.accepts_module(module_name):
+            continue
+
+        is_stub = file_path.suffix == STUB_SUFFIX
+        if module_name not in module_files_by_name or is_stub:
+            module_files_by_name[module_name] = ModuleFile(module_name, is_package, is_stub, file_key)
+
+    return list(module_files_by_name.values())
+
+
+def list_domain_files(
+    domain_path: str, domain_module: str, domain_filter: Optional[DomainFilter] = None
+) -> Iterable[Tuple[Path, PurePath]]:
+    """
+    Yields the (path, path relative to the domain path) of the files of the domain folder, without walking the
+    subfolders rejected by the domain filter
+    """
+    domain_folder = Path(domain_path)
+    for folder, subfolder_names, file_names in walk(domain_folder):
+        folder = Path(folder)
+        relative_folder = folder.relative_to(domain_folder)
+        # the subfolders are pruned in place, and walked in alphabetical order
+        subfolder_names[:] = sorted(
+            subfolder_name
+            for subfolder_name in subfolder_names
+            if subfolder_name.isidentifier()
+            and subfolder_name != '__pycache__'
+            and (
+                domain_filter is None
+                or domain_filter.walks_package('.'.join((domain_module, *relative_folder.parts, subfolder_name)))
+            )
+        )
+        for file_name in sorted(file_names):
+            yield folder / file_name, relative_folder / file_name
+
+
+def read_path_modules(
+    domain_path: str, domain_module: str, domain_filter: Optional[DomainFilter] = None
+) -> List[StaticModule]:
+    """
+    Returns the sources of the domain modules of the working tree, preferring their stubs (.pyi files) when they exist.
+    The files of the modules rejected by the domain filter (except the root package) are not read.
+    """
+    return [
+        StaticModule(module_name, is_package, file_path.read_text(encoding='utf-8', errors='replace'), is_stub)
+        for module_name, is_package, is_stub, file_path in select_module_files(
+            domain_module, list_domain_files(domain_path, domain_module, domain_filter), domain_filter
+        )
+    ]
+
+
+class SeekableMemoryMap(mmap):
+    """A memory-mapped file which can be read by zipfile.ZipFile"""
+
+    def seekable(self) -> bool:
+        return True
+
+
+def split_archive_path(domain_path: str) -> Optional[Tuple[Path, PurePosixPath]]:
+    """
+    Splits 'dist/domain.whl/sub/folder' into the path of the archive and the folder inside it, like zipimport does;
+    returns None if the path does not lead into an archive
+    """
+    domain_path = Path(domain_path)
+    for archive_path in (domain_path, *domain_path.parents):
+        if archive_path.suffix in ARCHIVE_SUFFIXES and archive_path.is_file():
+            return archive_path, PurePosixPath(domain_path.relative_to(archive_path).as_posix())
+    return None
+
+
+def read_archive_modules(
+    archive_path: Path,
+    archive_folder: PurePosixPath,
+    domain_module: str,
+    domain_filter: Optional[DomainFilter] = None,
+    memory_map: bool = False,
+) -> List[StaticModule]:
+    """
+    Returns the sources of the domain modules stored in the archive, which are read one by one without being extracted.
+    The domain package is the given folder of the archive, or the folder of the module name when the archive is an
+    import root (wheels, zipapps). The archive is read through a memory map if memory_map is True.
+    """
+    domain_folder = archive_folder if archive_folder.parts else PurePosixPath(*domain_module.split('.'))
+    domain_folder_prefix = f'{domain_folder}/'
+    with open(archive_path, 'rb') as archive_file:
+        archive_data = SeekableMemoryMap(archive_file.fileno(), 0, access=ACCESS_READ) if memory_map else archive_file
+        try:
+            with ZipFile(archive_data) as archive:
+                module_files = select_module_files(
+                    domain_module,
+                    (
+                        (archive_member, PurePosixPath(archive_member.filename).relative_to(domain_folder))
+                        for archive_member in archive.infolist()
+                        if archive_member.filename.startswith(domain_folder_prefix) and not archive_member.is_dir()
+                    ),
+                    domain_filter,
+                )
+                return [
+                    StaticModule(name, is_package, archive.read(member).decode('utf-8', errors='replace'), is_stub)
+                    for name, is_package, is_stub, member in module_files
+                ]
+        except BadZipFile as error:
+            raise ValueError(f'{archive_path} cannot be read: {error}') from error
+        finally:
+            if memory_map:
+                archive_data.close()
+
+
+def read_static_modules(
+    domain_path: str, domain_module: str, domain_filter: Optional[DomainFilter] = None
+) -> List[StaticModule]:
+    """Returns the sources of the domain modules, read from the working tree or from the archive the path leads into"""
+    archive_location = split_archive_path(domain_path)
+    if archive_location is None:
+        return read_path_modules(domain_path, domain_module, domain_filter)
+    archive_path, archive_folder = archive_location
+    return read_archive_modules(archive_path, archive_folder, domain_module, domain_filter)
@@ -2,9 +2,14 @@ from _ast import BitOr, Call
 from ast import (
     AnnAssign,
     Assign,
+    AsyncFunctionDef,
     Attribute,
     BinOp,
+    ClassDef,
     FunctionDef,
+    Import,
+    ImportFrom,
+    Index,
     Name,
     NodeVisitor,
     Subscript,
@@ -13,7 +18,7 @@ from ast import (
     get_source_segment,
 )
 from collections import namedtuple
-from typing import Dict, List, Tuple, Type
+from typing import Dict, List, Optional, Tuple, Type
 
 from py2puml.domain.umlclass import UmlAttribute, UmlMethod
 from py2puml.domain.umlrelation import RelType, UmlRelation
@@ -209,13 +214,15 @@ class TypeVisitor(NodeVisitor):
 
         datatypes = []
 
-        if hasattr(node.slice.value, 'elts'):
-            for child_node in node.slice.value.elts:
+        # the slice is wrapped in an ast.Index node until Python 3.9
+        slice_node = node.slice.value if isinstance(node.slice, Index) else node.slice
+        if hasattr(slice_node, 'elts'):
+            for child_node in slice_node.elts:
                 child_visitor = TypeVisitor()
                 datatypes.append(child_visitor.visit(child_node))
         else:
             child_visitor = TypeVisitor()
-            datatypes.append(child_visitor.visit(node.slice.value))
+            datatypes.append(child_visitor.visit(slice_node))
 
         joined_datatypes = ', '.join(datatypes)
 
@@ -400,6 +407,9 @@ def shorten_compound_type_annotation(type_annotation: str, module_resolver: Modu
                 compound_short_type_parts.append(' | ')
             else:
                 compound_short_type_parts.append(compound_type_part)
+        # the ellipsis of variable-length tuples (Tuple[str, ...]) is not a type
+        elif compound_type_part == '...':
+            compound_short_type_parts.append(compound_type_part)
         # replaces each type definition by its short class name
         else:
             full_namespaced_type, short_type = module_resolver.resolve_full_namespace_type(compound_type_part)
@@ -412,3 +422,121 @@ def shorten_compound_type_annotation(type_annotation: str, module_resolver: Modu
             associated_types.append(full_namespaced_type)
 
     return ''.join(compound_short_type_parts), associated_types
+
+
+def resolve_imported_module_name(package_name: str, node: ImportFrom) -> Optional[str]:
+    """
+    Returns the absolute name of the module of a 'from ... import' statement, relative imports being resolved against
+    the package of the importing module. None is returned for relative imports beyond the top-level package.
+    """
+    if node.level == 0:
+        return node.module
+
+    package_parts = package_name.split('.')
+    if node.level - 1 >= len(package_parts):
+        return None
+    base_package = '.'.join(package_parts[: len(package_parts) - node.level + 1])
+    return base_package if node.module is None else f'{base_package}.{node.module}'
+
+
+class ImportsCollector(NodeVisitor):
+    """
+    Collects the names of the modules imported by a module (including the imports nested in functions or in
+    conditional blocks), relative imports being resolved against the package of the module
+    """
+
+    def __init__(self, module_name: str, is_package: bool, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # the package against which the relative imports are resolved
+        self.package_name: str = module_name if is_package else module_name.rpartition('.')[0]
+        # each imported name is a (module, name) pair, the name being None for 'import module' statements
+        self.imported_names: List[Tuple[str, str]] = []
+
+    def visit_Import(self, node: Import):
+        for alias in node.names:
+            self.imported_names.append((alias.name, None))
+
+    def visit_ImportFrom(self, node: ImportFrom):
+        imported_module = resolve_imported_module_name(self.package_name, node)
+        if imported_module is None:
+            return
+
+        for alias in node.names:
+            self.imported_names.append((imported_module, None if alias.name == '*' else alias.name))
+
+
+def get_attribute_chain(node: expr) -> Optional[Tuple[str, ...]]:
+    """Returns the names of a chain of attributes starting with a name ('module.Class.method'), None otherwise"""
+    attribute_names: List[str] = []
+    while isinstance(node, Attribute):
+        attribute_names.append(node.attr)
+        node = node.value
+    if not isinstance(node, Name):
+        return None
+    attribute_names.append(node.id)
+    attribute_names.reverse()
+
+    return tuple(attribute_names)
+
+
+class CallsCollector(NodeVisitor):
+    """
+    Counts the calls of names and attribute chains made in a module, in a single traversal.
+    Each call is keyed by:
+    - the qualified name of the caller within the module: the top-level function, the class method
+      (the calls of nested functions are attributed to their enclosing one) or '' for the module body
+    - the qualified name of the class when the chain starts with the 'self' (or 'cls') argument of a method, None otherwise
+    - the names of the called attribute chain
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.scope_names: List[str] = []
+        self.class_qualname: str = None
+        self.class_self_id: str = None
+        self.in_function = False
+        self.calls_counts: Dict[Tuple[str, Optional[str], Tuple[str, ...]], int] = {}
+
+    def visit_ClassDef(self, node: ClassDef):
+        if self.in_function:
+            self.generic_visit(node)
+        else:
+            self.scope_names.append(node.name)
+            self.generic_visit(node)
+            self.scope_names.pop()
+
+    def visit_FunctionDef(self, node: FunctionDef):
+        if self.in_function:
+            self.generic_visit(node)
+            return
+
+        # a method of a class whose first argument refers to the instance or to the class (except static methods)
+        arguments = node.args.posonlyargs + node.args.args
+        is_static = any(
+            isinstance(decorator, Name) and decorator.id == 'staticmethod' for decorator in node.decorator_list
+        )
+        if len(self.scope_names) > 0 and len(arguments) > 0 and not is_static:
+            self.class_qualname = '.'.join(self.scope_names)
+            self.class_self_id = arguments[0].arg
+        self.scope_names.append(node.name)
+        self.in_function = True
+        self.generic_visit(node)
+        self.in_function = False
+        self.scope_names.pop()
+        self.class_qualname = None
+        self.class_self_id = None
+
+    def visit_AsyncFunctionDef(self, node: AsyncFunctionDef):
+        self.visit_FunctionDef(node)
+
+    def visit_Call(self, node: Call):
+        attribute_chain = get_attribute_chain(node.func)
+        if attribute_chain is not None:
+            is_self_call = self.class_self_id is not None and attribute_chain[0] == self.class_self_id
+            call_key = (
+                '.'.join(self.scope_names),
+                self.class_qualname if is_self_call else None,
+                attribute_chain,
+            )
+            self.calls_counts[call_key] = self.calls_counts.get(call_key, 0) + 1
+        self.generic_visit(node)
@@ -1,7 +1,8 @@
+import builtins
 from functools import reduce
 from inspect import isclass
 from types import ModuleType
-from typing import Iterable, List, NamedTuple, Type
+from typing import Callable, Dict, Iterable, List, NamedTuple, Type
 
 
 class NamespacedType(NamedTuple):
@@ -103,3 +104,38 @@ class ModuleResolver:
 
     def get_module_full_name(self) -> str:
         return self.module.__name__
+
+
+class StaticModuleResolver(ModuleResolver):
+    """
+    Resolves the types of a module which is parsed but not imported: the names are resolved with the bindings of
+    the module (its definitions and its imports, by name) instead of the attributes of the module object
+    """
+
+    def __init__(self, module_name: str, bindings: Dict[str, str], canonicalize: Callable[[str], str] = None):
+        super().__init__(ModuleType(module_name))
+        self.bindings = bindings
+        # follows the re-exports of the domain packages to the defining modules
+        self.canonicalize = (lambda fqn: fqn) if canonicalize is None else canonicalize
+
+    def __repr__(self) -> str:
+        return f'StaticModuleResolver({self.module.__name__})'
+
+    def resolve_full_namespace_type(self, partial_dotted_path: str) -> NamespacedType:
+        if partial_dotted_path is None:
+            return EMPTY_NAMESPACED_TYPE
+
+        # special case for Union types
+        if partial_dotted_path == 'None':
+            return NamespacedType('builtins.None', 'None')
+
+        namespaces = partial_dotted_path.split('.')
+        bound_fqn = self.bindings.get(namespaces[0])
+        if bound_fqn is not None:
+            return NamespacedType(self.canonicalize('.'.join([bound_fqn] + namespaces[1:])), namespaces[-1])
+
+        if len(namespaces) == 1 and hasattr(builtins, partial_dotted_path):
+            return NamespacedType(f'builtins.{partial_dotted_path}', partial_dotted_path)
+
+        # the name is not bound statically (star import from an external module, for instance): it is kept as is
+        return NamespacedType(partial_dotted_path, namespaces[-1])
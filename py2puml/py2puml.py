@@ -1,16 +1,176 @@
-from typing import Dict, Iterable, List
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
+from py2puml.domain.diagnostic import InspectionDiagnostic
+from py2puml.domain.domainfilter import DomainFilter
+from py2puml.domain.domainmodel import DomainModel
+from py2puml.domain.inspectionprofile import FULL_PROFILE, InspectionProfile
 from py2puml.domain.umlfunction import UmlModule
 from py2puml.domain.umlitem import UmlItem
 from py2puml.domain.umlrelation import UmlRelation
-from py2puml.export.puml import to_puml_content
-from py2puml.inspection.inspectpackage import inspect_package
+from py2puml.export.puml import to_puml_diagram
+from py2puml.inspection.gitrevision import read_revision_modules
+from py2puml.inspection.inspectpackage import aggregate_relations_in_place, inspect_packages
+from py2puml.inspection.inspectstatic import StaticModule, inspect_static_modules
+from py2puml.inspection.staticsources import read_static_modules
 
 
-def py2puml(domain_path: str, domain_module: str) -> Iterable[str]:
+def belongs_to_root(fqn: str, root_module: str) -> bool:
+    return fqn == root_module or fqn.startswith(f'{root_module}.')
+
+
+def inspect(
+    domain_path: str,
+    domain_module: str,
+    additional_roots: Iterable[Tuple[str, str]] = (),
+    workers: int = 0,
+    module_timeout: Optional[float] = None,
+    bounded_memory: bool = False,
+    domain_filter: Optional[DomainFilter] = None,
+    inspection_profile: InspectionProfile = FULL_PROFILE,
+) -> DomainModel:
+    """
+    Inspects the given domain and returns its model, which can be rendered by several exporters.
+
+    Additional (domain_path, domain_module) roots are inspected in the same session, so that the relations between
+    the roots are resolved.
+    With workers or a module_timeout (in seconds), the modules are imported and inspected in worker processes:
+    the modules which cannot be inspected are skipped and reported in the diagnostics of the model.
+    With bounded_memory, the inspected domain modules are released once their definitions are captured.
+    The modules and definitions rejected by the domain_filter are not inspected (the excluded modules are not imported).
+    The inspection_profile selects the inspected features (see INSPECTION_PROFILES): the 'structure' profile only
+    documents the boxes of the definitions and their inheritance relations.
+    """
+    domain_roots: List[Tuple[str, str]] = [(domain_path, domain_module), *additional_roots]
+    domain_items_by_fqn: Dict[str, UmlItem] = {}
+    domain_relations: List[UmlRelation] = []
+    modules_by_name: Dict[str, UmlModule] = {}
+    diagnostics: List[InspectionDiagnostic] = []
+    inspect_packages(
+        domain_roots,
+        domain_items_by_fqn,
+        domain_relations,
+        modules_by_name,
+        diagnostics,
+        workers,
+        module_timeout,
+        bounded_memory,
+        domain_filter,
+        inspection_profile,
+    )
+
+    return DomainModel(domain_module, domain_items_by_fqn, domain_relations, modules_by_name, diagnostics)
+
+
+def inspect_static_roots(
+    domain_roots: List[Tuple[str, str]],
+    read_modules: Callable[[str, str], Iterable[StaticModule]],
+    domain_filter: Optional[DomainFilter] = None,
+) -> DomainModel:
+    """Parses the sources of the modules read for each (domain_path, domain_module) root by the static inspection"""
+    static_modules: List[StaticModule] = [
+        static_module
+        for root_path, root_module in domain_roots
+        for static_module in read_modules(root_path, root_module)
+    ]
     domain_items_by_fqn: Dict[str, UmlItem] = {}
     domain_relations: List[UmlRelation] = []
     modules_by_name: Dict[str, UmlModule] = {}
-    inspect_package(domain_path, domain_module, domain_items_by_fqn, domain_relations, modules_by_name)
+    inspect_static_modules(
+        static_modules,
+        tuple(root_module for _, root_module in domain_roots),
+        domain_items_by_fqn,
+        domain_relations,
+        modules_by_name,
+        domain_filter,
+    )
+    aggregate_relations_in_place(domain_relations)
+
+    return DomainModel(domain_roots[0][1], domain_items_by_fqn, domain_relations, modules_by_name)
+
+
+def inspect_static(
+    domain_path: str,
+    domain_module: str,
+    additional_roots: Iterable[Tuple[str, str]] = (),
+    domain_filter: Optional[DomainFilter] = None,
+) -> DomainModel:
+    """
+    Inspects the domain from the sources of its working tree, without importing it.
+    The stub of a module (its .pyi file) is parsed instead of its implementation when it exists.
+    The domain paths may lead into wheels, zip files or zipapps, whose modules are read without being extracted.
+    """
+    return inspect_static_roots(
+        [(domain_path, domain_module), *additional_roots],
+        lambda root_path, root_module: read_static_modules(root_path, root_module, domain_filter),
+        domain_filter,
+    )
+
+
+def inspect_revision(
+    domain_path: str,
+    domain_module: str,
+    revision: str,
+    additional_roots: Iterable[Tuple[str, str]] = (),
+    domain_filter: Optional[DomainFilter] = None,
+) -> DomainModel:
+    """
+    Inspects the domain as it is at the given git revision, without checking it out nor importing it:
+    the sources of the modules (or their stubs) are read from the git object database and parsed by the static
+    inspection. The sources of the modules rejected by the domain_filter are not read.
+    """
+    return inspect_static_roots(
+        [(domain_path, domain_module), *additional_roots],
+        lambda root_path, root_module: read_revision_modules(root_path, root_module, revision, domain_filter),
+        domain_filter,
+    )
+
+
+def split_by_roots(domain_model: DomainModel, root_modules: Iterable[str]) -> Iterable[DomainModel]:
+    """
+    Yields a view of the model for each root, cross-root relations being kept in the views of both roots
+    """
+    for root_module in root_modules:
+        yield domain_model.filtered(lambda fqn, root_module=root_module: belongs_to_root(fqn, root_module), root_module)
+
+
+def py2puml(
+    domain_path: str,
+    domain_module: str,
+    additional_roots: Iterable[Tuple[str, str]] = (),
+    split_by_root: bool = False,
+    diagnostics: Optional[List[InspectionDiagnostic]] = None,
+    workers: int = 0,
+    module_timeout: Optional[float] = None,
+    bounded_memory: bool = False,
+    domain_filter: Optional[DomainFilter] = None,
+    inspection_profile: InspectionProfile = FULL_PROFILE,
+) -> Iterable[str]:
+    """
+    Generates the PlantUML documentation of the given domain (see inspect() for the inspection parameters).
+
+    All the roots are documented in one diagram, or in one diagram per root if split_by_root is True.
+    The modules which could not be inspected are added to the given diagnostics list.
+    """
+    additional_roots = list(additional_roots)
+    domain_model = inspect(
+        domain_path,
+        domain_module,
+        additional_roots,
+        workers,
+        module_timeout,
+        bounded_memory,
+        domain_filter,
+        inspection_profile,
+    )
+    if diagnostics is not None:
+        diagnostics.extend(domain_model.diagnostics)
+
+    if not split_by_root:
+        return to_puml_diagram(domain_model)
 
-    return to_puml_content(domain_module, domain_items_by_fqn.values(), domain_relations,modules_by_name)
+    root_modules = [domain_module] + [root_module for _, root_module in additional_roots]
+    return (
+        puml_line
+        for root_domain_model in split_by_roots(domain_model, root_modules)
+        for puml_line in to_puml_diagram(root_domain_model)
+    )
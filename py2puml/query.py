@@ -0,0 +1,141 @@
+from collections import ChainMap
+from fnmatch import fnmatchcase
+from importlib import import_module
+from inspect import isfunction
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from py2puml.domain.definitionstub import DefinitionStub
+from py2puml.domain.domainfilter import DomainFilter
+from py2puml.domain.domainmodel import DomainModel
+from py2puml.domain.inspectionprofile import FULL_PROFILE, InspectionProfile
+from py2puml.domain.umlfunction import UmlFunction, UmlModule
+from py2puml.domain.umlitem import UmlItem
+from py2puml.domain.umlrelation import UmlRelation
+from py2puml.inspection.inspectmodule import filter_domain_definitions, inspect_domain_definition
+from py2puml.inspection.inspectpackage import aggregate_relations_in_place, list_domain_module_names
+
+
+def get_definition_line_number(definition: Any) -> Optional[int]:
+    """Returns the line number of the definition when it is available without reading its source file"""
+    if isfunction(definition):
+        return definition.__code__.co_firstlineno
+    # available for classes since Python 3.13
+    return getattr(definition, '__firstlineno__', None)
+
+
+class DomainQuery:
+    """
+    Lazy inspection of a domain: the discovery only registers lightweight stubs of the domain definitions.
+    The attributes, methods and relations of a definition are inspected (and memoised) the first time they are queried,
+    so that focused diagrams cost time proportional to the number of documented definitions.
+    """
+
+    def __init__(
+        self,
+        domain_path: str,
+        domain_module: str,
+        additional_roots: Iterable[Tuple[str, str]] = (),
+        domain_filter: Optional[DomainFilter] = None,
+        inspection_profile: InspectionProfile = FULL_PROFILE,
+    ):
+        self.name = domain_module
+        domain_roots: List[Tuple[str, str]] = [(domain_path, domain_module), *additional_roots]
+        self.root_module_names: Tuple[str, ...] = tuple(root_module for _, root_module in domain_roots)
+        self.stubs_by_fqn: Dict[str, DefinitionStub] = {}
+        self.definitions_by_fqn: Dict[str, Any] = {}
+        self.items_by_fqn: Dict[str, UmlItem] = {}
+        self.structural_relations_by_fqn: Dict[str, List[UmlRelation]] = {}
+        self.dependency_relations_by_fqn: Dict[str, List[UmlRelation]] = {}
+        self.domain_filter = domain_filter
+        self.inspection_profile = inspection_profile
+
+        module_names = list(self.root_module_names) + list_domain_module_names(domain_roots, domain_filter)
+        self.inspected_module_names: FrozenSet[str] = frozenset(module_names)
+        for module_name in module_names:
+            self.discover_module(module_name)
+
+    def discover_module(self, module_name: str):
+        module = import_module(module_name)
+        for definition in filter_domain_definitions(
+            module, self.root_module_names, self.inspected_module_names, self.domain_filter
+        ):
+            # the module functions are not documented by the profiles without functions
+            if isfunction(definition) and not self.inspection_profile.functions:
+                continue
+            definition_fqn = f'{definition.__module__}.{definition.__name__}'
+            if definition_fqn not in self.stubs_by_fqn:
+                definition_module = import_module(definition.__module__)
+                self.stubs_by_fqn[definition_fqn] = DefinitionStub(
+                    definition.__name__,
+                    definition_fqn,
+                    definition.__module__,
+                    getattr(definition_module, '__file__', None),
+                    get_definition_line_number(definition),
+                )
+                self.definitions_by_fqn[definition_fqn] = definition
+
+    def find(self, fqn_pattern: str = '*') -> List[DefinitionStub]:
+        """Returns the stubs of the definitions whose fully-qualified name matches the glob pattern"""
+        return [stub for fqn, stub in self.stubs_by_fqn.items() if fnmatchcase(fqn, fqn_pattern)]
+
+    def item(self, fqn: str) -> UmlItem:
+        """Returns the inspected item (attributes, methods) of the given definition"""
+        if fqn not in self.items_by_fqn:
+            definition_items_by_fqn: Dict[str, UmlItem] = {}
+            structural_relations: List[UmlRelation] = []
+            stub = self.stubs_by_fqn[fqn]
+            inspect_domain_definition(
+                self.definitions_by_fqn[fqn],
+                self.root_module_names,
+                definition_items_by_fqn,
+                structural_relations,
+                UmlModule(stub.module),
+                inspection_profile=self.inspection_profile,
+            )
+            self.items_by_fqn[fqn] = definition_items_by_fqn[fqn]
+            self.structural_relations_by_fqn[fqn] = structural_relations
+
+        return self.items_by_fqn[fqn]
+
+    def relations(self, fqn: str) -> List[UmlRelation]:
+        """Returns the relations (compositions, inheritance and dependencies) found while inspecting the definition"""
+        if fqn not in self.dependency_relations_by_fqn:
+            uml_item = self.item(fqn)
+            dependency_relations: List[UmlRelation] = []
+            # the dependencies are resolved against the stubs of all the domain definitions
+            inspect_domain_definition(
+                self.definitions_by_fqn[fqn],
+                self.root_module_names,
+                ChainMap({fqn: uml_item}, self.stubs_by_fqn),
+                dependency_relations,
+                UmlModule(self.stubs_by_fqn[fqn].module),
+                firstPass=False,
+                inspection_profile=self.inspection_profile,
+            )
+            self.dependency_relations_by_fqn[fqn] = dependency_relations
+
+        return self.structural_relations_by_fqn[fqn] + self.dependency_relations_by_fqn[fqn]
+
+    def model(self, fqns: Iterable[str] = None, name: str = None) -> DomainModel:
+        """
+        Returns the model of the given definitions (all the discovered ones by default), inspecting them if needed.
+        Only the relations between the given definitions are kept.
+        """
+        fqns = list(self.stubs_by_fqn.keys() if fqns is None else fqns)
+        items_by_fqn: Dict[str, UmlItem] = {fqn: self.item(fqn) for fqn in fqns}
+        modules_by_name: Dict[str, UmlModule] = {}
+        for uml_item in items_by_fqn.values():
+            if isinstance(uml_item, UmlFunction):
+                modules_by_name.setdefault(uml_item.module, UmlModule(uml_item.module)).functions.append(uml_item)
+
+        # module functions are documented in a '<module>.Methods' box
+        documented_fqns = set(items_by_fqn.keys()) | {f'{module_name}.Methods' for module_name in modules_by_name}
+        relations: List[UmlRelation] = [
+            uml_relation
+            for fqn in fqns
+            for uml_relation in self.relations(fqn)
+            if uml_relation.source_fqn in documented_fqns and uml_relation.target_fqn in documented_fqns
+        ]
+        aggregate_relations_in_place(relations)
+
+        return DomainModel(self.name if name is None else name, items_by_fqn, relations, modules_by_name)
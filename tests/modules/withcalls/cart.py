@@ -0,0 +1,19 @@
+from tests.modules.withcalls import pricing
+from tests.modules.withcalls.pricing import Pricer
+
+
+class Cart:
+    def __init__(self, amounts: list):
+        self.amounts = amounts
+        self.pricer = Pricer(0.1)
+
+    def total(self) -> float:
+        return sum(self.price_of(amount) for amount in self.amounts)
+
+    def price_of(self, amount: float) -> float:
+        return Pricer.round_price(self.pricer.price(amount))
+
+
+class DiscountedCart(Cart):
+    def discounted_total(self) -> float:
+        return pricing.apply_discount(self.total(), 0.05) + pricing.apply_discount(0, 0)
@@ -0,0 +1,14 @@
+def apply_discount(price: float, rate: float) -> float:
+    return price * (1 - rate)
+
+
+class Pricer:
+    def __init__(self, rate: float):
+        self.rate = rate
+
+    def price(self, amount: float) -> float:
+        return apply_discount(amount, self.rate)
+
+    @staticmethod
+    def round_price(price: float) -> float:
+        return round(price, 2)
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass
+class Member:
+    name: str
+    team: 'Team'
+
+
+@dataclass
+class Team:
+    members: List[Member]
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class Engine:
+    horsepower: int
+
+
+@dataclass
+class Car:
+    engine: Engine
+
+
+@dataclass
+class CarFixture:
+    car: Car
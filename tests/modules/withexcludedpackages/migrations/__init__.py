@@ -0,0 +1,2 @@
+# simulates a package which cannot be imported outside of its framework
+raise RuntimeError('migrations must not be imported')
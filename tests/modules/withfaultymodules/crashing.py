@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from os import _exit
+
+# simulates a module crashing the interpreter (a faulty C extension for example)
+_exit(3)
+
+
+@dataclass
+class Model:
+    weights: str
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+raise RuntimeError('missing configuration')
+
+
+@dataclass
+class Configuration:
+    path: str
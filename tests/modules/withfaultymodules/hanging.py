@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from time import sleep
+
+# simulates a module opening a connection which never answers
+sleep(60)
+
+
+@dataclass
+class Connection:
+    url: str
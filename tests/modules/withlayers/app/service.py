@@ -0,0 +1,10 @@
+from tests.modules.withlayers.domain.order import Order
+from tests.modules.withlayers.infrastructure.repository import OrderRepository
+
+
+class OrderService:
+    def __init__(self, repository: OrderRepository):
+        self.repository = repository
+
+    def order(self, reference: str) -> Order:
+        return self.repository.find(reference)
@@ -0,0 +1,7 @@
+from tests.modules.withlayers.infrastructure.database import Database
+
+
+class Order:
+    def __init__(self, reference: str, database: Database):
+        self.reference = reference
+        self.database = database
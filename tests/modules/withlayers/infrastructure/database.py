@@ -0,0 +1,3 @@
+class Database:
+    def __init__(self, url: str):
+        self.url = url
@@ -0,0 +1,10 @@
+from tests.modules.withlayers.domain.order import Order
+from tests.modules.withlayers.infrastructure.database import Database
+
+
+class OrderRepository:
+    def __init__(self, database: Database):
+        self.database = database
+
+    def find(self, reference: str) -> Order:
+        pass
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+from tests.modules.withmultipleroots.vehicles.car import Car
+
+
+@dataclass
+class ParkingSpot:
+    number: int
+    car: Car
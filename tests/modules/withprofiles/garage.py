@@ -0,0 +1,23 @@
+class Engine:
+    def __init__(self, power: int):
+        self.power = power
+
+
+class Mechanic:
+    def repair(self, engine: Engine) -> Engine:
+        return engine
+
+
+class Car:
+    wheels: int = 4
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+
+
+class SportsCar(Car):
+    pass
+
+
+def build_car(engine: Engine) -> Car:
+    return Car(engine)
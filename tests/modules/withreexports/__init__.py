@@ -0,0 +1,3 @@
+from tests.modules.withreexports.wheel import Wheel, inflate
+
+__all__ = ['Wheel', 'inflate']
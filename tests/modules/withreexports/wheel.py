@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class Wheel:
+    diameter: float
+
+
+# an alias of the Wheel class
+Tire = Wheel
+
+
+def inflate(wheel: Wheel) -> Wheel:
+    return wheel
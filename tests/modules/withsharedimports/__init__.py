@@ -0,0 +1,2 @@
+# counts the executions of the shared module, which is imported by the other modules
+shared_imports_count = 0
@@ -0,0 +1,6 @@
+from tests.modules.withsharedimports.shared import Money
+
+
+class Invoice:
+    def __init__(self, total: Money):
+        self.total = total
@@ -0,0 +1,6 @@
+from tests.modules.withsharedimports.shared import Money
+
+
+class Quote:
+    def __init__(self, estimate: Money):
+        self.estimate = estimate
@@ -0,0 +1,9 @@
+from tests.modules import withsharedimports
+
+withsharedimports.shared_imports_count += 1
+
+
+class Money:
+    def __init__(self, amount: float, currency: str):
+        self.amount = amount
+        self.currency = currency
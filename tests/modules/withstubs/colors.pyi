@@ -0,0 +1,6 @@
+from enum import Enum
+
+class Color(Enum):
+    RED: int
+    GREEN = 2
+    BLUE = ...
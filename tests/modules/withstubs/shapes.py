@@ -0,0 +1,19 @@
+from math import pi
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class Circle:
+    unit = 'cm'
+
+    def __init__(self, center, radius, color):
+        self.center = center
+        self.radius = radius
+        self.color = color
+
+    def area(self):
+        return pi * self.radius**2
@@ -0,0 +1,16 @@
+from typing import ClassVar
+
+from .colors import Color
+
+class Point:
+    x: float
+    y: float
+    def __init__(self, x: float, y: float) -> None: ...
+
+class Circle:
+    unit: ClassVar[str]
+    center: Point
+    radius: float
+    color: Color
+    def __init__(self, center: Point, radius: float, color: Color) -> None: ...
+    def area(self) -> float: ...
@@ -0,0 +1,82 @@
+from subprocess import PIPE, run
+
+from py2puml.analysis.cycles import (
+    DependencyCycle,
+    build_adjacency,
+    dependency_edge,
+    find_class_cycles,
+    find_cycles,
+    find_module_cycles,
+    strongly_connected_components,
+)
+from py2puml.domain.domainmodel import DomainModel
+from py2puml.domain.umlclass import UmlClass
+from py2puml.domain.umlrelation import RelType, UmlRelation
+
+
+def test_build_adjacency_deduplicates_edges():
+    node_names, successors = build_adjacency([('a', 'b'), ('a', 'b'), ('b', 'c')])
+
+    assert node_names == ['a', 'b', 'c']
+    assert successors == [[1], [2], []]
+
+
+def test_strongly_connected_components():
+    # 0 -> 1 -> 2 -> 0 is a cycle, 3 depends on it
+    components = strongly_connected_components([[1], [2], [0], [2]])
+
+    assert sorted(sorted(component) for component in components) == [[0, 1, 2], [3]]
+
+
+def test_strongly_connected_components_without_recursion_limit():
+    nodes_number = 100000
+    components = strongly_connected_components([[(node + 1) % nodes_number] for node in range(nodes_number)])
+
+    assert len(components) == 1
+    assert len(components[0]) == nodes_number
+
+
+def test_find_cycles_ignores_acyclic_nodes():
+    cycles = find_cycles([('a', 'b'), ('b', 'a'), ('b', 'c'), ('d', 'd')])
+
+    assert cycles == [
+        DependencyCycle(['a', 'b'], [('a', 'b'), ('b', 'a')]),
+        DependencyCycle(['d'], [('d', 'd')]),
+    ]
+
+
+def test_dependency_edge_reverses_inheritance():
+    assert dependency_edge(UmlRelation('pkg.Parent', 'pkg.Child', RelType.INHERITANCE)) == ('pkg.Child', 'pkg.Parent')
+    assert dependency_edge(UmlRelation('pkg.Car', 'pkg.Wheel', RelType.COMPOSITION)) == ('pkg.Car', 'pkg.Wheel')
+
+
+def test_find_module_cycles_ignores_dependencies_within_modules():
+    fqns = ['pkg.a.First', 'pkg.a.Second', 'pkg.b.Third']
+    domain_model = DomainModel(
+        'pkg',
+        {fqn: UmlClass(fqn.rpartition('.')[2], fqn, [], []) for fqn in fqns},
+        [
+            UmlRelation('pkg.a.First', 'pkg.b.Third', RelType.COMPOSITION),
+            # pkg.b.Third inherits from pkg.a.Second
+            UmlRelation('pkg.a.Second', 'pkg.b.Third', RelType.INHERITANCE),
+        ],
+        {},
+    )
+
+    assert find_class_cycles(domain_model) == []
+    assert find_module_cycles(domain_model) == [
+        DependencyCycle(['pkg.a', 'pkg.b'], [('pkg.a', 'pkg.b'), ('pkg.b', 'pkg.a')])
+    ]
+
+
+def test_cli_cycles():
+    command = ['py2puml', 'cycles', 'tests/modules/withcycles', 'tests.modules.withcycles']
+    cli_stdout = run(command, stdout=PIPE, stderr=PIPE, text=True, check=True).stdout
+
+    assert cli_stdout.splitlines() == [
+        '1 class cycle(s)',
+        'class cycle 1 (2 nodes, 2 edges):',
+        '  tests.modules.withcycles.team.Member -> tests.modules.withcycles.team.Team',
+        '  tests.modules.withcycles.team.Team -> tests.modules.withcycles.team.Member',
+        '0 module cycle(s)',
+    ]
@@ -0,0 +1,80 @@
+from pytest import importorskip
+
+from py2puml.analysis.metrics import (
+    compute_depths_of_inheritance,
+    compute_metrics,
+    count_couplings,
+    count_couplings_with_numpy,
+)
+from py2puml.domain.domainmodel import DomainModel
+from py2puml.domain.metrics import ClassMetrics, PackageMetrics
+from py2puml.domain.umlclass import UmlClass
+from py2puml.domain.umlrelation import RelType, UmlRelation
+from py2puml.export.csv import to_csv_metrics
+
+# 0 and 1 in package 0, 2 and 3 in package 1: 0 -> 1, 0 -> 2, 1 -> 2, 1 -> 3, 3 -> 0
+SOURCES, TARGETS, NODE_PACKAGES = [0, 0, 1, 1, 3], [1, 2, 2, 3, 0], [0, 0, 1, 1]
+
+
+def uml_class(fqn: str) -> UmlClass:
+    return UmlClass(fqn.rpartition('.')[2], fqn, [], [])
+
+
+def test_count_couplings():
+    fan_ins, fan_outs, afferent_couplings, efferent_couplings = count_couplings(SOURCES, TARGETS, NODE_PACKAGES, 2)
+
+    assert fan_ins == [1, 1, 2, 1]
+    assert fan_outs == [2, 2, 0, 1]
+    # package 0 is used by 3, package 1 by 0 and 1
+    assert afferent_couplings == [1, 2]
+    assert efferent_couplings == [2, 1]
+
+
+def test_count_couplings_with_numpy_like_in_pure_python():
+    importorskip('numpy')
+
+    assert count_couplings_with_numpy(SOURCES, TARGETS, NODE_PACKAGES, 2) == count_couplings(
+        SOURCES, TARGETS, NODE_PACKAGES, 2
+    )
+
+
+def test_compute_depths_of_inheritance_along_the_longest_path():
+    # 3 inherits from 0 and from 2, which inherits from 1, which inherits from 0
+    assert compute_depths_of_inheritance([[], [0], [1], [0, 2]]) == [0, 1, 2, 3]
+
+
+def test_compute_metrics_per_definition_and_per_module():
+    items_by_fqn = {
+        fqn: uml_class(fqn) for fqn in ('shop.base.Entity', 'shop.orders.Order', 'shop.orders.Line', 'shop.Product')
+    }
+    domain_model = DomainModel(
+        'shop',
+        items_by_fqn,
+        [
+            UmlRelation('shop.base.Entity', 'shop.orders.Order', RelType.INHERITANCE),
+            UmlRelation('shop.orders.Order', 'shop.orders.Line', RelType.COMPOSITION),
+            UmlRelation('shop.orders.Line', 'shop.Product', RelType.COMPOSITION),
+            UmlRelation('shop.orders.Line', 'shop.Product', RelType.DEPENDENCY),
+            UmlRelation('shop.Product', 'external.Price', RelType.DEPENDENCY),
+        ],
+        {},
+    )
+
+    domain_metrics = compute_metrics(domain_model, ['shop'], vectorized=False)
+
+    assert domain_metrics.class_metrics == [
+        ClassMetrics('shop.base.Entity', 1, 0, 0.0, 0),
+        ClassMetrics('shop.orders.Order', 0, 2, 1.0, 1),
+        ClassMetrics('shop.orders.Line', 1, 1, 0.5, 0),
+        ClassMetrics('shop.Product', 1, 0, 0.0, 0),
+    ]
+    assert domain_metrics.package_metrics == [
+        PackageMetrics('shop.base', 1, 1, 0, 0.0),
+        PackageMetrics('shop.orders', 2, 0, 2, 1.0),
+        PackageMetrics('shop', 1, 1, 0, 0.0),
+    ]
+    assert list(to_csv_metrics(domain_metrics))[:2] == [
+        'scope,name,definitions_count,fan_in,fan_out,afferent_coupling,efferent_coupling,instability,'
+        'depth_of_inheritance\n',
+        'package,shop.base,1,,,1,0,0.000,\n',
+    ]
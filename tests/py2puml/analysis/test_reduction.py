@@ -0,0 +1,63 @@
+from py2puml.analysis.reduction import find_redundant_edges, reduce_relations, transitively_reduced
+from py2puml.domain.domainmodel import DomainModel
+from py2puml.domain.umlclass import UmlClass
+from py2puml.domain.umlrelation import RelType, UmlRelation
+
+
+def test_find_redundant_edges_of_a_dag():
+    # a -> b -> c -> d, the a -> c, a -> d and b -> d edges are implied by the longer paths
+    edges = [('a', 'b'), ('b', 'c'), ('c', 'd'), ('a', 'c'), ('a', 'd'), ('b', 'd'), ('a', 'e')]
+
+    assert find_redundant_edges(edges) == {('a', 'c'), ('a', 'd'), ('b', 'd')}
+
+
+def test_find_redundant_edges_keeps_the_edges_of_the_cycles():
+    # b <-> c is a cycle reached from a directly and through d
+    edges = [('a', 'b'), ('b', 'c'), ('c', 'b'), ('a', 'd'), ('d', 'c'), ('c', 'e'), ('a', 'e')]
+
+    assert find_redundant_edges(edges) == {('a', 'b'), ('a', 'e')}
+
+
+def test_reduce_relations_per_relation_type():
+    uml_relations = [
+        UmlRelation('domain.A', 'domain.B', RelType.DEPENDENCY),
+        UmlRelation('domain.B', 'domain.C', RelType.DEPENDENCY),
+        UmlRelation('domain.A', 'domain.C', RelType.DEPENDENCY),
+        # the path through the composition does not make the dependency redundant
+        UmlRelation('domain.C', 'domain.D', RelType.COMPOSITION),
+        UmlRelation('domain.A', 'domain.D', RelType.DEPENDENCY),
+        # the compositions are not reduced
+        UmlRelation('domain.D', 'domain.E', RelType.COMPOSITION),
+        UmlRelation('domain.C', 'domain.E', RelType.COMPOSITION),
+    ]
+
+    assert [(uml_relation.source_fqn, uml_relation.target_fqn) for uml_relation in reduce_relations(uml_relations)] == [
+        ('domain.A', 'domain.B'),
+        ('domain.B', 'domain.C'),
+        ('domain.C', 'domain.D'),
+        ('domain.A', 'domain.D'),
+        ('domain.D', 'domain.E'),
+        ('domain.C', 'domain.E'),
+    ]
+
+
+def test_transitively_reduced_inheritance():
+    items_by_fqn = {
+        fqn: UmlClass(fqn.rpartition('.')[2], fqn, [], []) for fqn in ('domain.Base', 'domain.Mixin', 'domain.Leaf')
+    }
+    # Leaf inherits from Base both directly and through Mixin
+    domain_model = DomainModel(
+        'domain',
+        items_by_fqn,
+        [
+            UmlRelation('domain.Base', 'domain.Mixin', RelType.INHERITANCE),
+            UmlRelation('domain.Mixin', 'domain.Leaf', RelType.INHERITANCE),
+            UmlRelation('domain.Base', 'domain.Leaf', RelType.INHERITANCE),
+        ],
+        {},
+    )
+
+    reduced_model = transitively_reduced(domain_model)
+
+    assert reduced_model.items_by_fqn == domain_model.items_by_fqn
+    assert reduced_model.relations == domain_model.relations[:2]
@@ -0,0 +1,82 @@
+from pathlib import Path
+from subprocess import PIPE, run
+
+from py2puml.analysis.rules import ModulePatterns, check_architecture, format_violations_report
+from py2puml.domain.architecturerules import ForbiddenDependency, LayeredArchitecture, RuleViolation
+from py2puml.domain.umlrelation import RelType
+from py2puml.py2puml import inspect
+
+LAYERS_MODULE = 'tests.modules.withlayers'
+
+
+def test_module_patterns_match_the_modules_and_their_packages():
+    module_patterns = ModulePatterns(['app.domain', 'app.*.models', 'infrastructure*'])
+
+    assert module_patterns.module_matches('app.domain.order') == {0}
+    assert module_patterns.module_matches('app.billing.models.invoice') == {1}
+    assert module_patterns.module_matches('app.service') == frozenset()
+    # the package prefixes are matched once
+    module_patterns.module_matches('app.domain.customer')
+    assert set(module_patterns.matches_by_prefix.keys()) == {
+        'app',
+        'app.domain',
+        'app.domain.order',
+        'app.domain.customer',
+        'app.billing',
+        'app.billing.models',
+        'app.billing.models.invoice',
+        'app.service',
+    }
+
+
+def test_check_architecture_reports_the_located_violations():
+    domain_model = inspect('tests/modules/withlayers', LAYERS_MODULE)
+
+    violations = check_architecture(
+        domain_model,
+        [ForbiddenDependency(f'{LAYERS_MODULE}.domain', f'{LAYERS_MODULE}.infrastructure')],
+        [LayeredArchitecture(['*.app', '*.infrastructure', '*.domain'])],
+    )
+
+    order_path = str(Path('tests/modules/withlayers/domain/order.py').resolve())
+    order_fqn, database_fqn = f'{LAYERS_MODULE}.domain.order.Order', f'{LAYERS_MODULE}.infrastructure.database.Database'
+    assert violations == [
+        RuleViolation(
+            f'{LAYERS_MODULE}.domain must not depend on {LAYERS_MODULE}.infrastructure',
+            order_fqn,
+            database_fqn,
+            RelType.COMPOSITION,
+            order_path,
+            4,
+        ),
+        RuleViolation(
+            'layer *.domain must not depend on upper layer *.infrastructure',
+            order_fqn,
+            database_fqn,
+            RelType.COMPOSITION,
+            order_path,
+            4,
+        ),
+    ]
+    assert list(format_violations_report(violations[1:])) == [
+        '1 architecture rule violation(s)\n',
+        f'{order_path}:4: {order_fqn} -> {database_fqn} (composition): '
+        'layer *.domain must not depend on upper layer *.infrastructure\n',
+    ]
+
+
+def test_check_architecture_without_violation():
+    domain_model = inspect('tests/modules/withlayers', LAYERS_MODULE)
+
+    # the infrastructure depends on the domain, the application on both
+    assert check_architecture(domain_model, [], [LayeredArchitecture(['*.app', '*.infrastructure'])]) == []
+
+
+def test_cli_check_exits_with_1_on_violations():
+    command = ['py2puml', 'check', 'tests/modules/withlayers', LAYERS_MODULE, '--forbid', '*.domain', '*.app']
+    assert run(command, stdout=PIPE, stderr=PIPE, text=True).returncode == 0
+
+    command = ['py2puml', 'check', 'tests/modules/withlayers', LAYERS_MODULE, '--layers', '*.domain', '*.app']
+    cli_process = run(command, stdout=PIPE, stderr=PIPE, text=True)
+    assert cli_process.returncode == 1
+    assert '1 architecture rule violation(s)' in cli_process.stdout
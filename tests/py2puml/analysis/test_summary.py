@@ -0,0 +1,55 @@
+from py2puml.analysis.summary import summarize_packages
+from py2puml.domain.domainmodel import DomainModel
+from py2puml.domain.packagesummary import PackageRelation, PackageSummary
+from py2puml.domain.umlclass import UmlClass
+from py2puml.domain.umlrelation import RelType, UmlRelation
+from py2puml.export.puml import to_puml_package_summary
+from py2puml.py2puml import inspect
+
+
+def uml_class(fqn: str) -> UmlClass:
+    return UmlClass(fqn.rpartition('.')[2], fqn, [], [])
+
+
+def test_summarize_packages_counts_the_relations_per_type():
+    items_by_fqn = {
+        fqn: uml_class(fqn)
+        for fqn in ('shop.orders.order.Order', 'shop.orders.line.Line', 'shop.products.product.Product', 'shop.App')
+    }
+    domain_model = DomainModel(
+        'shop',
+        items_by_fqn,
+        [
+            UmlRelation('shop.orders.order.Order', 'shop.orders.line.Line', RelType.COMPOSITION),
+            UmlRelation('shop.orders.line.Line', 'shop.products.product.Product', RelType.COMPOSITION),
+            UmlRelation('shop.orders.order.Order', 'shop.products.product.Product', RelType.DEPENDENCY, 'total', 3),
+            UmlRelation('shop.orders.line.Line', 'shop.products.product.Product', RelType.DEPENDENCY),
+            UmlRelation('shop.App', 'external.Logger', RelType.DEPENDENCY),
+        ],
+        {},
+    )
+
+    assert summarize_packages(domain_model, ['shop']) == PackageSummary(
+        'shop',
+        {'shop.orders': 2, 'shop.products': 1, 'shop': 1},
+        [
+            PackageRelation('shop.orders', 'shop.products', RelType.COMPOSITION, 1),
+            PackageRelation('shop.orders', 'shop.products', RelType.DEPENDENCY, 4),
+        ],
+    )
+    # at depth 2, the modules of the packages are distinct
+    assert len(summarize_packages(domain_model, ['shop'], 2).package_relations) == 4
+
+
+def test_summarize_packages_of_an_inspected_domain():
+    domain_model = inspect('tests/modules/withsubdomain', 'tests.modules.withsubdomain')
+
+    package_summary = summarize_packages(domain_model, ['tests.modules.withsubdomain'])
+
+    assert package_summary.definitions_counts == {
+        'tests.modules.withsubdomain.subdomain': 3,
+        'tests.modules.withsubdomain.withsubdomain': 1,
+    }
+    puml_content = ''.join(to_puml_package_summary(package_summary))
+    assert 'package tests.modules.withsubdomain.subdomain <<3 definitions>> {\n}\n' in puml_content
+    assert 'tests.modules.withsubdomain.withsubdomain *-- tests.modules.withsubdomain.subdomain: 1\n' in puml_content
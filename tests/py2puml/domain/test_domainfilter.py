@@ -0,0 +1,36 @@
+from pytest import mark
+
+from py2puml.domain.domainfilter import DomainFilter, matches_module_patterns
+
+
+def test_matches_module_patterns():
+    assert matches_module_patterns('domain.tests.test_car', ['domain.tests'])
+    assert matches_module_patterns('domain.migrations', ['*.migrations'])
+    assert not matches_module_patterns('domain.car', ['domain.tests'])
+
+
+@mark.parametrize(
+    ['domain_filter', 'package_name', 'is_walked'],
+    [
+        (DomainFilter(), 'domain.tests', True),
+        (DomainFilter(exclude_modules=('*.tests',)), 'domain.tests', False),
+        # the package leads to the included modules
+        (DomainFilter(include_modules=('domain.vehicles.car',)), 'domain.vehicles', True),
+        (DomainFilter(include_modules=('domain.vehicles.car',)), 'domain.garage', False),
+        (DomainFilter(include_modules=('domain.vehicles*',)), 'domain', True),
+        (DomainFilter(include_modules=('*.car',)), 'domain.garage', True),
+    ],
+)
+def test_domain_filter_walks_package(domain_filter: DomainFilter, package_name: str, is_walked: bool):
+    assert domain_filter.walks_package(package_name) == is_walked
+
+
+def test_domain_filter_accepts_definition():
+    domain_filter = DomainFilter(
+        include_modules=('domain.vehicles',), include_definitions=('*.Car*',), exclude_definitions=('*Fixture',)
+    )
+
+    assert domain_filter.accepts_definition('domain.vehicles.car', 'domain.vehicles.car.Car')
+    assert not domain_filter.accepts_definition('domain.vehicles.car', 'domain.vehicles.car.CarFixture')
+    assert not domain_filter.accepts_definition('domain.vehicles.car', 'domain.vehicles.car.Engine')
+    assert not domain_filter.accepts_definition('domain.garage', 'domain.garage.Car')
@@ -0,0 +1,89 @@
+from dataclasses import FrozenInstanceError
+
+from pytest import raises
+
+from py2puml.domain.domainmodel import DomainModel
+from py2puml.domain.umlclass import UmlAttribute, UmlClass
+from py2puml.domain.umlfunction import UmlFunction, UmlModule
+from py2puml.domain.umlrelation import RelType, UmlRelation
+from py2puml.py2puml import inspect
+
+
+def build_domain_model() -> DomainModel:
+    car = UmlClass('Car', 'garage.vehicles.Car', attributes=[], methods=[])
+    engine = UmlClass('Engine', 'garage.parts.Engine', attributes=[], methods=[])
+    wheel = UmlClass('Wheel', 'garage.parts.Wheel', attributes=[], methods=[])
+    repair = UmlFunction('repair', 'garage.parts.repair', module='garage.parts')
+    return DomainModel(
+        'garage',
+        {uml_item.fqn: uml_item for uml_item in (car, engine, wheel, repair)},
+        [
+            UmlRelation('garage.vehicles.Car', 'garage.parts.Engine', RelType.COMPOSITION),
+            UmlRelation('garage.vehicles.Car', 'garage.parts.Wheel', RelType.COMPOSITION),
+            UmlRelation('garage.parts.Methods', 'garage.parts.Engine', RelType.DEPENDENCY, 'repair'),
+        ],
+        {'garage.vehicles': UmlModule('garage.vehicles'), 'garage.parts': UmlModule('garage.parts', [repair])},
+    )
+
+
+def test_domain_model_indexes():
+    domain_model = build_domain_model()
+
+    assert [uml_item.name for uml_item in domain_model.items_by_module['garage.parts']] == [
+        'Engine',
+        'Wheel',
+        'repair',
+    ]
+    assert [uml_item.name for uml_item in domain_model.items_by_module['garage.vehicles']] == ['Car']
+    assert len(domain_model.relations_by_type[RelType.COMPOSITION]) == 2
+    assert len(domain_model.relations_by_type[RelType.DEPENDENCY]) == 1
+    assert RelType.INHERITANCE not in domain_model.relations_by_type
+
+
+def test_domain_model_is_read_only():
+    domain_model = build_domain_model()
+
+    with raises(FrozenInstanceError):
+        domain_model.name = 'other'
+    with raises(TypeError):
+        domain_model.items_by_fqn['garage.Other'] = None
+    assert isinstance(domain_model.relations, tuple)
+
+
+def test_domain_model_filtered_view():
+    domain_model = build_domain_model()
+
+    parts_model = domain_model.filtered(lambda fqn: fqn.startswith('garage.parts'), 'parts')
+
+    assert parts_model.name == 'parts'
+    assert list(parts_model.items_by_fqn.keys()) == ['garage.parts.Engine', 'garage.parts.Wheel', 'garage.parts.repair']
+    # relations with one end in the view are kept
+    assert len(parts_model.relations) == 3
+    assert list(parts_model.modules_by_name.keys()) == ['garage.parts']
+    # the original model is unchanged
+    assert len(domain_model.items_by_fqn) == 4
+
+
+def test_domain_model_filtered_view_copies_the_items():
+    domain_model = build_domain_model()
+
+    parts_model = domain_model.filtered(lambda fqn: fqn.startswith('garage.parts'), 'parts')
+    parts_model.items_by_fqn['garage.parts.Engine'].attributes.append(UmlAttribute('torque', 'float', False))
+
+    assert domain_model.items_by_fqn['garage.parts.Engine'].attributes == []
+    # the module functions are the items of the view
+    assert parts_model.modules_by_name['garage.parts'].functions[0] is parts_model.items_by_fqn['garage.parts.repair']
+
+
+def test_inspect_returns_domain_model():
+    domain_model = inspect('tests/modules/withsubdomain', 'tests.modules.withsubdomain')
+
+    assert domain_model.name == 'tests.modules.withsubdomain'
+    assert list(domain_model.items_by_fqn.keys()) == [
+        'tests.modules.withsubdomain.subdomain.insubdomain.Engine',
+        'tests.modules.withsubdomain.subdomain.insubdomain.Pilot',
+        'tests.modules.withsubdomain.subdomain.insubdomain.horsepower_to_kilowatt',
+        'tests.modules.withsubdomain.withsubdomain.Car',
+    ]
+    assert [uml_relation.type for uml_relation in domain_model.relations] == [RelType.COMPOSITION]
+    assert domain_model.diagnostics == ()
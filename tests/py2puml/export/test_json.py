@@ -0,0 +1,39 @@
+from json import loads
+
+from py2puml.export.json import to_json_content
+from py2puml.py2puml import inspect
+
+
+def test_to_json_content():
+    domain_model = inspect('tests/modules/withsubdomain', 'tests.modules.withsubdomain')
+
+    json_document = loads(''.join(to_json_content(domain_model)))
+
+    assert json_document['name'] == 'tests.modules.withsubdomain'
+    car_item = next(item for item in json_document['items'] if item['name'] == 'Car')
+    assert car_item == {
+        'type': 'class',
+        'name': 'Car',
+        'fqn': 'tests.modules.withsubdomain.withsubdomain.Car',
+        'is_abstract': False,
+        'attributes': [
+            {'name': 'name', 'type': 'str', 'static': False},
+            {'name': 'engine', 'type': 'Engine', 'static': False},
+        ],
+        'methods': [],
+    }
+    function_item = next(item for item in json_document['items'] if item['type'] == 'function')
+    # runtime types are documented by their names
+    assert function_item['arguments'] == {'horsepower': ['float']}
+    assert function_item['return_type'] == ['float']
+    assert json_document['relations'] == [
+        {
+            'source_fqn': 'tests.modules.withsubdomain.withsubdomain.Car',
+            'target_fqn': 'tests.modules.withsubdomain.subdomain.insubdomain.Engine',
+            'type': 'COMPOSITION',
+            'text': '',
+            'count': 1,
+            'labels': [],
+        }
+    ]
+    assert json_document['diagnostics'] == []
@@ -0,0 +1,56 @@
+from pathlib import Path
+from typing import Iterable, List
+
+from py2puml.export.output import hash_file, is_file_content, write_if_changed
+
+
+def test_write_if_changed_creates_the_missing_file(tmp_path: Path):
+    output_path = tmp_path / 'diagram.puml'
+
+    assert write_if_changed(output_path, ['@startuml\n', '@enduml\n'])
+    assert output_path.read_text(encoding='utf8') == '@startuml\n@enduml\n'
+
+
+def test_write_if_changed_preserves_the_unchanged_file(tmp_path: Path):
+    output_path = tmp_path / 'diagram.puml'
+    output_path.write_text('@startuml\n@enduml\n', encoding='utf8')
+    modification_time = output_path.stat().st_mtime_ns
+
+    assert not write_if_changed(output_path, ['@startuml\n', '@enduml\n'])
+    assert output_path.stat().st_mtime_ns == modification_time
+
+
+def test_write_if_changed_rewrites_the_changed_file(tmp_path: Path):
+    output_path = tmp_path / 'diagram.puml'
+    output_path.write_text('@startuml\nclass Car\n@enduml\n', encoding='utf8')
+
+    assert write_if_changed(output_path, ['@startuml\n', '@enduml\n'])
+    assert output_path.read_text(encoding='utf8') == '@startuml\n@enduml\n'
+
+
+def test_hash_file_of_a_missing_file(tmp_path: Path):
+    assert hash_file(tmp_path / 'missing.puml') is None
+
+
+def test_is_file_content_stops_at_the_first_differing_chunk(tmp_path: Path):
+    output_path = tmp_path / 'diagram.puml'
+    output_path.write_text('@startuml\nclass Car\n@enduml\n', encoding='utf8')
+    generated_chunks: List[str] = []
+
+    def contents() -> Iterable[str]:
+        for chunk in ('@startuml\n', 'class Bike\n', '@enduml\n'):
+            generated_chunks.append(chunk)
+            yield chunk
+
+    assert not is_file_content(output_path, contents())
+    assert generated_chunks == ['@startuml\n', 'class Bike\n']
+
+
+def test_is_file_content(tmp_path: Path):
+    output_path = tmp_path / 'diagram.puml'
+    output_path.write_text('@startuml\nclass Car\n@enduml\n', encoding='utf8')
+
+    assert is_file_content(output_path, ['@startuml\n', 'class Car\n', '@enduml\n'])
+    # the file has additional contents
+    assert not is_file_content(output_path, ['@startuml\n', 'class Car\n'])
+    assert not is_file_content(tmp_path / 'missing.puml', ['@startuml\n'])
@@ -0,0 +1,27 @@
+from py2puml.domain.umlclass import UmlClass
+from py2puml.domain.umlrelation import RelType, UmlRelation
+from py2puml.export.puml import to_puml_content
+from py2puml.inspection.inspectpackage import aggregate_relations_in_place
+
+
+def test_to_puml_content_renders_the_counts_of_the_aggregated_relations():
+    uml_classes = [UmlClass(name, f'garage.{name}', [], []) for name in ('Car', 'Engine', 'Wheel', 'Garage')]
+    uml_relations = [
+        UmlRelation('garage.Car', 'garage.Engine', RelType.COMPOSITION),
+        UmlRelation('garage.Car', 'garage.Wheel', RelType.COMPOSITION),
+        UmlRelation('garage.Car', 'garage.Wheel', RelType.COMPOSITION),
+        UmlRelation('garage.Garage', 'garage.Car', RelType.DEPENDENCY, 'repair'),
+        UmlRelation('garage.Garage', 'garage.Car', RelType.DEPENDENCY, 'wash'),
+        UmlRelation('garage.Garage', 'garage.Car', RelType.DEPENDENCY, 'repair'),
+    ]
+    aggregate_relations_in_place(uml_relations)
+
+    puml_content = ''.join(to_puml_content('garage', uml_classes, uml_relations, {}))
+
+    assert puml_content.endswith(
+        'garage.Car *-- garage.Engine\n'
+        'garage.Car *-- garage.Wheel: x2\n'
+        'garage.Garage <-- garage.Car: used by repair, wash (x3)\n'
+        'footer Generated by //py2puml//\n'
+        '@enduml\n'
+    )
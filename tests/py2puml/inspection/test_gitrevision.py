@@ -0,0 +1,31 @@
+from subprocess import PIPE, run
+
+from pytest import raises
+
+from py2puml.inspection.gitrevision import list_revision_python_files, read_git_blobs, read_revision_modules
+
+
+def test_read_git_blobs_in_the_order_of_the_object_ids():
+    object_ids = [object_id for object_id, _ in list_revision_python_files('HEAD', 'tests/modules/withreexports')]
+
+    blobs = read_git_blobs(list(reversed(object_ids)))
+
+    assert blobs == [
+        run(['git', 'cat-file', 'blob', object_id], stdout=PIPE, check=True).stdout
+        for object_id in reversed(object_ids)
+    ]
+
+
+def test_read_revision_modules_maps_the_files_to_module_names():
+    static_modules = read_revision_modules('tests/modules/withreexports', 'tests.modules.withreexports', 'HEAD')
+
+    assert [(static_module.name, static_module.is_package) for static_module in static_modules] == [
+        ('tests.modules.withreexports', True),
+        ('tests.modules.withreexports.wheel', False),
+    ]
+    assert 'class Wheel:' in static_modules[1].source
+
+
+def test_read_revision_modules_with_an_unknown_revision():
+    with raises(ValueError, match='git ls-tree failed'):
+        read_revision_modules('tests/modules/withreexports', 'tests.modules.withreexports', 'no-such-revision')
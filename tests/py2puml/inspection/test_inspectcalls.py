@@ -0,0 +1,57 @@
+from py2puml.domain.callgraph import FunctionCall
+from py2puml.domain.umlrelation import RelType, UmlRelation
+from py2puml.inspection.inspectcalls import call_dependency_relations, inspect_calls
+from py2puml.py2puml import inspect
+
+
+def test_inspect_calls_resolves_and_counts_domain_calls():
+    domain_model = inspect('tests/modules/withcalls', 'tests.modules.withcalls')
+
+    call_graph = inspect_calls(domain_model)
+
+    assert call_graph.name == 'tests.modules.withcalls'
+    assert sorted(call_graph.calls, key=lambda call: (call.caller_fqn, call.callee_fqn)) == [
+        # instantiation of a domain class
+        FunctionCall('tests.modules.withcalls.cart.Cart.__init__', 'tests.modules.withcalls.pricing.Pricer'),
+        # call of a static method through the class
+        FunctionCall(
+            'tests.modules.withcalls.cart.Cart.price_of', 'tests.modules.withcalls.pricing.Pricer.round_price'
+        ),
+        # call of a method on self
+        FunctionCall('tests.modules.withcalls.cart.Cart.total', 'tests.modules.withcalls.cart.Cart.price_of'),
+        # call of an inherited method on self
+        FunctionCall(
+            'tests.modules.withcalls.cart.DiscountedCart.discounted_total', 'tests.modules.withcalls.cart.Cart.total'
+        ),
+        # call of a module function, counted twice
+        FunctionCall(
+            'tests.modules.withcalls.cart.DiscountedCart.discounted_total',
+            'tests.modules.withcalls.pricing.apply_discount',
+            2,
+        ),
+        FunctionCall('tests.modules.withcalls.pricing.Pricer.price', 'tests.modules.withcalls.pricing.apply_discount'),
+    ]
+    # the call through an instance attribute (self.pricer.price) is not resolved
+    assert all(call.callee_fqn != 'tests.modules.withcalls.pricing.Pricer.price' for call in call_graph.calls)
+
+
+def test_call_dependency_relations_link_classes_and_module_functions():
+    domain_model = inspect('tests/modules/withcalls', 'tests.modules.withcalls')
+
+    relations = call_dependency_relations(inspect_calls(domain_model), domain_model)
+
+    # the call of the inherited Cart.total method does not duplicate the inheritance relation
+    assert relations == [
+        UmlRelation('tests.modules.withcalls.cart.Cart', 'tests.modules.withcalls.pricing.Pricer', RelType.DEPENDENCY),
+        UmlRelation(
+            'tests.modules.withcalls.cart.DiscountedCart', 'tests.modules.withcalls.pricing.Methods', RelType.DEPENDENCY
+        ),
+        UmlRelation(
+            'tests.modules.withcalls.pricing.Pricer', 'tests.modules.withcalls.pricing.Methods', RelType.DEPENDENCY
+        ),
+    ]
+    assert [relation.text for relation in relations] == [
+        '__init__, price_of',
+        'discounted_total',
+        'price',
+    ]
@@ -0,0 +1,97 @@
+from compileall import compile_dir
+from pathlib import Path
+from typing import List
+
+from py2puml.domain.umlclass import UmlAttribute, UmlMethod
+from py2puml.domain.umlrelation import RelType, UmlRelation
+from py2puml.inspection.inspectcode import inspect_code_constructor, inspect_code_methods
+from py2puml.py2puml import inspect
+
+GARAGE_SOURCE = """from typing import List
+
+
+class Engine:
+    def __init__(self, power: int):
+        self.power = power
+
+
+class Car:
+    def __init__(self, engine: Engine, spare_engines: List[Engine], name: str, wheels=4):
+        self.engine = engine
+        self.spare_engines = spare_engines
+        self.name = name
+        self.wheels = wheels
+        self.mileage = 0
+
+    def drive(self, distance: float, *stops: str, **options) -> 'Car':
+        return self
+
+    @staticmethod
+    def create(name: str) -> 'Car':
+        return Car(Engine(100), [], name)
+"""
+
+
+class Wheel:
+    def __init__(self, diameter: float, pressures: List[float]):
+        self.diameter = diameter
+        self.pressures = pressures
+        self.tread = None
+
+    @classmethod
+    def of(cls, diameter: float) -> 'Wheel':
+        return cls(diameter, [])
+
+    @property
+    def radius(self) -> float:
+        return self.diameter / 2
+
+
+def test_inspect_code_methods():
+    assert inspect_code_methods(Wheel) == [
+        UmlMethod('__init__', {'self': None, 'diameter': 'float', 'pressures': 'List[float]'}),
+        UmlMethod('of', {'cls': None, 'diameter': 'float'}, is_class=True, return_type='Wheel'),
+        UmlMethod('radius', {'self': None}, return_type='float'),
+    ]
+
+
+def test_inspect_code_constructor():
+    uml_attributes, uml_relations_by_target_fqn = inspect_code_constructor(Wheel, f'{__name__}.Wheel', 'tests')
+
+    assert uml_attributes == [
+        UmlAttribute('diameter', 'float', False),
+        UmlAttribute('pressures', 'List[float]', False),
+        UmlAttribute('tread', None, False),
+    ]
+    assert uml_relations_by_target_fqn == {}
+
+
+def test_inspect_modules_compiled_without_source(tmp_path: Path, monkeypatch):
+    package_path = tmp_path / 'sourcelessgarage'
+    package_path.mkdir()
+    (package_path / '__init__.py').write_text('')
+    (package_path / 'garage.py').write_text(GARAGE_SOURCE)
+    # compiles the modules next to their sources (like deployment images do), then removes the sources
+    compile_dir(str(package_path), quiet=1, legacy=True)
+    for source_path in package_path.glob('*.py'):
+        source_path.unlink()
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    domain_model = inspect(str(package_path), 'sourcelessgarage')
+
+    car = domain_model.items_by_fqn['sourcelessgarage.garage.Car']
+    assert car.attributes == [
+        UmlAttribute('engine', 'Engine', False),
+        UmlAttribute('spare_engines', 'List[Engine]', False),
+        UmlAttribute('name', 'str', False),
+        UmlAttribute('wheels', None, False),
+        UmlAttribute('mileage', None, False),
+    ]
+    assert car.methods[1:] == [
+        UmlMethod('drive', {'self': None, 'distance': 'float', 'stops': 'str', 'options': None}, return_type='Car'),
+        UmlMethod('create', {'name': 'str'}, is_static=True, return_type='Car'),
+    ]
+    assert (
+        UmlRelation('sourcelessgarage.garage.Car', 'sourcelessgarage.garage.Engine', RelType.COMPOSITION)
+        in domain_model.relations
+    )
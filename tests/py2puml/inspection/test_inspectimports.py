@@ -0,0 +1,86 @@
+from py2puml.domain.domainfilter import DomainFilter
+from py2puml.domain.importgraph import ModuleImport
+from py2puml.export.puml import to_puml_import_graph
+from py2puml.inspection.inspectimports import collapse_module_name, inspect_imports
+
+
+def test_inspect_imports_resolves_relative_imports_of_submodules():
+    import_graph = inspect_imports([('tests/modules/withnestednamespace', 'tests.modules.withnestednamespace')])
+
+    assert 'tests.modules.withnestednamespace.tree' in import_graph.module_names
+    tree_imports = [
+        module_import
+        for module_import in import_graph.module_imports
+        if module_import.source_module == 'tests.modules.withnestednamespace.tree'
+    ]
+    assert tree_imports == [
+        ModuleImport('tests.modules.withnestednamespace.tree', 'tests.modules.withnestednamespace.branches.branch'),
+        ModuleImport('tests.modules.withnestednamespace.tree', 'tests.modules.withnestednamespace.trunks.trunk'),
+        ModuleImport(
+            'tests.modules.withnestednamespace.tree',
+            'tests.modules.withnestednamespace.withonlyonesubpackage.underground',
+        ),
+        ModuleImport(
+            'tests.modules.withnestednamespace.tree',
+            'tests.modules.withnestednamespace.withonlyonesubpackage.underground.roots.roots',
+        ),
+    ]
+
+
+def test_inspect_imports_collapses_packages_at_depth():
+    import_graph = inspect_imports([('tests/modules/withnestednamespace', 'tests.modules.withnestednamespace')], 1)
+
+    assert import_graph.module_names == [
+        'tests.modules.withnestednamespace',
+        # implicit namespace package
+        'tests.modules.withnestednamespace.branches',
+        'tests.modules.withnestednamespace.nomoduleroot',
+        'tests.modules.withnestednamespace.tree',
+        # implicit namespace package
+        'tests.modules.withnestednamespace.trunks',
+        'tests.modules.withnestednamespace.withonlyonesubpackage',
+        'tests.modules.withnestednamespace.withoutumlitemroot',
+    ]
+    assert import_graph.module_imports == [
+        ModuleImport('tests.modules.withnestednamespace.tree', 'tests.modules.withnestednamespace.branches'),
+        ModuleImport('tests.modules.withnestednamespace.tree', 'tests.modules.withnestednamespace.trunks'),
+        # the 2 imports of the underground package and of its roots module are merged
+        ModuleImport(
+            'tests.modules.withnestednamespace.tree', 'tests.modules.withnestednamespace.withonlyonesubpackage', 2
+        ),
+        ModuleImport('tests.modules.withnestednamespace.branches', 'tests.modules.withnestednamespace.nomoduleroot'),
+    ]
+
+
+def test_inspect_imports_applies_the_domain_filter():
+    import_graph = inspect_imports(
+        [('tests/modules/withnestednamespace', 'tests.modules.withnestednamespace')],
+        domain_filter=DomainFilter(exclude_modules=('tests.modules.withnestednamespace.branches',)),
+    )
+
+    assert not any('.branches' in module_name for module_name in import_graph.module_names)
+    assert [module_import.target_module for module_import in import_graph.module_imports] == [
+        'tests.modules.withnestednamespace.trunks.trunk',
+        'tests.modules.withnestednamespace.withonlyonesubpackage.underground',
+        'tests.modules.withnestednamespace.withonlyonesubpackage.underground.roots.roots',
+    ]
+
+
+def test_collapse_module_name():
+    assert collapse_module_name('domain.orders.order', 'domain', None) == 'domain.orders.order'
+    assert collapse_module_name('domain.orders.order', 'domain', 1) == 'domain.orders'
+    assert collapse_module_name('domain.orders.order', 'domain', 0) == 'domain'
+    assert collapse_module_name('domain', 'domain', 1) == 'domain'
+
+
+def test_to_puml_import_graph():
+    import_graph = inspect_imports([('tests/modules/withsubdomain', 'tests.modules.withsubdomain')], 0)
+    assert ''.join(to_puml_import_graph(import_graph)) == (
+        '@startuml tests.modules.withsubdomain\n'
+        '!pragma useIntermediatePackages false\n'
+        '\n'
+        'package tests.modules.withsubdomain {\n'
+        '}\n'
+        'footer Generated by //py2puml//\n'
+        '@enduml\n'
+    )
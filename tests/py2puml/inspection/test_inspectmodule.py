@@ -0,0 +1,35 @@
+from importlib import import_module
+
+from py2puml.inspection.inspectmodule import filter_domain_definitions
+
+from tests.modules.withreexports.wheel import Wheel, inflate
+
+INSPECTED_MODULE_NAMES = frozenset(('tests.modules.withreexports', 'tests.modules.withreexports.wheel'))
+
+
+def test_filter_domain_definitions_yields_aliased_definitions_once():
+    definitions = list(
+        filter_domain_definitions(
+            import_module('tests.modules.withreexports.wheel'), 'tests.modules.withreexports', INSPECTED_MODULE_NAMES
+        )
+    )
+
+    assert definitions == [Wheel, inflate]
+
+
+def test_filter_domain_definitions_skips_definitions_reexported_from_inspected_modules():
+    definitions = list(
+        filter_domain_definitions(
+            import_module('tests.modules.withreexports'), 'tests.modules.withreexports', INSPECTED_MODULE_NAMES
+        )
+    )
+
+    assert definitions == []
+
+
+def test_filter_domain_definitions_yields_definitions_reexported_from_modules_not_inspected():
+    definitions = list(
+        filter_domain_definitions(import_module('tests.modules.withreexports'), 'tests.modules.withreexports')
+    )
+
+    assert definitions == [Wheel, inflate]
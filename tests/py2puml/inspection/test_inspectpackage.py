@@ -0,0 +1,137 @@
+import sys
+
+from pytest import mark
+
+from py2puml.domain.domainfilter import DomainFilter
+from py2puml.domain.inspectionprofile import INSPECTION_PROFILES
+from py2puml.domain.umlrelation import RelType, UmlRelation
+from py2puml.inspection.inspectpackage import aggregate_relations_in_place, walk_domain_modules
+from py2puml.py2puml import inspect
+
+EXCLUDED_MIGRATIONS = DomainFilter(exclude_modules=('*.migrations',))
+
+
+def test_walk_domain_modules_without_importing_the_packages():
+    assert list(walk_domain_modules('tests/modules/withexcludedpackages', 'tests.modules.withexcludedpackages')) == [
+        'tests.modules.withexcludedpackages.car',
+        'tests.modules.withexcludedpackages.migrations.initial',
+    ]
+    assert 'tests.modules.withexcludedpackages.migrations' not in sys.modules
+
+
+def test_walk_domain_modules_prunes_the_excluded_packages():
+    assert list(
+        walk_domain_modules(
+            'tests/modules/withexcludedpackages', 'tests.modules.withexcludedpackages', EXCLUDED_MIGRATIONS
+        )
+    ) == ['tests.modules.withexcludedpackages.car']
+
+
+def test_inspect_with_excluded_packages_and_definitions():
+    domain_model = inspect(
+        'tests/modules/withexcludedpackages',
+        'tests.modules.withexcludedpackages',
+        domain_filter=DomainFilter(exclude_modules=('*.migrations',), exclude_definitions=('*Fixture',)),
+    )
+
+    assert list(domain_model.items_by_fqn.keys()) == [
+        'tests.modules.withexcludedpackages.car.Car',
+        'tests.modules.withexcludedpackages.car.Engine',
+    ]
+    assert domain_model.relations == (
+        UmlRelation(
+            'tests.modules.withexcludedpackages.car.Car',
+            'tests.modules.withexcludedpackages.car.Engine',
+            RelType.COMPOSITION,
+        ),
+    )
+    assert 'tests.modules.withexcludedpackages.migrations' not in sys.modules
+
+
+GARAGE_FQN = 'tests.modules.withprofiles.garage'
+
+
+@mark.parametrize('workers', [0, 2])
+def test_inspect_with_the_structure_profile(workers: int):
+    domain_model = inspect(
+        'tests/modules/withprofiles',
+        'tests.modules.withprofiles',
+        workers=workers,
+        inspection_profile=INSPECTION_PROFILES['structure'],
+    )
+
+    # the module functions are not documented
+    assert list(domain_model.items_by_fqn.keys()) == [
+        f'{GARAGE_FQN}.Car',
+        f'{GARAGE_FQN}.Engine',
+        f'{GARAGE_FQN}.Mechanic',
+        f'{GARAGE_FQN}.SportsCar',
+    ]
+    assert all(
+        uml_class.attributes == [] and uml_class.methods == [] for uml_class in domain_model.items_by_fqn.values()
+    )
+    assert domain_model.relations == (UmlRelation(f'{GARAGE_FQN}.Car', f'{GARAGE_FQN}.SportsCar', RelType.INHERITANCE),)
+
+
+def test_inspect_with_the_attributes_profile():
+    domain_model = inspect(
+        'tests/modules/withprofiles', 'tests.modules.withprofiles', inspection_profile=INSPECTION_PROFILES['attributes']
+    )
+
+    car = domain_model.items_by_fqn[f'{GARAGE_FQN}.Car']
+    assert [attribute.name for attribute in car.attributes] == ['wheels', 'engine']
+    assert car.methods == []
+    assert domain_model.relations == (
+        UmlRelation(f'{GARAGE_FQN}.Car', f'{GARAGE_FQN}.Engine', RelType.COMPOSITION),
+        UmlRelation(f'{GARAGE_FQN}.Car', f'{GARAGE_FQN}.SportsCar', RelType.INHERITANCE),
+    )
+
+
+@mark.parametrize('workers', [0, 2])
+def test_inspect_with_the_methods_profile_skips_the_dependencies(workers: int):
+    domain_model = inspect(
+        'tests/modules/withprofiles',
+        'tests.modules.withprofiles',
+        workers=workers,
+        inspection_profile=INSPECTION_PROFILES['methods'],
+    )
+    full_domain_model = inspect('tests/modules/withprofiles', 'tests.modules.withprofiles', workers=workers)
+
+    assert domain_model.items_by_fqn == full_domain_model.items_by_fqn
+    assert [
+        uml_relation for uml_relation in full_domain_model.relations if uml_relation.type != RelType.DEPENDENCY
+    ] == list(domain_model.relations)
+    assert any(uml_relation.type == RelType.DEPENDENCY for uml_relation in full_domain_model.relations)
+
+
+def test_aggregate_relations_in_place_counts_the_occurrences_and_merges_their_labels():
+    cached_relation = UmlRelation('domain.Methods', 'domain.Car', RelType.DEPENDENCY, 'build')
+    domain_relations = [
+        cached_relation,
+        UmlRelation('domain.Car', 'domain.Engine', RelType.COMPOSITION),
+        *(
+            UmlRelation('domain.Methods', 'domain.Car', RelType.DEPENDENCY, function_name)
+            for function_name in ('build', 'paint', 'repair', 'sell', 'wash')
+        ),
+        UmlRelation('domain.Car', 'domain.Engine', RelType.DEPENDENCY),
+        UmlRelation('domain.Car', 'domain.Engine', RelType.DEPENDENCY),
+    ]
+
+    aggregate_relations_in_place(domain_relations)
+
+    assert [
+        (uml_relation.source_fqn, uml_relation.target_fqn, uml_relation.type, uml_relation.text, uml_relation.count)
+        for uml_relation in domain_relations
+    ] == [
+        ('domain.Methods', 'domain.Car', RelType.DEPENDENCY, 'build, paint, repair, +2 more', 6),
+        ('domain.Car', 'domain.Engine', RelType.COMPOSITION, '', 1),
+        ('domain.Car', 'domain.Engine', RelType.DEPENDENCY, '', 2),
+    ]
+    # the aggregated relations are new, the merged ones are left untouched
+    assert (cached_relation.text, cached_relation.count) == ('build', 1)
+
+    # aggregating again sums the counts and merges the labels, including the truncated ones
+    domain_relations.append(UmlRelation('domain.Methods', 'domain.Car', RelType.DEPENDENCY, 'fuel'))
+    aggregate_relations_in_place(domain_relations)
+    assert (domain_relations[0].text, domain_relations[0].count) == ('build, paint, repair, +3 more', 7)
+    assert domain_relations[0].labels == ('build', 'paint', 'repair', 'sell', 'wash', 'fuel')
@@ -0,0 +1,62 @@
+from collections import deque
+from decimal import Context
+from weakref import WeakKeyDictionary
+
+from py2puml.domain.umlclass import UmlMethod
+from py2puml.inspection import inspectclass, inspectsignature
+from py2puml.inspection.inspectclass import get_class_methods
+from py2puml.inspection.inspectsignature import REFLECTED_METHODS_BY_TYPE, inspect_reflected_methods, is_extension_type
+
+
+class Pythonic:
+    @staticmethod
+    def create() -> 'Pythonic':
+        return Pythonic()
+
+
+class PythonicWithoutMethods:
+    unit: str = 'kg'
+
+
+def test_is_extension_type():
+    assert is_extension_type(Context)
+    assert not is_extension_type(Pythonic)
+    assert not is_extension_type(PythonicWithoutMethods)
+
+
+def test_inspect_reflected_methods_from_the_text_signatures():
+    context_methods = {uml_method.name: uml_method for uml_method in inspect_reflected_methods(Context)}
+
+    assert '__new__' not in context_methods
+    assert '__repr__' not in context_methods
+    assert context_methods['add'] == UmlMethod('add', {'self': None, 'x': None, 'y': None})
+
+
+def test_inspect_reflected_methods_without_signature(monkeypatch):
+    def fail_signature(method):
+        raise ValueError(f'no signature found for {method}')
+
+    # the availability of the text signatures of the builtin methods depends on the Python version
+    monkeypatch.setattr(inspectsignature, 'signature', fail_signature)
+    monkeypatch.setattr(inspectsignature, 'REFLECTED_METHODS_BY_TYPE', WeakKeyDictionary())
+    deque_methods = {uml_method.name: uml_method for uml_method in inspect_reflected_methods(deque)}
+
+    # the methods without signature are documented with their name
+    assert deque_methods['append'] == UmlMethod('append')
+    assert deque_methods['__class_getitem__'] == UmlMethod('__class_getitem__', is_class=True)
+
+
+def test_inspect_reflected_methods_once_per_type():
+    context_methods = inspect_reflected_methods(Context)
+
+    assert REFLECTED_METHODS_BY_TYPE[Context] == context_methods
+    assert inspect_reflected_methods(Context) == context_methods
+
+
+def test_get_class_methods_of_an_extension_class_does_not_read_sources(monkeypatch):
+    def fail_getsource(class_type):
+        raise AssertionError(f'the source of {class_type} must not be read')
+
+    monkeypatch.setattr(inspectclass, 'getsource', fail_getsource)
+
+    assert get_class_methods(Context, 'decimal') == inspect_reflected_methods(Context)
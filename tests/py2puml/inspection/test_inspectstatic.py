@@ -0,0 +1,132 @@
+from typing import Dict, List
+
+from py2puml.domain.umlclass import UmlAttribute, UmlClass
+from py2puml.domain.umlenum import Member, UmlEnum
+from py2puml.domain.umlfunction import UmlModule
+from py2puml.domain.umlitem import UmlItem
+from py2puml.domain.umlrelation import RelType, UmlRelation
+from py2puml.inspection.inspectpackage import aggregate_relations_in_place
+from py2puml.inspection.inspectstatic import StaticModule, inspect_static_modules
+from py2puml.inspection.staticsources import read_path_modules
+from py2puml.py2puml import inspect
+
+
+def inspect_static_folder(domain_path: str, domain_module: str):
+    static_modules = read_path_modules(domain_path, domain_module)
+    domain_items_by_fqn: Dict[str, UmlItem] = {}
+    domain_relations: List[UmlRelation] = []
+    inspect_static_modules(static_modules, (domain_module,), domain_items_by_fqn, domain_relations, {})
+    aggregate_relations_in_place(domain_relations)
+
+    return domain_items_by_fqn, domain_relations
+
+
+def test_inspect_static_modules_like_the_runtime_inspection():
+    domain_items_by_fqn, domain_relations = inspect_static_folder(
+        'tests/modules/withcycles', 'tests.modules.withcycles'
+    )
+
+    domain_model = inspect('tests/modules/withcycles', 'tests.modules.withcycles')
+    assert domain_items_by_fqn == domain_model.items_by_fqn
+    assert domain_relations == list(domain_model.relations)
+
+
+def test_inspect_static_modules_resolves_forward_references_and_relative_imports():
+    domain_items_by_fqn, domain_relations = inspect_static_folder(
+        'tests/modules/withnestednamespace', 'tests.modules.withnestednamespace'
+    )
+
+    oak_branch_fqn = 'tests.modules.withnestednamespace.branches.branch.OakBranch'
+    assert domain_items_by_fqn[oak_branch_fqn].attributes == [
+        UmlAttribute('sub_branches', 'List[OakBranch]', False),
+        UmlAttribute('leaves', 'List[OakLeaf]', False),
+    ]
+    assert UmlRelation(oak_branch_fqn, oak_branch_fqn, RelType.COMPOSITION) in domain_relations
+    assert (
+        UmlRelation(
+            oak_branch_fqn,
+            'tests.modules.withnestednamespace.nomoduleroot.modulechild.leaf.OakLeaf',
+            RelType.COMPOSITION,
+        )
+        in domain_relations
+    )
+    assert (
+        UmlRelation('tests.modules.withnestednamespace.branches.branch.Branch', oak_branch_fqn, RelType.INHERITANCE)
+        in domain_relations
+    )
+
+
+def test_inspect_static_modules_follows_reexports_to_the_defining_module():
+    domain_items_by_fqn, domain_relations = inspect_static_folder(
+        'tests/modules/withreexports', 'tests.modules.withreexports'
+    )
+
+    assert list(domain_items_by_fqn.keys()) == [
+        'tests.modules.withreexports.wheel.Wheel',
+        'tests.modules.withreexports.wheel.inflate',
+    ]
+    assert domain_relations == [
+        UmlRelation(
+            'tests.modules.withreexports.wheel.Methods',
+            'tests.modules.withreexports.wheel.Wheel',
+            RelType.DEPENDENCY,
+            'inflate',
+        )
+    ]
+
+
+def test_inspect_static_modules_without_importing_them():
+    source = """
+from abc import ABC, abstractmethod
+from collections import namedtuple
+from enum import Enum, auto
+from typing import NamedTuple
+
+import not_installed_dependency
+
+class Color(Enum):
+    RED = auto()
+    GREEN = auto()
+
+class Point(NamedTuple):
+    x: float
+    y: float
+
+Segment = namedtuple('Segment', 'start, end')
+
+class Shape(ABC):
+    name: str = 'shape'
+
+    def __init__(self, color: Color):
+        self.color = color
+
+    @abstractmethod
+    def area(self) -> float:
+        pass
+"""
+    domain_items_by_fqn: Dict[str, UmlItem] = {}
+    domain_relations: List[UmlRelation] = []
+    modules_by_name: Dict[str, UmlModule] = {}
+    inspect_static_modules(
+        [StaticModule('shapes.shape', False, source)],
+        ('shapes',),
+        domain_items_by_fqn,
+        domain_relations,
+        modules_by_name,
+    )
+
+    assert domain_items_by_fqn['shapes.shape.Color'] == UmlEnum(
+        'Color', 'shapes.shape.Color', [Member('RED', 1), Member('GREEN', 2)]
+    )
+    assert domain_items_by_fqn['shapes.shape.Point'] == UmlClass(
+        'Point', 'shapes.shape.Point', [UmlAttribute('x', 'Any', False), UmlAttribute('y', 'Any', False)], []
+    )
+    assert domain_items_by_fqn['shapes.shape.Segment'] == UmlClass(
+        'Segment', 'shapes.shape.Segment', [UmlAttribute('start', 'Any', False), UmlAttribute('end', 'Any', False)], []
+    )
+    shape: UmlClass = domain_items_by_fqn['shapes.shape.Shape']
+    assert shape.is_abstract
+    assert shape.attributes == [UmlAttribute('name', 'str', True), UmlAttribute('color', 'Color', False)]
+    assert [method.name for method in shape.methods] == ['__init__', 'area']
+    assert domain_relations == [UmlRelation('shapes.shape.Shape', 'shapes.shape.Color', RelType.COMPOSITION)]
+    assert list(modules_by_name.keys()) == ['shapes.shape']
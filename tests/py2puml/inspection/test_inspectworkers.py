@@ -0,0 +1,56 @@
+from typing import Dict, List
+
+from py2puml.domain.diagnostic import DiagnosticType, InspectionDiagnostic
+from py2puml.domain.umlfunction import UmlModule
+from py2puml.domain.umlitem import UmlItem
+from py2puml.domain.umlrelation import UmlRelation
+from py2puml.inspection.inspectpackage import inspect_package
+from py2puml.py2puml import py2puml
+
+
+def test_inspect_package_in_workers_should_report_faulty_modules(
+    domain_items_by_fqn: Dict[str, UmlItem], domain_relations: List[UmlRelation]
+):
+    modules_by_name: Dict[str, UmlModule] = {}
+    diagnostics: List[InspectionDiagnostic] = []
+    inspect_package(
+        'tests/modules/withfaultymodules',
+        'tests.modules.withfaultymodules',
+        domain_items_by_fqn,
+        domain_relations,
+        modules_by_name,
+        diagnostics,
+        workers=2,
+        module_timeout=1,
+    )
+
+    assert list(domain_items_by_fqn.keys()) == ['tests.modules.withfaultymodules.healthy.Sensor']
+    diagnostic_types_by_module = {diagnostic.module_name: diagnostic.type for diagnostic in diagnostics}
+    assert diagnostic_types_by_module == {
+        'tests.modules.withfaultymodules.crashing': DiagnosticType.CRASH,
+        'tests.modules.withfaultymodules.failing': DiagnosticType.ERROR,
+        'tests.modules.withfaultymodules.hanging': DiagnosticType.TIMEOUT,
+    }
+    failing_diagnostic = next(diagnostic for diagnostic in diagnostics if diagnostic.type == DiagnosticType.ERROR)
+    assert str(failing_diagnostic) == (
+        'inspection of module tests.modules.withfaultymodules.failing failed: RuntimeError: missing configuration'
+    )
+
+
+def test_py2puml_in_workers_should_document_like_in_process():
+    in_process_content = ''.join(py2puml('tests/modules/withsubdomain', 'tests.modules.withsubdomain'))
+    in_workers_content = ''.join(py2puml('tests/modules/withsubdomain', 'tests.modules.withsubdomain', workers=2))
+
+    assert in_workers_content == in_process_content
+
+
+def test_py2puml_in_workers_should_resolve_cross_root_relations():
+    roots_args = (
+        'tests/modules/withmultipleroots/garage',
+        'tests.modules.withmultipleroots.garage',
+        [('tests/modules/withmultipleroots/vehicles', 'tests.modules.withmultipleroots.vehicles')],
+    )
+    in_process_content = ''.join(py2puml(*roots_args))
+    in_workers_content = ''.join(py2puml(*roots_args, workers=3))
+
+    assert in_workers_content == in_process_content
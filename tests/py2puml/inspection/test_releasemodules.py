@@ -0,0 +1,92 @@
+import sys
+from importlib import import_module
+from linecache import cache as linecache_cache
+
+from pytest import MonkeyPatch
+
+from py2puml.inspection.inspectpackage import list_last_importers
+from py2puml.inspection.releasemodules import release_domain_modules
+from py2puml.py2puml import py2puml
+
+WITH_INHERITED_CONSTRUCTOR_MODULES = (
+    'tests.modules.withinheritedconstructor.metricorigin',
+    'tests.modules.withinheritedconstructor.point',
+)
+WITH_SHARED_IMPORTS_MODULES = (
+    'tests.modules.withsharedimports.invoice',
+    'tests.modules.withsharedimports.quote',
+    'tests.modules.withsharedimports.shared',
+)
+
+
+def unload_modules(monkeypatch: MonkeyPatch, module_names):
+    for module_name in module_names:
+        monkeypatch.delitem(sys.modules, module_name, raising=False)
+
+
+def test_release_domain_modules_should_preserve_modules_imported_beforehand(monkeypatch: MonkeyPatch):
+    unload_modules(monkeypatch, WITH_INHERITED_CONSTRUCTOR_MODULES)
+    preserved_module_names = set(sys.modules)
+    from tests.modules.withinheritedconstructor import metricorigin  # noqa: F401
+
+    released_module_names = release_domain_modules(
+        ('tests.modules.withinheritedconstructor', 'tests.modules.withenum'), preserved_module_names
+    )
+
+    assert sorted(released_module_names) == list(WITH_INHERITED_CONSTRUCTOR_MODULES)
+    assert all(module_name not in sys.modules for module_name in WITH_INHERITED_CONSTRUCTOR_MODULES)
+    # the package of the domain is kept
+    assert 'tests.modules.withinheritedconstructor' in sys.modules
+
+
+def test_py2puml_with_bounded_memory_should_release_modules_and_source_lines(monkeypatch: MonkeyPatch):
+    unload_modules(monkeypatch, WITH_INHERITED_CONSTRUCTOR_MODULES)
+    expected_content = ''.join(
+        py2puml('tests/modules/withinheritedconstructor', 'tests.modules.withinheritedconstructor')
+    )
+    unload_modules(monkeypatch, WITH_INHERITED_CONSTRUCTOR_MODULES)
+    for cached_filepath in [filepath for filepath in linecache_cache if 'withinheritedconstructor' in filepath]:
+        monkeypatch.delitem(linecache_cache, cached_filepath)
+
+    bounded_memory_content = ''.join(
+        py2puml('tests/modules/withinheritedconstructor', 'tests.modules.withinheritedconstructor', bounded_memory=True)
+    )
+
+    assert bounded_memory_content == expected_content
+    assert all(module_name not in sys.modules for module_name in WITH_INHERITED_CONSTRUCTOR_MODULES)
+    assert not any('withinheritedconstructor' in filepath for filepath in linecache_cache)
+
+
+def test_py2puml_with_bounded_memory_should_import_the_shared_modules_once_per_pass(monkeypatch: MonkeyPatch):
+    shared_imports_package = import_module('tests.modules.withsharedimports')
+    unload_modules(monkeypatch, WITH_SHARED_IMPORTS_MODULES)
+    monkeypatch.setattr(shared_imports_package, 'shared_imports_count', 0)
+
+    puml_content = ''.join(
+        py2puml('tests/modules/withsharedimports', 'tests.modules.withsharedimports', bounded_memory=True)
+    )
+
+    # the shared module is kept until its last importer is inspected, then imported again for the second pass
+    assert shared_imports_package.shared_imports_count == 2
+    assert all(module_name not in sys.modules for module_name in WITH_SHARED_IMPORTS_MODULES)
+    assert 'tests.modules.withsharedimports.invoice.Invoice *-- tests.modules.withsharedimports.shared.Money' in (
+        puml_content
+    )
+
+
+def test_list_last_importers_should_follow_the_transitive_imports():
+    module_names = [
+        'tests.modules.withlayers.app.service',
+        'tests.modules.withlayers.domain.order',
+        'tests.modules.withlayers.infrastructure.database',
+        'tests.modules.withlayers.infrastructure.repository',
+    ]
+
+    last_importers = list_last_importers([('tests/modules/withlayers', 'tests.modules.withlayers')], module_names)
+
+    assert {module_name: last_importers[module_name] for module_name in module_names} == {
+        'tests.modules.withlayers.app.service': 0,
+        'tests.modules.withlayers.domain.order': 3,
+        'tests.modules.withlayers.infrastructure.database': 3,
+        'tests.modules.withlayers.infrastructure.repository': 3,
+    }
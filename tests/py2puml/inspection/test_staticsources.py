@@ -0,0 +1,123 @@
+from pathlib import Path, PurePosixPath
+from zipfile import ZipFile
+
+from pytest import mark, raises
+
+from py2puml.domain.domainfilter import DomainFilter
+from py2puml.domain.umlclass import UmlAttribute
+from py2puml.domain.umlenum import Member
+from py2puml.domain.umlrelation import RelType, UmlRelation
+from py2puml.inspection.staticsources import (
+    ModuleFile,
+    read_archive_modules,
+    read_path_modules,
+    select_module_files,
+    split_archive_path,
+)
+from py2puml.py2puml import inspect_static
+
+
+def test_select_module_files_prefers_the_stubs():
+    module_files = select_module_files(
+        'domain',
+        [
+            ('init', PurePosixPath('__init__.py')),
+            ('shapes_stub', PurePosixPath('shapes.pyi')),
+            ('shapes', PurePosixPath('shapes.py')),
+            ('colors_stub', PurePosixPath('colors.pyi')),
+            ('readme', PurePosixPath('README.md')),
+            ('script', PurePosixPath('not-a-module.py')),
+        ],
+    )
+
+    assert module_files == [
+        ModuleFile('domain', True, False, 'init'),
+        ModuleFile('domain.shapes', False, True, 'shapes_stub'),
+        ModuleFile('domain.colors', False, True, 'colors_stub'),
+    ]
+
+
+def test_read_path_modules_skips_the_modules_rejected_by_the_filter():
+    static_modules = read_path_modules(
+        'tests/modules/withstubs', 'tests.modules.withstubs', DomainFilter(exclude_modules=('*.colors',))
+    )
+
+    assert [(static_module.name, static_module.is_stub) for static_module in static_modules] == [
+        ('tests.modules.withstubs', False),
+        ('tests.modules.withstubs.shapes', True),
+    ]
+
+
+def test_inspect_static_merges_the_annotations_of_the_stubs():
+    domain_model = inspect_static('tests/modules/withstubs', 'tests.modules.withstubs')
+
+    circle_fqn = 'tests.modules.withstubs.shapes.Circle'
+    # the attributes of the instances are declared in the class body of the stubs, the static ones with ClassVar
+    assert domain_model.items_by_fqn[circle_fqn].attributes == [
+        UmlAttribute('unit', 'str', True),
+        UmlAttribute('center', 'Point', False),
+        UmlAttribute('radius', 'float', False),
+        UmlAttribute('color', 'Color', False),
+    ]
+    assert [method.name for method in domain_model.items_by_fqn[circle_fqn].methods] == ['__init__', 'area']
+    assert domain_model.items_by_fqn[circle_fqn].methods[1].return_type == 'float'
+    assert list(domain_model.relations) == [
+        UmlRelation(circle_fqn, 'tests.modules.withstubs.shapes.Point', RelType.COMPOSITION),
+        UmlRelation(circle_fqn, 'tests.modules.withstubs.colors.Color', RelType.COMPOSITION),
+    ]
+
+
+def test_inspect_static_documents_the_stub_only_modules():
+    domain_model = inspect_static('tests/modules/withstubs', 'tests.modules.withstubs')
+
+    # the stubs may elide the values of the enum members
+    assert domain_model.items_by_fqn['tests.modules.withstubs.colors.Color'].members == [
+        Member('RED', 'int'),
+        Member('GREEN', 2),
+        Member('BLUE', '...'),
+    ]
+
+
+def zip_folder(archive_path: Path, folder: str, archive_folder: str) -> Path:
+    with ZipFile(archive_path, 'w') as archive:
+        for file_path in sorted(Path(folder).rglob('*.py*')):
+            if '__pycache__' not in file_path.parts:
+                archive.write(file_path, f'{archive_folder}/{file_path.relative_to(folder).as_posix()}')
+    return archive_path
+
+
+def test_split_archive_path(tmp_path: Path):
+    archive_path = zip_folder(tmp_path / 'domain.pyz', 'tests/modules/withstubs', 'withstubs')
+
+    assert split_archive_path(str(archive_path)) == (archive_path, PurePosixPath('.'))
+    assert split_archive_path(str(archive_path / 'src' / 'withstubs')) == (archive_path, PurePosixPath('src/withstubs'))
+    assert split_archive_path('tests/modules/withstubs') is None
+
+
+@mark.parametrize('memory_map', [False, True])
+def test_read_archive_modules_of_an_import_root(tmp_path: Path, memory_map: bool):
+    archive_path = zip_folder(tmp_path / 'domain.whl', 'tests/modules/withstubs', 'tests/modules/withstubs')
+
+    static_modules = read_archive_modules(
+        archive_path, PurePosixPath('.'), 'tests.modules.withstubs', memory_map=memory_map
+    )
+
+    assert sorted(static_modules) == sorted(read_path_modules('tests/modules/withstubs', 'tests.modules.withstubs'))
+
+
+def test_inspect_static_reads_a_folder_of_the_archive(tmp_path: Path):
+    archive_path = zip_folder(tmp_path / 'domain.zip', 'tests/modules/withcycles', 'src/withcycles')
+
+    archive_domain_model = inspect_static(str(archive_path / 'src' / 'withcycles'), 'tests.modules.withcycles')
+
+    domain_model = inspect_static('tests/modules/withcycles', 'tests.modules.withcycles')
+    assert archive_domain_model.items_by_fqn == domain_model.items_by_fqn
+    assert archive_domain_model.relations == domain_model.relations
+
+
+def test_read_archive_modules_of_an_invalid_archive(tmp_path: Path):
+    archive_path = tmp_path / 'domain.zip'
+    archive_path.write_text('not an archive')
+
+    with raises(ValueError, match='domain.zip cannot be read: File is not a zip file'):
+        read_archive_modules(archive_path, PurePosixPath('.'), 'domain')
@@ -8,6 +8,8 @@ from pytest import mark
 
 from py2puml.parsing.astvisitors import (
     AssignedVariablesCollector,
+    CallsCollector,
+    ImportsCollector,
     SignatureArgumentsCollector,
     TypeVisitor,
     shorten_compound_type_annotation,
@@ -222,6 +224,22 @@ def test_AssignedVariablesCollector_multiple_assignments_separate_variable_from_
                 },
             },
         ),
+        (
+            # the ellipsis of a variable-length tuple is kept
+            'Tuple[domain.Person, ...]',
+            'Tuple[Person, ...]',
+            ['typing.Tuple', 'domain.Person'],
+            {
+                '__name__': 'testmodule',
+                'Tuple': Tuple,
+                'domain': {
+                    'Person': {
+                        '__module__': 'domain',
+                        '__name__': 'Person',
+                    }
+                },
+            },
+        ),
     ],
 )
 def test_shorten_compound_type_annotation(
@@ -278,3 +296,59 @@ class TestTypeVisitor(unittest.TestCase):
         actual_rtype = visitor.visit(node)
         expected_rtype = 'Point'
         self.assertEqual(expected_rtype, actual_rtype)
+
+
+@mark.parametrize(
+    ['module_name', 'is_package', 'import_source', 'expected_imported_names'],
+    [
+        ('domain.shop', False, 'import domain.cart, json', [('domain.cart', None), ('json', None)]),
+        ('domain.shop', False, 'from . import cart', [('domain', 'cart')]),
+        ('domain.shop', False, 'from .cart import Cart, Item', [('domain.cart', 'Cart'), ('domain.cart', 'Item')]),
+        ('domain.orders', True, 'from .order import Order', [('domain.orders.order', 'Order')]),
+        ('domain.orders.order', False, 'from ..cart import *', [('domain.cart', None)]),
+        ('domain.shop', False, 'def load():\n    from domain.cart import Cart', [('domain.cart', 'Cart')]),
+        # relative imports beyond the top-level package are ignored
+        ('domain.shop', False, 'from ... import cart', []),
+    ],
+)
+def test_ImportsCollector_resolves_relative_imports(
+    module_name: str, is_package: bool, import_source: str, expected_imported_names: List[Tuple[str, str]]
+):
+    imports_collector = ImportsCollector(module_name, is_package)
+    imports_collector.visit(parse(import_source))
+
+    assert imports_collector.imported_names == expected_imported_names
+
+
+def test_CallsCollector_counts_calls_by_caller_and_attribute_chain():
+    source_code = dedent(
+        '''
+        setup()
+
+        class Shop:
+            def open(self):
+                self.clean()
+                self.clean()
+                def greet():
+                    self.say('hello')
+                helpers.log.info(greet())
+
+            @staticmethod
+            def clean(shop):
+                shop.sweep()
+        '''
+    )
+    calls_collector = CallsCollector()
+    calls_collector.visit(parse(source_code))
+
+    assert calls_collector.calls_counts == {
+        ('', None, ('setup',)): 1,
+        ('Shop.open', 'Shop', ('self', 'clean')): 2,
+        # calls of nested functions are attributed to the enclosing method
+        ('Shop.open', 'Shop', ('self', 'say')): 1,
+        ('Shop.open', None, ('helpers', 'log', 'info')): 1,
+        ('Shop.open', None, ('greet',)): 1,
+        # the first argument of a static method is not the instance
+        ('Shop.clean', None, ('shop', 'sweep')): 1,
+    }
+
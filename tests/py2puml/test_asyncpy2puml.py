@@ -0,0 +1,163 @@
+from asyncio import CancelledError, create_task, run, sleep
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from time import monotonic
+from typing import List
+
+from pytest import raises
+
+from py2puml.asyncpy2puml import inspect_async, py2puml_async, render_async
+from py2puml.domain.diagnostic import DiagnosticType
+from py2puml.domain.domainfilter import DomainFilter
+from py2puml.domain.inspectionprofile import INSPECTION_PROFILES
+from py2puml.py2puml import inspect, py2puml
+
+
+async def collect_chunks(domain_path: str, domain_module: str, **kwargs) -> List[str]:
+    return [chunk async for chunk in py2puml_async(domain_path, domain_module, **kwargs)]
+
+
+def test_py2puml_async_should_document_like_py2puml():
+    expected_content = ''.join(py2puml('tests/modules/withsubdomain', 'tests.modules.withsubdomain'))
+
+    chunks = run(collect_chunks('tests/modules/withsubdomain', 'tests.modules.withsubdomain', concurrency=3))
+
+    assert ''.join(chunks) == expected_content
+
+
+def test_inspect_async_should_resolve_cross_root_relations():
+    roots_args = (
+        'tests/modules/withmultipleroots/garage',
+        'tests.modules.withmultipleroots.garage',
+        [('tests/modules/withmultipleroots/vehicles', 'tests.modules.withmultipleroots.vehicles')],
+    )
+    expected_model = inspect(*roots_args)
+
+    domain_model = run(inspect_async(*roots_args, concurrency=2))
+
+    assert list(domain_model.items_by_fqn.keys()) == list(expected_model.items_by_fqn.keys())
+    assert domain_model.relations == expected_model.relations
+
+
+def test_py2puml_async_in_a_thread_pool_should_document_like_py2puml():
+    expected_content = ''.join(py2puml('tests/modules/withsubdomain', 'tests.modules.withsubdomain'))
+
+    with ThreadPoolExecutor(3) as executor:
+        chunks = run(
+            collect_chunks(
+                'tests/modules/withsubdomain', 'tests.modules.withsubdomain', concurrency=3, executor=executor
+            )
+        )
+
+    assert ''.join(chunks) == expected_content
+
+
+def test_inspect_async_should_apply_the_domain_filter_and_the_profile():
+    structure_profile = INSPECTION_PROFILES['structure']
+    domain_filter = DomainFilter(exclude_modules=('tests.modules.withfaultymodules.*ing',))
+    expected_model = inspect(
+        'tests/modules/withfaultymodules',
+        'tests.modules.withfaultymodules',
+        domain_filter=domain_filter,
+        inspection_profile=structure_profile,
+    )
+
+    domain_model = run(
+        inspect_async(
+            'tests/modules/withfaultymodules',
+            'tests.modules.withfaultymodules',
+            domain_filter=domain_filter,
+            inspection_profile=structure_profile,
+        )
+    )
+
+    assert domain_model == expected_model
+
+
+def test_inspect_async_should_report_the_failing_modules_in_the_diagnostics():
+    domain_filter = DomainFilter(
+        exclude_modules=('tests.modules.withfaultymodules.crashing', 'tests.modules.withfaultymodules.hanging')
+    )
+
+    diagnostics = []
+    content = ''.join(
+        run(
+            collect_chunks(
+                'tests/modules/withfaultymodules',
+                'tests.modules.withfaultymodules',
+                concurrency=2,
+                diagnostics=diagnostics,
+                domain_filter=domain_filter,
+            )
+        )
+    )
+
+    assert [(diagnostic.module_name, diagnostic.type) for diagnostic in diagnostics] == [
+        ('tests.modules.withfaultymodules.failing', DiagnosticType.ERROR)
+    ]
+    assert 'RuntimeError: missing configuration' in diagnostics[0].message
+    assert 'tests.modules.withfaultymodules.healthy' in content
+
+
+def test_render_async_should_stream_chunks():
+    domain_model = inspect('tests/modules/withsubdomain', 'tests.modules.withsubdomain')
+
+    async def collect_rendered_chunks() -> List[str]:
+        return [chunk async for chunk in render_async(domain_model, chunk_size=100)]
+
+    chunks = run(collect_rendered_chunks())
+
+    assert len(chunks) > 1
+    assert ''.join(chunks) == ''.join(py2puml('tests/modules/withsubdomain', 'tests.modules.withsubdomain'))
+
+
+def test_inspect_async_can_be_cancelled():
+    async def cancel_inspection():
+        inspection_task = create_task(inspect_async('tests/modules/withsubdomain', 'tests.modules.withsubdomain'))
+        await sleep(0)
+        inspection_task.cancel()
+        await inspection_task
+
+    with raises(CancelledError):
+        run(cancel_inspection())
+
+
+def test_inspect_async_should_report_only_the_crashing_module():
+    domain_filter = DomainFilter(exclude_modules=('tests.modules.withfaultymodules.hanging',))
+
+    domain_model = run(
+        inspect_async(
+            'tests/modules/withfaultymodules',
+            'tests.modules.withfaultymodules',
+            concurrency=3,
+            domain_filter=domain_filter,
+        )
+    )
+
+    assert sorted((diagnostic.module_name, diagnostic.type) for diagnostic in domain_model.diagnostics) == [
+        ('tests.modules.withfaultymodules.crashing', DiagnosticType.CRASH),
+        ('tests.modules.withfaultymodules.failing', DiagnosticType.ERROR),
+    ]
+    assert 'tests.modules.withfaultymodules.healthy.Sensor' in domain_model.items_by_fqn
+
+
+def test_inspect_async_cancelled_during_a_hanging_import_should_not_block_the_event_loop():
+    domain_filter = DomainFilter(include_modules=('tests.modules.withfaultymodules.hanging',))
+
+    async def cancel_hanging_inspection() -> float:
+        inspection_task = create_task(
+            inspect_async(
+                'tests/modules/withfaultymodules', 'tests.modules.withfaultymodules', domain_filter=domain_filter
+            )
+        )
+        # lets the worker process start importing the hanging module
+        await sleep(1)
+        inspection_task.cancel()
+        sleep_start = monotonic()
+        await sleep(0.1)
+        sleep_duration = monotonic() - sleep_start
+        with suppress(CancelledError):
+            await inspection_task
+        return sleep_duration
+
+    assert run(cancel_hanging_inspection()) < 1
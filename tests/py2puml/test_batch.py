@@ -0,0 +1,211 @@
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from pytest import mark, raises
+
+from py2puml.batch import (
+    BatchConfiguration,
+    diagram_domain_model,
+    diagrams_domain_filter,
+    inspect_diagrams_domain,
+    load_toml,
+    parse_batch_configuration,
+    read_batch_configuration,
+    render_diagrams,
+)
+from py2puml.domain.domainfilter import DomainFilter
+from py2puml.export.puml import to_puml_diagram
+from py2puml.py2puml import inspect, split_by_roots
+
+MULTIPLE_ROOTS_TABLE = {
+    'diagrams': [
+        {
+            'name': 'garage',
+            'path': 'tests/modules/withmultipleroots/garage',
+            'module': 'tests.modules.withmultipleroots.garage',
+            'roots': [['tests/modules/withmultipleroots/vehicles', 'tests.modules.withmultipleroots.vehicles']],
+            'output': 'garage.puml',
+        },
+        {
+            'name': 'vehicles',
+            'path': 'tests/modules/withmultipleroots/vehicles',
+            'module': 'tests.modules.withmultipleroots.vehicles',
+            'output': 'vehicles.puml',
+        },
+    ]
+}
+
+
+def test_parse_batch_configuration():
+    batch_configuration = parse_batch_configuration(MULTIPLE_ROOTS_TABLE, Path('.'))
+
+    garage_diagram, vehicles_diagram = batch_configuration.diagrams
+    assert garage_diagram.output == Path('garage.puml')
+    assert garage_diagram.domain_roots == [
+        ('tests/modules/withmultipleroots/garage', 'tests.modules.withmultipleroots.garage'),
+        ('tests/modules/withmultipleroots/vehicles', 'tests.modules.withmultipleroots.vehicles'),
+    ]
+    assert vehicles_diagram.format == 'puml'
+
+
+@mark.parametrize(
+    ['py2puml_table', 'error_message'],
+    [
+        ({}, 'no diagram is declared'),
+        ({'diagrams': [{'path': 'domain', 'output': 'domain.puml'}]}, 'diagram 1 misses the module key'),
+        (
+            {'diagrams': [{'path': 'domain', 'module': 'domain', 'output': 'domain.svg', 'format': 'svg'}]},
+            'diagram 1 has an unsupported format: svg',
+        ),
+    ],
+)
+def test_parse_batch_configuration_errors(py2puml_table, error_message: str):
+    with raises(ValueError, match=error_message):
+        parse_batch_configuration(py2puml_table, Path('.'))
+
+
+def test_render_diagrams_from_a_single_inspection(tmp_path: Path):
+    batch_configuration = parse_batch_configuration(MULTIPLE_ROOTS_TABLE, Path('.'))
+    for diagram in batch_configuration.diagrams:
+        diagram.output = tmp_path / diagram.output
+
+    domain_model = inspect_diagrams_domain(batch_configuration)
+    assert render_diagrams(domain_model, batch_configuration.diagrams) == []
+
+    # the garage diagram documents both roots, the vehicles diagram its root only
+    multiple_roots_model = inspect(
+        'tests/modules/withmultipleroots/garage',
+        'tests.modules.withmultipleroots.garage',
+        [('tests/modules/withmultipleroots/vehicles', 'tests.modules.withmultipleroots.vehicles')],
+    )
+    assert (tmp_path / 'garage.puml').read_text() == ''.join(
+        to_puml_diagram(multiple_roots_model.filtered(lambda fqn: True, 'garage'))
+    ) + '\n'
+    (vehicles_model,) = split_by_roots(multiple_roots_model, ['tests.modules.withmultipleroots.vehicles'])
+    assert (tmp_path / 'vehicles.puml').read_text() == ''.join(
+        to_puml_diagram(vehicles_model.filtered(lambda fqn: True, 'vehicles'))
+    ) + '\n'
+    assert render_diagrams(domain_model, batch_configuration.diagrams, check=True) == []
+
+    (tmp_path / 'vehicles.puml').write_text('@startuml\n@enduml\n')
+    assert render_diagrams(domain_model, batch_configuration.diagrams, check=True) == [batch_configuration.diagrams[1]]
+
+
+def test_diagram_domain_model_with_module_and_definition_patterns():
+    batch_configuration: BatchConfiguration = parse_batch_configuration(
+        {
+            'diagrams': [
+                {
+                    'path': 'tests/modules/withnestednamespace',
+                    'module': 'tests.modules.withnestednamespace',
+                    'exclude': ['tests.modules.withnestednamespace.branches'],
+                    'focus': ['*.Oak*'],
+                    'output': 'oaks.puml',
+                }
+            ]
+        },
+        Path('.'),
+    )
+    domain_model = inspect_diagrams_domain(batch_configuration)
+
+    diagram_model = diagram_domain_model(domain_model, batch_configuration.diagrams[0])
+
+    assert list(diagram_model.items_by_fqn.keys()) == [
+        'tests.modules.withnestednamespace.nomoduleroot.modulechild.leaf.OakLeaf',
+        'tests.modules.withnestednamespace.tree.Oak',
+    ]
+    # the relations towards the excluded branches and the unfocused trunk are removed
+    assert diagram_model.relations == ()
+
+
+NESTED_NAMESPACE_DIAGRAM = {
+    'path': 'tests/modules/withnestednamespace',
+    'module': 'tests.modules.withnestednamespace',
+    'output': 'nested.puml',
+}
+
+
+@mark.parametrize(
+    ['diagram_tables', 'expected_domain_filter'],
+    [
+        ([NESTED_NAMESPACE_DIAGRAM, NESTED_NAMESPACE_DIAGRAM], None),
+        (
+            [
+                {**NESTED_NAMESPACE_DIAGRAM, 'include': ['*.tree'], 'exclude': ['*.branches', '*.trunks']},
+                {**NESTED_NAMESPACE_DIAGRAM, 'include': ['*.nomoduleroot', '*.tree'], 'exclude': ['*.trunks']},
+            ],
+            DomainFilter(include_modules=('*.tree', '*.nomoduleroot'), exclude_modules=('*.trunks',)),
+        ),
+        (
+            [
+                {**NESTED_NAMESPACE_DIAGRAM, 'include': ['*.tree'], 'focus': ['*.Oak']},
+                {**NESTED_NAMESPACE_DIAGRAM, 'exclude': ['*.branches']},
+            ],
+            None,
+        ),
+        (
+            [
+                {**NESTED_NAMESPACE_DIAGRAM, 'focus': ['*.Oak']},
+                {**NESTED_NAMESPACE_DIAGRAM, 'focus': ['*.Oak*', '*.Tree']},
+            ],
+            DomainFilter(include_definitions=('*.Oak', '*.Oak*', '*.Tree')),
+        ),
+    ],
+)
+def test_diagrams_domain_filter_selects_what_at_least_one_diagram_documents(
+    diagram_tables: List[Dict[str, Any]], expected_domain_filter: Optional[DomainFilter]
+):
+    batch_configuration = parse_batch_configuration({'diagrams': diagram_tables}, Path('.'))
+
+    assert diagrams_domain_filter(batch_configuration.diagrams) == expected_domain_filter
+
+
+def test_inspect_diagrams_domain_skips_the_modules_of_no_diagram():
+    batch_configuration = parse_batch_configuration(
+        {
+            'diagrams': [
+                {**NESTED_NAMESPACE_DIAGRAM, 'exclude': ['*.branches', '*.withonlyonesubpackage']},
+                {**NESTED_NAMESPACE_DIAGRAM, 'exclude': ['*.branches', '*.trunks']},
+            ]
+        },
+        Path('.'),
+    )
+
+    domain_model = inspect_diagrams_domain(batch_configuration)
+
+    assert 'tests.modules.withnestednamespace.branches.branch.OakBranch' not in domain_model.items_by_fqn
+    assert 'tests.modules.withnestednamespace.trunks.trunk.Trunk' in domain_model.items_by_fqn
+    assert 'tests.modules.withnestednamespace.withonlyonesubpackage.underground.Soil' in domain_model.items_by_fqn
+    # the relation towards the branch, which was not inspected, is not documented
+    assert [
+        (uml_relation.source_fqn, uml_relation.target_fqn)
+        for uml_relation in diagram_domain_model(domain_model, batch_configuration.diagrams[0]).relations
+        if uml_relation.source_fqn == 'tests.modules.withnestednamespace.tree.Oak'
+    ] == [('tests.modules.withnestednamespace.tree.Oak', 'tests.modules.withnestednamespace.trunks.trunk.Trunk')]
+
+
+@mark.skipif(load_toml is None, reason='reading TOML files requires Python 3.11+ or tomli')
+def test_read_batch_configuration(tmp_path: Path):
+    pyproject_path = tmp_path / 'pyproject.toml'
+    pyproject_path.write_text(
+        """
+[tool.py2puml]
+workers = 2
+
+[[tool.py2puml.diagrams]]
+path = "domain"
+module = "domain"
+output = "docs/domain.puml"
+"""
+    )
+
+    batch_configuration = read_batch_configuration(pyproject_path)
+
+    assert batch_configuration.workers == 2
+    assert batch_configuration.diagrams[0].output == tmp_path / 'docs' / 'domain.puml'
+
+
+@mark.skipif(load_toml is not None, reason='a TOML parser is available')
+def test_read_batch_configuration_without_toml_parser(tmp_path: Path):
+    with raises(ValueError, match='requires Python 3.11\\+ or the tomli package'):
+        read_batch_configuration(tmp_path / 'pyproject.toml')
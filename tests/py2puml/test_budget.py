@@ -0,0 +1,44 @@
+from py2puml.budget import inspect_within_budget, prioritize_definitions
+from py2puml.domain.umlclass import UmlClass
+from py2puml.domain.umlrelation import RelType, UmlRelation
+from py2puml.export.puml import to_puml_diagram
+from py2puml.query import DomainQuery
+
+GARAGE_MODULE = 'tests.modules.withprofiles.garage'
+
+
+def test_prioritize_definitions_by_number_of_subclasses():
+    box_relations = [
+        UmlRelation('domain.Vehicle', 'domain.Car', RelType.INHERITANCE),
+        UmlRelation('domain.Vehicle', 'domain.Bike', RelType.INHERITANCE),
+        UmlRelation('domain.Car', 'domain.SportsCar', RelType.INHERITANCE),
+        UmlRelation('domain.Bike', 'domain.Wheel', RelType.COMPOSITION),
+    ]
+
+    assert prioritize_definitions(
+        ['domain.Wheel', 'domain.Bike', 'domain.Car', 'domain.SportsCar', 'domain.Vehicle'], box_relations
+    ) == ['domain.Vehicle', 'domain.Car', 'domain.Wheel', 'domain.Bike', 'domain.SportsCar']
+
+
+def test_inspect_within_an_exhausted_budget_documents_the_boxes():
+    domain_model = inspect_within_budget('tests/modules/withprofiles', 'tests.modules.withprofiles', 0)
+
+    assert domain_model.incomplete_fqns == frozenset(domain_model.items_by_fqn.keys())
+    car: UmlClass = domain_model.items_by_fqn[f'{GARAGE_MODULE}.Car']
+    assert car.attributes == [] and car.methods == []
+    assert [(uml_relation.source_fqn, uml_relation.type) for uml_relation in domain_model.relations] == [
+        (f'{GARAGE_MODULE}.Car', RelType.INHERITANCE)
+    ]
+
+    puml_content = ''.join(to_puml_diagram(domain_model))
+    assert f'class {GARAGE_MODULE}.Car <<incomplete>> {{' in puml_content
+    assert f'annotation {GARAGE_MODULE}.Methods <<incomplete>> {{' in puml_content
+    assert '<<incomplete>>: partially inspected within the time budget' in puml_content
+
+
+def test_inspect_within_a_sufficient_budget_documents_the_whole_domain():
+    domain_model = inspect_within_budget('tests/modules/withprofiles', 'tests.modules.withprofiles', 60)
+
+    assert domain_model.incomplete_fqns == frozenset()
+    assert domain_model == DomainQuery('tests/modules/withprofiles', 'tests.modules.withprofiles').model()
+    assert '<<incomplete>>' not in ''.join(to_puml_diagram(domain_model))
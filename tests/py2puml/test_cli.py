@@ -1,6 +1,8 @@
 from io import StringIO
+from pathlib import Path
 from subprocess import PIPE, run
 from typing import List
+from zipfile import ZipFile
 
 from pytest import mark
 
@@ -54,3 +56,66 @@ def test_cli_help(help_command: List[str]):
     help_text = run(command, stdout=PIPE, stderr=PIPE, text=True, check=True).stdout.replace('\n', ' ')
 
     assert __description__ in help_text
+
+
+def test_cli_with_additional_root():
+    command = [
+        'py2puml',
+        'tests/modules/withmultipleroots/garage',
+        'tests.modules.withmultipleroots.garage',
+        '--root',
+        'tests/modules/withmultipleroots/vehicles',
+        'tests.modules.withmultipleroots.vehicles',
+    ]
+    cli_stdout = run(command, stdout=PIPE, stderr=PIPE, text=True, check=True).stdout
+
+    puml_content = py2puml(
+        'tests/modules/withmultipleroots/garage',
+        'tests.modules.withmultipleroots.garage',
+        [('tests/modules/withmultipleroots/vehicles', 'tests.modules.withmultipleroots.vehicles')],
+    )
+
+    assert ''.join(puml_content).strip() == cli_stdout.strip()
+
+
+def test_cli_on_a_git_revision():
+    command = ['py2puml', 'tests/modules/withcycles', 'tests.modules.withcycles', '--revision', 'HEAD']
+    cli_stdout = run(command, stdout=PIPE, stderr=PIPE, text=True, check=True).stdout
+
+    puml_content = py2puml('tests/modules/withcycles', 'tests.modules.withcycles')
+
+    assert ''.join(puml_content).strip() == cli_stdout.strip()
+
+
+def test_cli_on_a_wheel(tmp_path):
+    wheel_path = tmp_path / 'withcycles-1.0-py3-none-any.whl'
+    with ZipFile(wheel_path, 'w') as wheel:
+        for module_path in sorted(Path('tests/modules/withcycles').rglob('*.py')):
+            wheel.write(module_path, module_path.as_posix())
+    command = ['py2puml', str(wheel_path), 'tests.modules.withcycles']
+    cli_stdout = run(command, stdout=PIPE, stderr=PIPE, text=True, check=True).stdout
+
+    puml_content = py2puml('tests/modules/withcycles', 'tests.modules.withcycles')
+
+    assert ''.join(puml_content).strip() == cli_stdout.strip()
+
+
+def test_cli_check_of_the_output_file(tmp_path):
+    output_path = tmp_path / 'withcycles.puml'
+    command = ['py2puml', 'tests/modules/withcycles', 'tests.modules.withcycles', '--output', str(output_path)]
+    run(command, stdout=PIPE, stderr=PIPE, text=True, check=True)
+
+    assert run(command + ['--check'], stdout=PIPE, stderr=PIPE, text=True).returncode == 0
+
+    output_path.write_text('@startuml\n@enduml\n', encoding='utf8')
+    check_process = run(command + ['--check'], stdout=PIPE, stderr=PIPE, text=True)
+    assert check_process.returncode == 1
+    assert check_process.stderr == f'py2puml: {output_path} is not up-to-date\n'
+
+
+def test_cli_with_an_exhausted_time_budget():
+    command = ['py2puml', 'tests/modules/withprofiles', 'tests.modules.withprofiles', '--time-budget', '0']
+    cli_process = run(command, stdout=PIPE, stderr=PIPE, text=True, check=True)
+
+    assert 'class tests.modules.withprofiles.garage.Car <<incomplete>> {' in cli_process.stdout
+    assert 'py2puml: 5 definitions were partially inspected within the time budget' in cli_process.stderr
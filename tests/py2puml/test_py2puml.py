@@ -1,7 +1,13 @@
 from io import StringIO
 from pathlib import Path
 
-from py2puml.asserts import assert_py2puml_is_file_content, assert_py2puml_is_stringio
+from py2puml.asserts import (
+    assert_multilines,
+    assert_py2puml_is_file_content,
+    assert_py2puml_is_stringio,
+    normalize_lines_with_returns,
+)
+from py2puml.py2puml import py2puml
 
 from tests import TESTS_PATH
 
@@ -66,3 +72,57 @@ def test_py2puml_with_methods():
         'tests.modules.withmethods',
         with_methods_diagram_file_path,
     )
+
+
+def test_py2puml_with_multiple_roots():
+    """
+    Roots inspected in the same session share their definitions: the relations between them are resolved
+    """
+    expected = """@startuml tests.modules.withmultipleroots.garage
+!pragma useIntermediatePackages false
+
+class tests.modules.withmultipleroots.garage.parking.ParkingSpot {
+  number: int
+  car: Car
+}
+class tests.modules.withmultipleroots.vehicles.car.Car {
+  plate: str
+}
+tests.modules.withmultipleroots.garage.parking.ParkingSpot *-- tests.modules.withmultipleroots.vehicles.car.Car
+footer Generated by //py2puml//
+@enduml
+"""
+    puml_content = py2puml(
+        'tests/modules/withmultipleroots/garage',
+        'tests.modules.withmultipleroots.garage',
+        [('tests/modules/withmultipleroots/vehicles', 'tests.modules.withmultipleroots.vehicles')],
+    )
+
+    assert_multilines(normalize_lines_with_returns(puml_content), normalize_lines_with_returns(StringIO(expected)))
+
+
+def test_py2puml_with_multiple_roots_split_by_root():
+    """
+    Each root is documented in its own diagram, cross-root relations being documented in both diagrams
+    """
+    puml_content = ''.join(
+        py2puml(
+            'tests/modules/withmultipleroots/garage',
+            'tests.modules.withmultipleroots.garage',
+            [('tests/modules/withmultipleroots/vehicles', 'tests.modules.withmultipleroots.vehicles')],
+            split_by_root=True,
+        )
+    )
+
+    garage_diagram, vehicles_diagram = puml_content.split('@enduml\n')[:2]
+    assert garage_diagram.startswith('@startuml tests.modules.withmultipleroots.garage\n')
+    assert 'class tests.modules.withmultipleroots.garage.parking.ParkingSpot {' in garage_diagram
+    assert 'class tests.modules.withmultipleroots.vehicles.car.Car {' not in garage_diagram
+
+    assert vehicles_diagram.startswith('@startuml tests.modules.withmultipleroots.vehicles\n')
+    assert 'class tests.modules.withmultipleroots.vehicles.car.Car {' in vehicles_diagram
+    assert 'class tests.modules.withmultipleroots.garage.parking.ParkingSpot {' not in vehicles_diagram
+
+    cross_root_relation = 'tests.modules.withmultipleroots.garage.parking.ParkingSpot *-- tests.modules.withmultipleroots.vehicles.car.Car'
+    assert cross_root_relation in garage_diagram
+    assert cross_root_relation in vehicles_diagram
@@ -0,0 +1,80 @@
+from py2puml.domain.inspectionprofile import INSPECTION_PROFILES
+from py2puml.domain.umlclass import UmlClass
+from py2puml.domain.umlrelation import RelType
+from py2puml.py2puml import inspect
+from py2puml.query import DomainQuery
+
+
+def test_domain_query_discovery_registers_stubs_only():
+    domain_query = DomainQuery('tests/modules/withsubdomain', 'tests.modules.withsubdomain')
+
+    assert list(domain_query.stubs_by_fqn.keys()) == [
+        'tests.modules.withsubdomain.subdomain.insubdomain.Engine',
+        'tests.modules.withsubdomain.subdomain.insubdomain.Pilot',
+        'tests.modules.withsubdomain.subdomain.insubdomain.horsepower_to_kilowatt',
+        'tests.modules.withsubdomain.withsubdomain.Car',
+    ]
+    function_stub = domain_query.stubs_by_fqn[
+        'tests.modules.withsubdomain.subdomain.insubdomain.horsepower_to_kilowatt'
+    ]
+    assert function_stub.module == 'tests.modules.withsubdomain.subdomain.insubdomain'
+    assert function_stub.source_path.endswith('tests/modules/withsubdomain/subdomain/insubdomain.py')
+    assert function_stub.line_number == 5
+    assert domain_query.items_by_fqn == {}
+
+
+def test_domain_query_find_and_inspect_on_demand():
+    domain_query = DomainQuery('tests/modules/withsubdomain', 'tests.modules.withsubdomain')
+
+    car_stubs = domain_query.find('*.Car')
+    assert [stub.fqn for stub in car_stubs] == ['tests.modules.withsubdomain.withsubdomain.Car']
+
+    car_item: UmlClass = domain_query.item('tests.modules.withsubdomain.withsubdomain.Car')
+    assert [attribute.name for attribute in car_item.attributes] == ['name', 'engine']
+    # memoised inspection, only the queried definition was inspected
+    assert domain_query.item('tests.modules.withsubdomain.withsubdomain.Car') is car_item
+    assert list(domain_query.items_by_fqn.keys()) == ['tests.modules.withsubdomain.withsubdomain.Car']
+
+    car_relations = domain_query.relations('tests.modules.withsubdomain.withsubdomain.Car')
+    assert [(relation.target_fqn, relation.type) for relation in car_relations] == [
+        ('tests.modules.withsubdomain.subdomain.insubdomain.Engine', RelType.COMPOSITION)
+    ]
+
+
+def test_domain_query_focused_model_keeps_relations_between_documented_definitions():
+    domain_query = DomainQuery('tests/modules/withsubdomain', 'tests.modules.withsubdomain')
+
+    car_only_model = domain_query.model(['tests.modules.withsubdomain.withsubdomain.Car'])
+    assert list(car_only_model.items_by_fqn.keys()) == ['tests.modules.withsubdomain.withsubdomain.Car']
+    assert car_only_model.relations == ()
+
+    car_and_engine_model = domain_query.model(
+        ['tests.modules.withsubdomain.withsubdomain.Car', 'tests.modules.withsubdomain.subdomain.insubdomain.Engine']
+    )
+    assert len(car_and_engine_model.relations) == 1
+    assert 'tests.modules.withsubdomain.subdomain.insubdomain.Pilot' not in domain_query.items_by_fqn
+
+
+def test_domain_query_full_model_matches_eager_inspection():
+    domain_query = DomainQuery('tests/modules/withsubdomain', 'tests.modules.withsubdomain')
+    eager_model = inspect('tests/modules/withsubdomain', 'tests.modules.withsubdomain')
+
+    lazy_model = domain_query.model()
+
+    assert lazy_model.items_by_fqn == eager_model.items_by_fqn
+    assert set(lazy_model.relations) == set(eager_model.relations)
+    assert [uml_module.functions for uml_module in lazy_model.modules_by_name.values()] == [
+        uml_module.functions for uml_module in eager_model.modules_by_name.values() if uml_module.functions
+    ]
+
+
+def test_domain_query_with_an_inspection_profile():
+    domain_query = DomainQuery(
+        'tests/modules/withprofiles', 'tests.modules.withprofiles', inspection_profile=INSPECTION_PROFILES['methods']
+    )
+
+    # the functions are documented by the methods profile, but their dependencies are not linked
+    assert 'tests.modules.withprofiles.garage.build_car' in domain_query.stubs_by_fqn
+    mechanic_fqn = 'tests.modules.withprofiles.garage.Mechanic'
+    assert [method.name for method in domain_query.item(mechanic_fqn).methods] == ['repair']
+    assert domain_query.relations(mechanic_fqn) == []